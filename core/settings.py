@@ -38,7 +38,6 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
-    'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
@@ -81,6 +80,121 @@ DATABASES = {
     }
 }
 
+# Result cache for generate_logbook. The shared tier lets every gunicorn
+# worker on a host reuse each other's rendered logbooks.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "logbook-results": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ.get("LOGBOOK_CACHE_DIR", "/tmp/fleet-cycle-atlas/logbook-results"),
+        "TIMEOUT": 3600,
+        "OPTIONS": {"MAX_ENTRIES": 5000},
+    },
+}
+
+LOGBOOK_RESULT_CACHE = {
+    "ENABLED": os.environ.get("LOGBOOK_CACHE_ENABLED", "1") == "1",
+    "MAX_ENTRIES": 512,              # Per-process LRU bound
+    "MAX_BYTES": 64 * 1024 * 1024,   # Per-process LRU bound
+    "TTL": 3600,                     # Seconds; None keeps entries until evicted
+    "SHARED_ALIAS": "logbook-results",
+}
+
+# Batch logbook generation (POST /api/logs/generate_logbook_batch/)
+LOGBOOK_BATCH = {
+    "MAX_TRIPS": int(os.environ.get("LOGBOOK_BATCH_MAX_TRIPS", 1000)),
+    "MAX_WORKERS": int(os.environ.get("LOGBOOK_BATCH_WORKERS", os.cpu_count() or 1)),
+    # Batches smaller than this are planned in-process
+    "SERIAL_THRESHOLD": int(os.environ.get("LOGBOOK_BATCH_SERIAL_THRESHOLD", 16)),
+}
+
+# Size limits of one dispatch_trips request
+LOGBOOK_DISPATCH = {
+    "MAX_DRIVERS": int(os.environ.get("LOGBOOK_DISPATCH_MAX_DRIVERS", 1000)),
+    "MAX_TRIPS": int(os.environ.get("LOGBOOK_DISPATCH_MAX_TRIPS", 10000)),
+}
+
+# Executor behind the async generate_logbook_async endpoint ("thread" or "process")
+LOGBOOK_ASYNC = {
+    "EXECUTOR": os.environ.get("LOGBOOK_ASYNC_EXECUTOR", "thread"),
+    "MAX_WORKERS": int(os.environ.get("LOGBOOK_ASYNC_WORKERS", os.cpu_count() or 1)),
+    # Requests beyond this many queued or running simulations get a 503
+    "MAX_PENDING": int(os.environ.get("LOGBOOK_ASYNC_MAX_PENDING", 64)),
+    "RETRY_AFTER": int(os.environ.get("LOGBOOK_ASYNC_RETRY_AFTER", 1)),
+}
+
+# Monte Carlo risk analysis (POST /api/logs/risk_analysis/)
+LOGBOOK_RISK = {
+    "DEFAULT_RUNS": int(os.environ.get("LOGBOOK_RISK_RUNS", 10000)),
+    "MAX_RUNS": int(os.environ.get("LOGBOOK_RISK_MAX_RUNS", 50000)),
+    # Runs simulated together in one set of arrays
+    "BATCH_SIZE": int(os.environ.get("LOGBOOK_RISK_BATCH_SIZE", 2000)),
+    "SEED": int(os.environ.get("LOGBOOK_RISK_SEED", 0)),
+    # Default distributions; a request may replace any of them
+    "DISTRIBUTIONS": {
+        # Multiplier on the planned average speed, per drive leg
+        "speed": {"kind": "normal", "mean": 1.0, "sd": 0.1, "min": 0.5, "max": 1.25},
+        # Hours at the pickup (planned as PICKUP_DURATION)
+        "pickup_dwell": {"kind": "lognormal", "mean": 0.75, "sd": 0.5},
+        # Hours per refuel stop (planned as REFUEL_DURATION)
+        "refuel": {"kind": "triangular", "low": 0.25, "mode": 0.5, "high": 1.0},
+    },
+}
+
+# Departure-time search (POST /api/logs/departure_search/)
+LOGBOOK_DEPARTURE = {
+    "STEP_MINUTES": int(os.environ.get("LOGBOOK_DEPARTURE_STEP_MINUTES", 15)),
+    "MAX_PICKUP_TIMES": int(os.environ.get("LOGBOOK_DEPARTURE_MAX_PICKUP_TIMES", 16)),
+    # Ranked alternatives returned after the best option
+    "ALTERNATIVES": int(os.environ.get("LOGBOOK_DEPARTURE_ALTERNATIVES", 10)),
+    # Trips that may take restarts need a simulation per candidate; this
+    # many or more go to the batch process pool
+    "PARALLEL_THRESHOLD": int(os.environ.get("LOGBOOK_DEPARTURE_PARALLEL_THRESHOLD", 256)),
+}
+
+# Write-behind audit of generation requests into LogbookTrip
+LOGBOOK_AUDIT = {
+    "ENABLED": os.environ.get("LOGBOOK_AUDIT_ENABLED", "1") == "1",
+    # Records beyond this many waiting to be written are dropped and counted
+    "MAX_QUEUE": int(os.environ.get("LOGBOOK_AUDIT_MAX_QUEUE", 10000)),
+    "BATCH_SIZE": int(os.environ.get("LOGBOOK_AUDIT_BATCH_SIZE", 500)),
+    "FLUSH_INTERVAL": float(os.environ.get("LOGBOOK_AUDIT_FLUSH_INTERVAL", 1.0)),
+}
+
+# Listing and exporting saved trips (GET /api/logs/, /api/logs/export/)
+LOGBOOK_TRIP_LIST = {
+    "PAGE_SIZE": int(os.environ.get("LOGBOOK_TRIP_PAGE_SIZE", 100)),
+    "MAX_PAGE_SIZE": int(os.environ.get("LOGBOOK_TRIP_MAX_PAGE_SIZE", 1000)),
+    # Rows fetched per round trip while streaming an export
+    "EXPORT_CHUNK_SIZE": int(os.environ.get("LOGBOOK_TRIP_EXPORT_CHUNK_SIZE", 2000)),
+}
+
+# Bulk trip import (POST /api/logs/bulk_import/, manage.py import_trips)
+LOGBOOK_TRIP_IMPORT = {
+    # Valid rows written per COPY / bulk_create transaction
+    "CHUNK_SIZE": int(os.environ.get("LOGBOOK_TRIP_IMPORT_CHUNK_SIZE", 10000)),
+    # Rejected rows listed in the report; all of them are counted
+    "MAX_ERRORS": int(os.environ.get("LOGBOOK_TRIP_IMPORT_MAX_ERRORS", 1000)),
+}
+
+# Per-driver cycle ledgers (driver_id on generate_logbook). Off in
+# core.settings_compute, which runs without a database.
+LOGBOOK_DRIVER_LEDGER = True
+
+# Server-Timing header and Prometheus metrics at /metrics
+LOGBOOK_METRICS = {
+    "ENABLED": os.environ.get("LOGBOOK_METRICS_ENABLED", "1") == "1",
+}
+
+# HOS benchmark suite (manage.py benchmark_hos / HOS_BENCHMARK=1 pytest)
+HOS_BENCHMARK = {
+    "BASELINE_PATH": BASE_DIR / "benchmarks" / "hos_baseline.json",
+    # Allowed slowdown / allocation growth over the baseline before failing
+    "REGRESSION_BUDGET": float(os.environ.get("HOS_BENCHMARK_BUDGET", 0.25)),
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
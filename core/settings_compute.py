@@ -0,0 +1,53 @@
+"""
+Compute-only profile: serves the HOS planning endpoints and nothing else.
+
+No database, admin, sessions, auth or messages, and a two-entry middleware
+chain. Driver ledgers and saved trips need the full ``core.settings``.
+Serve it with ``gunicorn --preload core.wsgi_compute``.
+"""
+
+import os
+
+from .settings import *  # noqa: F401,F403
+
+INSTALLED_APPS = [
+    "corsheaders",
+    "logs",
+]
+
+MIDDLEWARE = [
+    "corsheaders.middleware.CorsMiddleware",
+    "django.middleware.common.CommonMiddleware",
+]
+
+ROOT_URLCONF = "core.urls_compute"
+
+WSGI_APPLICATION = "core.wsgi_compute.application"
+
+TEMPLATES = []
+
+# Django falls back to its dummy backend, which raises if anything queries
+DATABASES = {}
+
+AUTH_PASSWORD_VALIDATORS = []
+
+# No translation catalogs to load at startup
+USE_I18N = False
+
+REST_FRAMEWORK = {
+    "DEFAULT_AUTHENTICATION_CLASSES": [],
+    "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.AllowAny"],
+    "DEFAULT_RENDERER_CLASSES": ["rest_framework.renderers.JSONRenderer"],
+    # The default AnonymousUser would need django.contrib.auth
+    "UNAUTHENTICATED_USER": None,
+}
+
+LOGBOOK_DRIVER_LEDGER = False
+
+LOGBOOK_AUDIT = {**LOGBOOK_AUDIT, "ENABLED": False}  # noqa: F405
+
+LOGBOOK_COMPUTE = {
+    # Resolve URLs and plan one trip while loading, i.e. once in the
+    # gunicorn master under --preload instead of in every worker
+    "WARMUP": os.environ.get("LOGBOOK_WARMUP", "1") == "1",
+}
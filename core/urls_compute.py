@@ -0,0 +1,37 @@
+from django.urls import path
+
+from logs.async_views import generate_logbook_async
+from logs.views import LogEntryViewSet, metrics
+
+# Same paths as core.urls, limited to the endpoints that need no database
+urlpatterns = [
+    path(
+        'api/logs/generate_logbook/',
+        LogEntryViewSet.as_view({'post': 'generate_logbook'}),
+        name='logbook-trip-generate-logbook',
+    ),
+    path('api/logs/generate_logbook_async/', generate_logbook_async, name='generate-logbook-async'),
+    path(
+        'api/logs/generate_logbook_batch/',
+        LogEntryViewSet.as_view({'post': 'generate_logbook_batch'}),
+        name='logbook-trip-generate-logbook-batch',
+    ),
+    path(
+        'api/logs/dispatch_trips/',
+        LogEntryViewSet.as_view({'post': 'dispatch_trips'}),
+        name='logbook-trip-dispatch-trips',
+    ),
+    path(
+        'api/logs/risk_analysis/',
+        LogEntryViewSet.as_view({'post': 'risk_analysis'}),
+        name='logbook-trip-risk-analysis',
+    ),
+    path(
+        'api/logs/departure_search/',
+        LogEntryViewSet.as_view({'post': 'departure_search'}),
+        name='logbook-trip-departure-search',
+    ),
+    path('api/logs/max_trip/', LogEntryViewSet.as_view({'get': 'max_trip'}), name='logbook-trip-max-trip'),
+    path('api/logs/cache_stats/', LogEntryViewSet.as_view({'get': 'cache_stats'}), name='logbook-trip-cache-stats'),
+    path('metrics', metrics, name='metrics'),
+]
@@ -0,0 +1,23 @@
+"""
+WSGI config for the compute-only profile (core.settings_compute).
+
+    gunicorn --preload core.wsgi_compute
+
+With --preload the module is imported once in the gunicorn master, so the
+warm-up below runs before the fork and every worker starts warm.
+"""
+
+import os
+
+from django.core.wsgi import get_wsgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings_compute')
+
+application = get_wsgi_application()
+
+from django.conf import settings  # noqa: E402
+
+if settings.LOGBOOK_COMPUTE["WARMUP"]:
+    from logs.cold_start import warm_up
+
+    warm_up()
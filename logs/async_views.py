@@ -0,0 +1,48 @@
+import asyncio
+import json
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from .config import HOSConfig
+from .executors import get_async_executor
+from .models import LogbookTrip
+from .services import TripInputError, check_trip_feasibility, generate_trip_json, parse_trip_request
+
+
+@csrf_exempt
+@require_POST
+async def generate_logbook_async(request):
+    """
+    Native async twin of ``generate_logbook`` for ASGI servers. The
+    simulation runs on a bounded executor so the event loop keeps serving
+    other requests; once the executor is full the request is turned away
+    with 503 instead of queueing behind everyone else.
+    """
+    from .audit import record_trip
+
+    trip = None
+    try:
+        try:
+            data = json.loads(request.body)
+        except (ValueError, UnicodeDecodeError):
+            raise TripInputError("Request body must be valid JSON.")
+        trip = parse_trip_request(data)
+        config = HOSConfig()
+        check_trip_feasibility(trip, config)
+    except TripInputError as e:
+        if trip is not None:
+            record_trip(trip, LogbookTrip.OUTCOME_REJECTED, error=str(e))
+        return JsonResponse({"error": str(e)}, status=400)
+
+    future = get_async_executor().try_submit(generate_trip_json, trip, config)
+    if future is None:
+        response = JsonResponse({"error": "Server is at capacity, retry shortly."}, status=503)
+        response["Retry-After"] = str(settings.LOGBOOK_ASYNC["RETRY_AFTER"])
+        return response
+
+    content = await asyncio.wrap_future(future)
+    record_trip(trip, LogbookTrip.OUTCOME_GENERATED)
+    return HttpResponse(content, content_type="application/json")
@@ -0,0 +1,203 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import close_old_connections, connections
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .metrics import AUDIT_RECORDS
+
+logger = logging.getLogger(__name__)
+
+# Control messages on the recorder queue
+_FLUSH = object()
+_STOP = object()
+
+
+class AuditRecorder:
+    """
+    Write-behind recorder of generation requests. ``record`` only puts the
+    row on a bounded queue. A background thread writes it to LogbookTrip
+    with ``bulk_create`` once ``batch_size`` rows are waiting or the oldest
+    has waited ``flush_interval`` seconds. When the queue is full the row
+    is dropped and counted instead of slowing the request down.
+    """
+
+    def __init__(self, max_queue: int = 10000, batch_size: int = 500, flush_interval: float = 1.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def _ensure_started(self):
+        # Started by the first record, so a preloading master never forks with it running
+        with self._lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name="logbook-audit", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def record(self, **fields) -> bool:
+        """Queue one LogbookTrip row. Returns False when it had to be dropped."""
+        if self._thread is None:
+            self._ensure_started()
+        try:
+            if self._closed:
+                raise queue.Full
+            self._queue.put_nowait(fields)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                dropped = self.dropped
+            AUDIT_RECORDS.inc("dropped")
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.warning("Audit queue full, %d records dropped so far", dropped)
+            return False
+        return True
+
+    def _run(self):
+        batch = []
+        deadline = None
+        try:
+            while True:
+                timeout = None if not batch else max(deadline - time.monotonic(), 0.0)
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+
+                if item is _STOP or item is _FLUSH:
+                    self._write(batch)
+                    batch = []
+                    self._queue.task_done()
+                    if item is _STOP:
+                        return
+                    continue
+                if item is not None:
+                    if not batch:
+                        deadline = time.monotonic() + self.flush_interval
+                    batch.append(item)
+                if batch and (len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                    self._write(batch)
+                    batch = []
+        finally:
+            connections.close_all()
+
+    def _write(self, rows: list[dict]):
+        if not rows:
+            return
+        from .models import LogbookTrip
+
+        try:
+            close_old_connections()
+            LogbookTrip.objects.bulk_create([LogbookTrip(**row) for row in rows], batch_size=self.batch_size)
+        except Exception:
+            logger.exception("Could not write %d audit records", len(rows))
+            with self._lock:
+                self.failed += len(rows)
+            AUDIT_RECORDS.inc("failed", amount=len(rows))
+        else:
+            with self._lock:
+                self.written += len(rows)
+            AUDIT_RECORDS.inc("written", amount=len(rows))
+        finally:
+            for _ in rows:
+                self._queue.task_done()
+
+    def _wait_until_written(self, timeout: float | None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Write everything recorded so far now. False if that took longer than ``timeout``."""
+        if self._thread is None or self._closed:
+            return True
+        self._queue.put(_FLUSH)
+        return self._wait_until_written(timeout)
+
+    def close(self, timeout: float | None = 5.0) -> bool:
+        """Drain the queue and stop the writer thread. Later records are dropped."""
+        with self._lock:
+            if self._closed:
+                return True
+            self._closed = True
+            thread = self._thread
+        if thread is None:
+            return True
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+            }
+
+
+_recorder = None
+_recorder_lock = threading.Lock()
+
+
+def get_audit_recorder() -> AuditRecorder | None:
+    """Recorder configured by ``settings.LOGBOOK_AUDIT``, or None when auditing is off."""
+    global _recorder
+    options = settings.LOGBOOK_AUDIT
+    if not options["ENABLED"]:
+        return None
+    with _recorder_lock:
+        if _recorder is None:
+            _recorder = AuditRecorder(
+                max_queue=options["MAX_QUEUE"],
+                batch_size=options["BATCH_SIZE"],
+                flush_interval=options["FLUSH_INTERVAL"],
+            )
+        return _recorder
+
+
+@receiver(setting_changed)
+def _reset_audit_recorder(*, setting, **kwargs):
+    global _recorder
+    if setting == "LOGBOOK_AUDIT":
+        with _recorder_lock:
+            if _recorder is not None:
+                _recorder.close()
+            _recorder = None
+
+
+def record_trip(trip, outcome: str, *, error: str = "", days: int | None = None):
+    """Audit one parsed generation request, if auditing is on."""
+    recorder = get_audit_recorder()
+    if recorder is None:
+        return
+    recorder.record(
+        created_at=timezone.now(),
+        total_distance_miles=trip.total_dist,
+        total_driving_time_mins=trip.total_time_mins,
+        pickup_time_mins=trip.pickup_time,
+        current_cycle_hour=trip.current_cycle_hour,
+        engine=trip.engine,
+        allow_restart=trip.allow_restart,
+        outcome=outcome,
+        error=error[:255],
+        days=days,
+    )
@@ -0,0 +1,73 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .services import TripInputError, parse_trip_request, plan_trip
+
+logger = logging.getLogger(__name__)
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Process pool shared by every batch in this worker, created on first use."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != max_workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = ProcessPoolExecutor(max_workers=max_workers)
+            _pool_workers = max_workers
+        return _pool
+
+
+def _discard_process_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def run_trip(data) -> dict:
+    """
+    Plan one trip of a batch. Never raises: failures come back as a
+    per-trip error so a bad trip cannot sink the rest of the batch.
+    """
+    started = time.perf_counter()
+    try:
+        result = {"status": "ok", "logbooks": plan_trip(parse_trip_request(data))}
+    except TripInputError as e:
+        result = {"status": "error", "error": str(e)}
+    except Exception:
+        logger.exception("Unexpected failure while planning a batch trip")
+        result = {"status": "error", "error": "Internal error while generating this trip."}
+    result["compute_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return result
+
+
+def run_batch(trips: list, max_workers: int | None = None, serial_threshold: int = 0) -> list[dict]:
+    """
+    Plan every trip and return the results in input order. Batches smaller
+    than ``serial_threshold`` (or a single worker) skip the process pool.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers <= 1 or len(trips) < serial_threshold:
+        results = [run_trip(trip) for trip in trips]
+    else:
+        chunksize = max(1, len(trips) // (max_workers * 4))
+        try:
+            results = list(get_process_pool(max_workers).map(run_trip, trips, chunksize=chunksize))
+        except BrokenProcessPool:
+            logger.exception("Batch process pool died; planning this batch serially")
+            _discard_process_pool()
+            results = [run_trip(trip) for trip in trips]
+
+    for index, result in enumerate(results):
+        result["index"] = index
+    return results
@@ -0,0 +1,244 @@
+import json
+import platform
+import time
+import tracemalloc
+from dataclasses import dataclass
+from itertools import product
+from pathlib import Path
+
+from django.test import override_settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from .config import HOSConfig
+from .feasibility import validate_trip_feasibility
+from .json_encoding import LogbookDays
+from .logbook_generator import ENGINE_EVENT, ENGINE_STEP, LogbookGenerator
+from .renderers import LogbookJSONRenderer, SVGRenderer
+
+# (name, miles, driving minutes): short hop up to a multi-week haul. Every
+# trip may take 34-hour restarts, so the long hauls are planned rather than
+# rejected by the cycle check, and the starting cycle hours shape each run.
+ROUTES = [
+    ("short-hop", 150.0, 180.0),
+    ("day-run", 600.0, 600.0),
+    ("regional", 1500.0, 1500.0),
+    ("cross-country", 3000.0, 3000.0),
+    ("multi-week", 10000.0, 9000.0),
+]
+PICKUP_OFFSETS_MINS = [0.0, 120.0, 900.0]
+CYCLE_HOURS = [0.0, 30.0]
+
+TARGETS = ["generator:step", "generator:event", "feasibility", "view", "render:drf", "render:logbook", "render:svg"]
+
+
+@dataclass(frozen=True)
+class BenchmarkTrip:
+    name: str
+    total_dist: float
+    total_time_mins: float
+    pickup_time: float
+    current_cycle_hour: float
+    allow_restart: bool = True
+
+    def payload(self) -> dict:
+        return {
+            "total_distance_miles": self.total_dist,
+            "total_driving_time": self.total_time_mins,
+            "current_cycle_hour": self.current_cycle_hour,
+            "pickup_time": self.pickup_time,
+            "allow_restart": self.allow_restart,
+        }
+
+    def generator(self, config: HOSConfig, engine: str) -> LogbookGenerator:
+        return LogbookGenerator(
+            self.total_dist,
+            self.total_time_mins,
+            config,
+            current_cycle_hour=self.current_cycle_hour,
+            engine=engine,
+            allow_restart=self.allow_restart,
+        )
+
+
+def benchmark_trips() -> list[BenchmarkTrip]:
+    """The parametrized grid every benchmark target runs over."""
+    return [
+        BenchmarkTrip(f"{route}/pickup={pickup:g}/cycle={cycle:g}", dist, mins, pickup, cycle)
+        for (route, dist, mins), pickup, cycle in product(ROUTES, PICKUP_OFFSETS_MINS, CYCLE_HOURS)
+    ]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Linearly interpolated percentile, ``pct`` in [0, 100]."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _run_generator(engine: str):
+    def run(trip: BenchmarkTrip, config: HOSConfig) -> dict:
+        generator = trip.generator(config, engine)
+        logbooks = generator.generate(pickup_time_mins=trip.pickup_time)
+        return {
+            "iterations": generator.iterations,
+            "days": len(logbooks),
+            "entries": sum(len(day["logbook"]) for day in logbooks),
+        }
+    return run
+
+
+def _run_feasibility(trip: BenchmarkTrip, config: HOSConfig) -> dict:
+    validate_trip_feasibility(trip.total_dist, trip.total_time_mins, config, trip.current_cycle_hour)
+    return {"iterations": 1}
+
+
+def _run_view(trip: BenchmarkTrip, config: HOSConfig) -> dict:
+    from .views import LogEntryViewSet
+
+    view = LogEntryViewSet.as_view({"post": "generate_logbook"})
+    request = APIRequestFactory().post("/api/logs/generate_logbook/", trip.payload(), format="json")
+    response = view(request)
+    response.render()
+    return {"status": response.status_code, "bytes": len(response.content)}
+
+
+class _RenderRunner:
+    """Renders a logbook generated up front by ``prepare``, so only rendering is timed."""
+
+    def __init__(self, renderer):
+        self.renderer = renderer
+
+    def prepare(self, trip: BenchmarkTrip, config: HOSConfig) -> LogbookDays:
+        generator = trip.generator(config, ENGINE_EVENT)
+        return LogbookDays(generator.generate(pickup_time_mins=trip.pickup_time), generator.segments)
+
+    def __call__(self, days: LogbookDays) -> dict:
+        return {"bytes": len(self.renderer.render(days))}
+
+
+class _SVGRenderRunner(_RenderRunner):
+    def __call__(self, days: LogbookDays) -> dict:
+        return {**super().__call__(days), "days": len(days)}
+
+
+RUNNERS = {
+    "generator:step": _run_generator(ENGINE_STEP),
+    "generator:event": _run_generator(ENGINE_EVENT),
+    "feasibility": _run_feasibility,
+    "view": _run_view,
+    # The stock renderer treats LogbookDays as a plain list
+    "render:drf": _RenderRunner(JSONRenderer()),
+    "render:logbook": _RenderRunner(LogbookJSONRenderer()),
+    "render:svg": _SVGRenderRunner(SVGRenderer()),
+}
+
+
+def _measure(runner, trip: BenchmarkTrip, config: HOSConfig, repeat: int) -> dict:
+    # Runners with a prepare step time only what comes after it
+    prepare = getattr(runner, "prepare", None)
+    args = (prepare(trip, config),) if prepare else (trip, config)
+
+    timings_ms = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        details = runner(*args)
+        timings_ms.append((time.perf_counter() - started) * 1000)
+
+    # Allocations are traced in a separate run so tracing does not skew the timings
+    tracemalloc.start()
+    try:
+        runner(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    if "days" in details:
+        # Simulation or rendering throughput of this trip at the median
+        details["days_per_sec"] = round(details["days"] * 1000 / max(percentile(timings_ms, 50), 1e-6), 1)
+    return {
+        **details,
+        "p50_ms": percentile(timings_ms, 50),
+        "p95_ms": percentile(timings_ms, 95),
+        "p99_ms": percentile(timings_ms, 99),
+        "peak_alloc_kib": round(peak / 1024, 2),
+    }
+
+
+def run_benchmarks(targets: list[str] | None = None, repeat: int = 20, trips: list[BenchmarkTrip] | None = None) -> dict:
+    """
+    Time every target over the trip grid. Per trip this records wall time
+    percentiles, loop iterations, logbook entries and peak allocations.
+    """
+    targets = targets or TARGETS
+    trips = trips or benchmark_trips()
+    config = HOSConfig()
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "repeat": repeat,
+        },
+        "results": {},
+        "summary": {},
+    }
+
+    # Measure the real compute path, not result-cache hits, and keep the
+    # benchmark requests out of the audited trips
+    with override_settings(LOGBOOK_RESULT_CACHE={"ENABLED": False}, LOGBOOK_AUDIT={"ENABLED": False}):
+        for target in targets:
+            runner = RUNNERS[target]
+            per_trip = {trip.name: _measure(runner, trip, config, repeat) for trip in trips}
+            medians = [result["p50_ms"] for result in per_trip.values()]
+            report["results"][target] = per_trip
+            report["summary"][target] = {
+                "p50_ms": percentile(medians, 50),
+                "p95_ms": percentile(medians, 95),
+                "p99_ms": percentile(medians, 99),
+                "peak_alloc_kib": max(result["peak_alloc_kib"] for result in per_trip.values()),
+            }
+            if all("days" in result for result in per_trip.values()):
+                total_ms = sum(result["p50_ms"] for result in per_trip.values())
+                total_days = sum(result["days"] for result in per_trip.values())
+                report["summary"][target]["days_per_sec"] = round(total_days * 1000 / max(total_ms, 1e-6), 1)
+    return report
+
+
+def compare_to_baseline(report: dict, baseline: dict, budget: float, noise_floor_ms: float = 0.05) -> list[str]:
+    """
+    Regressions where a trip's p95 time or peak allocation grew by more
+    than ``budget`` (0.25 = 25%) over the baseline. Timings below
+    ``noise_floor_ms`` are too small to compare reliably and are skipped.
+    """
+    regressions = []
+    for target, per_trip in report["results"].items():
+        for name, result in per_trip.items():
+            before = baseline.get("results", {}).get(target, {}).get(name)
+            if before is None:
+                continue
+            for metric in ("p95_ms", "peak_alloc_kib"):
+                if metric == "p95_ms" and result[metric] < noise_floor_ms:
+                    continue
+                if before[metric] > 0 and result[metric] > before[metric] * (1 + budget):
+                    regressions.append(
+                        f"{target} {name}: {metric} {result[metric]:.3f} > "
+                        f"{before[metric]:.3f} (+{budget:.0%} budget)"
+                    )
+    return regressions
+
+
+def load_report(path: Path) -> dict | None:
+    path = Path(path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def save_report(report: dict, path: Path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True))
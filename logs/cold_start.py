@@ -0,0 +1,126 @@
+"""
+Warm-up for the compute profile and cold-start measurements.
+
+Nothing Django is imported at module level: ``python -m logs.cold_start``
+is the fresh interpreter whose startup is being measured.
+"""
+
+import importlib
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+# (name, WSGI module, extra environment)
+PROFILES = {
+    "full": ("core.wsgi", {}),
+    "compute": ("core.wsgi_compute", {"LOGBOOK_WARMUP": "0"}),
+    "compute+warmup": ("core.wsgi_compute", {"LOGBOOK_WARMUP": "1"}),
+}
+
+WARM_UP_TRIP = {
+    "total_distance_miles": 1200,
+    "total_driving_time": 1300,
+    "current_cycle_hour": 10,
+    "pickup_time": 60,
+}
+
+# A compute-heavy and a framework-bound request
+PROBES = {
+    "generate_logbook": ("POST", "/api/logs/generate_logbook/", WARM_UP_TRIP),
+    "cache_stats": ("GET", "/api/logs/cache_stats/", None),
+}
+
+
+def warm_up():
+    """
+    Resolve the URLconf, which imports the views, and plan and render one
+    trip. Starts no threads or pools, so it is safe before gunicorn forks.
+    """
+    from django.urls import resolve
+
+    from .config import HOSConfig
+    from .json_encoding import render_logbook_json
+    from .services import build_generator, parse_trip_request
+
+    resolve(PROBES["generate_logbook"][1])
+    trip = parse_trip_request(WARM_UP_TRIP)
+    generator = build_generator(trip, HOSConfig())
+    render_logbook_json(generator.generate(pickup_time_mins=trip.pickup_time), generator.segments)
+
+
+def _call(application, method: str, path: str, payload) -> tuple[str, float]:
+    body = json.dumps(payload).encode() if payload is not None else b""
+    environ = {
+        "REQUEST_METHOD": method,
+        "PATH_INFO": path,
+        "SCRIPT_NAME": "",
+        "QUERY_STRING": "",
+        "SERVER_NAME": "127.0.0.1",
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "HTTP_HOST": "127.0.0.1",
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.url_scheme": "http",
+        "wsgi.version": (1, 0),
+        "wsgi.multithread": False,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    statuses = []
+    started = time.perf_counter()
+    response = application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+    try:
+        for _ in response:
+            pass
+    finally:
+        if hasattr(response, "close"):
+            response.close()
+    return statuses[0], (time.perf_counter() - started) * 1000
+
+
+def _measure_here(wsgi_module: str, requests: int) -> dict:
+    started = time.perf_counter()
+    application = importlib.import_module(wsgi_module).application
+    result = {"import_ms": (time.perf_counter() - started) * 1000}
+
+    for name, (method, path, payload) in PROBES.items():
+        status, first_ms = _call(application, method, path, payload)
+        timings_ms = [_call(application, method, path, payload)[1] for _ in range(requests)]
+        result[name] = {"status": status, "first_ms": first_ms, "timings_ms": timings_ms}
+    return result
+
+
+def measure_profile(profile: str, requests: int = 200) -> dict:
+    """
+    Import time, first-request latency and steady-state latency of one
+    profile, measured in a fresh interpreter with the result cache off.
+    """
+    wsgi_module, extra_env = PROFILES[profile]
+    env = {**os.environ, **extra_env, "LOGBOOK_CACHE_ENABLED": "0"}
+    env.pop("DJANGO_SETTINGS_MODULE", None)
+    completed = subprocess.run(
+        [sys.executable, "-m", "logs.cold_start", wsgi_module, str(requests)],
+        capture_output=True, text=True, env=env, check=True, cwd=PROJECT_DIR,
+    )
+    result = json.loads(completed.stdout.splitlines()[-1])
+
+    from .benchmarks import percentile
+
+    for name in PROBES:
+        timings_ms = result[name].pop("timings_ms")
+        result[name]["p50_ms"] = percentile(timings_ms, 50)
+        result[name]["p95_ms"] = percentile(timings_ms, 95)
+    return result
+
+
+if __name__ == "__main__":
+    print(json.dumps(_measure_here(sys.argv[1], int(sys.argv[2]))))
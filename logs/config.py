@@ -8,9 +8,13 @@ class HOSConfig:
     MAX_DRIVING_TIME: float = 11.0         # Max hours driving per shift
     MAX_DUTY_WINDOW: float = 14.0          # Max hours on-duty per shift
     MAX_WEEKLY_CYCLE: float = 70.0         # 70-hour / 8-day rule
+    CYCLE_DAYS: int = 8                    # Rolling window of the weekly cycle
+    CYCLE_RESTART_DURATION: float = 34.0   # Off-duty time that resets the weekly cycle
     BREAK_REQUIRED_AFTER: float = 8.0      # 30-min break required after 8h work
     MANDATORY_BREAK_DURATION: float = 0.5  # Duration of the required break
     SLEEPER_BERTH_REQUIRED: float = 10.0   # Required rest to reset shift clocks
+    # (sleeper, other) rest pairs that may replace one reset in the split engine
+    SPLIT_SLEEPER_PAIRS: tuple = ((7.0, 3.0), (8.0, 2.0))
 
     # --- Operational Durations (Trip Tasks) ---
     PRE_TRIP_DURATION: float = 0.5         # Inspection at start of day
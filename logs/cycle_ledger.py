@@ -0,0 +1,129 @@
+import hashlib
+import math
+from dataclasses import replace
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .config import HOSConfig
+from .models import Driver, DriverDutyDay, DriverTripCommit
+from .services import TripInputError, TripRequest
+
+LEDGER_FIELDS = ("ledger_date", "ledger_ring", "ledger_total", "ledger_pending")
+
+
+class LedgerChangedError(TripInputError):
+    """The driver's cycle hours moved between planning a trip and committing it."""
+
+
+def parse_ledger_date(value, field: str = "start_date") -> date:
+    """An ISO calendar date, today when ``value`` is missing."""
+    if value is None:
+        return timezone.localdate()
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        raise TripInputError(f"Invalid {field} '{value}'. Expected YYYY-MM-DD.")
+
+
+def with_driver_cycle(data) -> tuple[dict, Driver | None, date | None]:
+    """
+    When the payload names a ``driver_id``, fill ``current_cycle_hour`` from
+    that driver's ledger for the trip's start date, replacing any value the
+    client sent. Other payloads pass through untouched.
+    """
+    if not isinstance(data, dict) or "driver_id" not in data:
+        return data, None, None
+    if not settings.LOGBOOK_DRIVER_LEDGER:
+        raise TripInputError("Driver ledgers are not available on this deployment.")
+
+    try:
+        driver = Driver.objects.only("id", *LEDGER_FIELDS).get(pk=int(data["driver_id"]))
+    except (ValueError, TypeError):
+        raise TripInputError(f"Invalid driver_id '{data['driver_id']}'.")
+    except Driver.DoesNotExist:
+        raise TripInputError(f"Unknown driver_id '{data['driver_id']}'.")
+
+    # The calendar day the trip's first logbook day falls on
+    start_date = parse_ledger_date(data.get("start_date"))
+    return {**data, "current_cycle_hour": driver.cycle_hours_on(start_date)}, driver, start_date
+
+
+def day_on_duty_hours(day_log: dict) -> float:
+    """Cycle-relevant hours of one logbook day: on-duty plus driving."""
+    return day_log["timeSpentInOnDuty"] + day_log["timeSpentInDriving"]
+
+
+def commit_key(trip: TripRequest, start_date: date) -> str:
+    """
+    Identity of a trip on a driver's ledger: its inputs and start date. The
+    cycle hours are left out, since they come from the ledger itself.
+    """
+    text = f"{start_date.isoformat()}|{replace(trip, current_cycle_hour=0.0)!r}"
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def commit_logbook(
+    driver: Driver, logbooks: list[dict], start_date: date, key: str, cycle_hours: float | None = None
+) -> Driver:
+    """
+    Record a generated logbook against the driver: one upsert per day with
+    on-duty time plus a constant-time update of the rolling window, which
+    moves to ``start_date``. A trip whose ``key`` was already committed is
+    left alone, so retried commits do not count its hours twice.
+
+    ``cycle_hours`` are the hours the logbook was planned with. The ledger
+    is re-read under the row lock, and if another commit has changed them
+    since, ``LedgerChangedError`` is raised and nothing is recorded.
+    """
+    with transaction.atomic():
+        driver = Driver.objects.select_for_update().get(pk=driver.pk)
+        _, created = DriverTripCommit.objects.get_or_create(
+            driver=driver, key=key, defaults={"start_date": start_date}
+        )
+        if not created:
+            return driver
+        current = driver.cycle_hours_on(start_date)
+        if cycle_hours is not None and not math.isclose(current, cycle_hours, abs_tol=1e-9):
+            # Raising rolls back the commit row created above
+            raise LedgerChangedError(
+                f"Driver {driver.pk} now has {current:g} cycle hours on {start_date.isoformat()}, "
+                f"not the {cycle_hours:g} this logbook was planned with. Generate it again."
+            )
+        driver.advance_ledger(start_date)
+        for offset, day_log in enumerate(logbooks):
+            hours = day_on_duty_hours(day_log)
+            if not hours:
+                continue
+            day = start_date + timedelta(days=offset)
+            duty_day, created = DriverDutyDay.objects.get_or_create(
+                driver=driver, date=day, defaults={"on_duty_hrs": hours}
+            )
+            if not created:
+                DriverDutyDay.objects.filter(pk=duty_day.pk).update(on_duty_hrs=F("on_duty_hrs") + hours)
+            driver.add_to_ledger(day, hours)
+        driver.save(update_fields=LEDGER_FIELDS)
+    return driver
+
+
+def fleet_cycle_hours(on_date: date, drivers=None) -> dict[int, float]:
+    """Cycle hours of every driver on ``on_date`` from a single query over the ledgers."""
+    if drivers is None:
+        drivers = Driver.objects.only("id", *LEDGER_FIELDS).order_by("id")
+    return {driver.pk: driver.cycle_hours_on(on_date) for driver in drivers}
+
+
+def fleet_feasibility(trip_dist, trip_time_mins, config: HOSConfig, on_date: date):
+    """
+    Which drivers can legally take which trips on ``on_date``: driver ids
+    in row order plus the (drivers, trips) boolean matrix.
+    """
+    # NumPy is only needed for fleet-wide screens, not per-trip requests
+    from .fleet_feasibility import feasibility_matrix
+
+    cycle_hours = fleet_cycle_hours(on_date)
+    matrix = feasibility_matrix(list(cycle_hours.values()), trip_dist, trip_time_mins, config)
+    return list(cycle_hours), matrix
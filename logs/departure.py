@@ -0,0 +1,164 @@
+"""
+Departure-time search.
+
+Every plan starts at midnight of day one with INITIAL_REST_DURATION off
+duty, so that rest is the hour the driver goes on duty. ``search_departures``
+tries every start hour on a grid across the day, for each pickup offset
+asked for, and ranks the results by day count, elapsed time or arrival.
+
+No HOS clock depends on the hour of day. The limits count driving, duty
+and break hours, and midnight only splits the log. A trip that takes no
+34-hour restart therefore runs through the same activities whenever it
+starts. It is simulated once per pickup offset, and every start hour's
+arrival and day count follow from that run. Only restarts depend on
+calendar days, through the rolling 8-day cycle, so trips that may take
+one are simulated once per start hour, across a process pool when asked.
+"""
+
+import math
+import time
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+
+from .config import HOSConfig
+from .services import TripInputError, TripRequest, build_generator
+
+RANKINGS = {
+    "days": lambda option: (option.days, option.elapsed_hrs, option.start_hour, option.pickup_time),
+    "elapsed": lambda option: (option.elapsed_hrs, option.days, option.start_hour, option.pickup_time),
+    "arrival": lambda option: (option.completed_at_hrs, option.days, option.start_hour, option.pickup_time),
+}
+
+
+@dataclass(frozen=True)
+class DepartureOption:
+    start_hour: float          # Goes on duty at this hour of day one
+    pickup_time: float         # Driving minutes before the pickup
+    completed_at_hrs: float    # Drop-off done, in hours from midnight of day one
+    days: int
+
+    @property
+    def elapsed_hrs(self) -> float:
+        return self.completed_at_hrs - self.start_hour
+
+    def as_dict(self) -> dict:
+        minutes = round(self.start_hour * 60)
+        return {
+            "start_time": f"{minutes // 60:02d}:{minutes % 60:02d}",
+            "start_hour": self.start_hour,
+            "pickup_time": self.pickup_time,
+            "elapsed_hrs": round(self.elapsed_hrs, 4),
+            "completed_at_hrs": round(self.completed_at_hrs, 4),
+            "days": self.days,
+        }
+
+
+@dataclass
+class DepartureSearch:
+    options: list              # Every DepartureOption, best first
+    simulations: int
+    compute_ms: float
+
+    @property
+    def best(self) -> DepartureOption:
+        return self.options[0]
+
+    def as_dict(self, alternatives: int) -> dict:
+        return {
+            "best": self.best.as_dict(),
+            "alternatives": [option.as_dict() for option in self.options[1:alternatives + 1]],
+            "evaluated": len(self.options),
+            "simulations": self.simulations,
+            "compute_ms": round(self.compute_ms, 3),
+        }
+
+
+def start_hours(step_mins: int, config: HOSConfig) -> list[float]:
+    """On-duty hours from midnight up to (not including) the next one, ``step_mins`` apart."""
+    if not 0 < step_mins <= config.HOURS_IN_DAY * config.MINUTES_PER_HOUR:
+        raise TripInputError("'step_minutes' must be a positive number of minutes within a day.")
+    count = math.ceil(config.HOURS_IN_DAY * config.MINUTES_PER_HOUR / step_mins)
+    return [index * step_mins / config.MINUTES_PER_HOUR for index in range(count)]
+
+
+def parse_pickup_times(trip: TripRequest, raw, limit: int) -> list[float] | None:
+    """Pickup offsets to try, in driving minutes; None keeps the trip's own."""
+    if raw is None:
+        return None
+    if trip.legs:
+        raise TripInputError("Routes take their pickups from 'legs'; leave out 'pickup_times'.")
+    if not isinstance(raw, list) or not 1 <= len(raw) <= limit:
+        raise TripInputError(f"'pickup_times' must list 1 to {limit} offsets in minutes.")
+    if not all(isinstance(value, (int, float)) and not isinstance(value, bool) and 0 <= value < math.inf for value in raw):
+        raise TripInputError("'pickup_times' must be non-negative numbers.")
+    if any(value > trip.total_time_mins for value in raw):
+        raise TripInputError(f"'pickup_times' must fall within the trip's {trip.total_time_mins:g} driving minutes.")
+    return [float(value) for value in raw]
+
+
+def _day_count(completed_at_hrs: float, config: HOSConfig) -> int:
+    return max(1, math.ceil(round(completed_at_hrs, 9) / config.HOURS_IN_DAY))
+
+
+def _simulate(trip: TripRequest, config: HOSConfig, start_hour: float) -> float:
+    """Completion hour of ``trip`` going on duty at ``start_hour``."""
+    generator = build_generator(trip, replace(config, INITIAL_REST_DURATION=start_hour))
+    for _ in generator.iter_days(pickup_time_mins=trip.pickup_time):
+        pass
+    return generator.completed_at_hrs
+
+
+def _simulate_task(task) -> float:
+    return _simulate(*task)
+
+
+def _simulate_each(tasks: list, pool) -> list[float]:
+    if pool is None:
+        return [_simulate_task(task) for task in tasks]
+    try:
+        return list(pool.map(_simulate_task, tasks, chunksize=max(1, len(tasks) // 32)))
+    except BrokenProcessPool:
+        return [_simulate_task(task) for task in tasks]
+
+
+def search_departures(
+    trip: TripRequest,
+    config: HOSConfig,
+    hours: list[float],
+    pickup_times: list[float] | None = None,
+    rank_by: str = "days",
+    pool=None,
+) -> DepartureSearch:
+    """
+    Evaluate ``trip`` for every start hour in ``hours`` and pickup offset
+    in ``pickup_times`` (default: the trip's own), best first. ``pool`` is
+    an executor for trips that may take restarts, which need a simulation
+    per start hour.
+    """
+    if rank_by not in RANKINGS:
+        raise TripInputError(f"Unknown ranking '{rank_by}'. Expected one of: {', '.join(RANKINGS)}")
+    started = time.perf_counter()
+    options = []
+    simulations = 0
+    for pickup_time in pickup_times or [trip.pickup_time]:
+        candidate = replace(trip, pickup_time=pickup_time)
+        if trip.allow_restart:
+            completions = _simulate_each([(candidate, config, hour) for hour in hours], pool)
+            simulations += len(hours)
+        else:
+            elapsed = _simulate(candidate, config, 0.0)
+            completions = [hour + elapsed for hour in hours]
+            simulations += 1
+        options.extend(
+            DepartureOption(hour, pickup_time, completed, _day_count(completed, config))
+            for hour, completed in zip(hours, completions)
+        )
+    options.sort(key=RANKINGS[rank_by])
+    return DepartureSearch(options, simulations, (time.perf_counter() - started) * 1000)
+
+
+def best_departure_logbooks(trip: TripRequest, config: HOSConfig, option: DepartureOption) -> list[dict]:
+    """The full logbook of one option."""
+    trip = replace(trip, pickup_time=option.pickup_time)
+    generator = build_generator(trip, replace(config, INITIAL_REST_DURATION=option.start_hour))
+    return generator.generate(pickup_time_mins=trip.pickup_time)
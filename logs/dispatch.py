@@ -0,0 +1,244 @@
+import heapq
+import math
+from collections import deque
+from dataclasses import dataclass, field, replace
+
+from .config import HOSConfig
+from .logbook_generator import ENGINE_EVENT, LogbookGenerator
+from .services import TripInputError
+
+
+@dataclass(frozen=True)
+class DispatchDriver:
+    id: object
+    current_cycle_hour: float = 0.0
+    available_at_hrs: float = 0.0
+
+
+@dataclass(frozen=True)
+class DispatchLoad:
+    id: object
+    total_dist: float
+    total_time_mins: float
+    pickup_time: float = 0.0
+
+
+@dataclass
+class Assignment:
+    driver_id: object
+    load_id: object
+    start_at_hrs: float
+    completed_at_hrs: float
+    on_duty_hrs: float
+
+
+@dataclass
+class DispatchPlan:
+    assignments: list[Assignment] = field(default_factory=list)
+    unassigned: list[object] = field(default_factory=list)
+    simulations: int = 0
+    restarts: int = 0
+
+    @property
+    def total_elapsed_hrs(self) -> float:
+        return sum(a.completed_at_hrs - a.start_at_hrs for a in self.assignments)
+
+    @property
+    def makespan_hrs(self) -> float:
+        return max((a.completed_at_hrs for a in self.assignments), default=0.0)
+
+    def as_dict(self) -> dict:
+        return {
+            "assignments": [
+                {
+                    "driver_id": a.driver_id,
+                    "trip_id": a.load_id,
+                    "start_at_hrs": round(a.start_at_hrs, 2),
+                    "completed_at_hrs": round(a.completed_at_hrs, 2),
+                    "on_duty_hrs": round(a.on_duty_hrs, 2),
+                }
+                for a in self.assignments
+            ],
+            "unassigned": self.unassigned,
+            "assigned_count": len(self.assignments),
+            "total_elapsed_hrs": round(self.total_elapsed_hrs, 2),
+            "makespan_hrs": round(self.makespan_hrs, 2),
+            "simulations": self.simulations,
+            "restarts": self.restarts,
+        }
+
+
+def _number(item: dict, key: str, default=None) -> float:
+    value = item.get(key, default)
+    if value is None:
+        raise TripInputError(f"Missing required field: {key}")
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        raise TripInputError(f"Invalid {key} '{value}'. Numeric value required.")
+    if not math.isfinite(number) or number < 0:
+        raise TripInputError(f"Invalid {key} '{value}'. Must be a non-negative number.")
+    return number
+
+
+def parse_dispatch_request(data) -> tuple[list[DispatchDriver], list[DispatchLoad]]:
+    """Drivers and loads of a dispatch request; any malformed entry rejects the request."""
+    if not isinstance(data, dict):
+        raise TripInputError("Dispatch parameters must be a JSON object.")
+    drivers, loads = data.get("drivers"), data.get("trips")
+    if not isinstance(drivers, list) or not drivers or not isinstance(loads, list) or not loads:
+        raise TripInputError("Body must contain non-empty 'drivers' and 'trips' lists.")
+
+    parsed_drivers = []
+    for index, item in enumerate(drivers):
+        if not isinstance(item, dict):
+            raise TripInputError(f"drivers[{index}] must be a JSON object.")
+        try:
+            parsed_drivers.append(DispatchDriver(
+                id=item.get("id", index),
+                current_cycle_hour=_number(item, "current_cycle_hour", 0.0),
+                available_at_hrs=_number(item, "available_at_hrs", 0.0),
+            ))
+        except TripInputError as e:
+            raise TripInputError(f"drivers[{index}]: {e}")
+
+    parsed_loads = []
+    for index, item in enumerate(loads):
+        if not isinstance(item, dict):
+            raise TripInputError(f"trips[{index}] must be a JSON object.")
+        try:
+            parsed_loads.append(DispatchLoad(
+                id=item.get("id", index),
+                total_dist=_number(item, "total_distance_miles"),
+                total_time_mins=_number(item, "total_driving_time"),
+                pickup_time=_number(item, "pickup_time", 0.0),
+            ))
+        except TripInputError as e:
+            raise TripInputError(f"trips[{index}]: {e}")
+
+    return parsed_drivers, parsed_loads
+
+
+def _simulate(load: DispatchLoad, config: HOSConfig, start_hour: float) -> tuple[float, list[float]]:
+    """
+    Completion hour and on-duty hours per logbook day of one load, going
+    on duty at ``start_hour`` of its first day (the initial rest is cut to
+    end there, as in ``departure``). Loads are planned without restarts,
+    so the driver's cycle position does not change the schedule.
+    """
+    generator = LogbookGenerator(
+        load.total_dist, load.total_time_mins, replace(config, INITIAL_REST_DURATION=start_hour), engine=ENGINE_EVENT
+    )
+    logbooks = generator.generate(pickup_time_mins=load.pickup_time)
+    return generator.completed_at_hrs, [day["timeSpentInOnDuty"] + day["timeSpentInDriving"] for day in logbooks]
+
+
+class _CycleWindow:
+    """
+    One driver's rolling cycle: on-duty hours by day of the plan, dropped
+    once they are CYCLE_DAYS days old. Hours used before the plan count as
+    the day before it, the latest they could still be in the window.
+    """
+
+    def __init__(self, current_cycle_hour: float, config: HOSConfig):
+        self.config = config
+        self.days = deque()
+        self.total = 0.0
+        if current_cycle_hour:
+            self.add(-1, current_cycle_hour)
+
+    def add(self, day: int, hours: float):
+        self.days.append((day, hours))
+        self.total += hours
+
+    def hours_at(self, at_hrs: float) -> float:
+        """Cycle hours used on the plan day ``at_hrs`` falls on; days only move forward."""
+        oldest = math.floor(at_hrs / self.config.HOURS_IN_DAY) - self.config.CYCLE_DAYS
+        while self.days and self.days[0][0] <= oldest:
+            self.total -= self.days.popleft()[1]
+        return max(self.total, 0.0)
+
+    def clear(self):
+        self.days.clear()
+        self.total = 0.0
+
+
+def plan_dispatch(drivers: list[DispatchDriver], loads: list[DispatchLoad], config: HOSConfig | None = None) -> DispatchPlan:
+    """
+    Greedy list scheduling: the driver who frees up first takes the
+    shortest load left (shortest-processing-time first, which keeps total
+    elapsed time low and leaves the most cycle hours for later loads).
+    The vectorized feasibility screen predicts every load's on-duty hours
+    once, so a pairing is simulated only when it is actually assigned.
+    A driver goes on duty at ``available_at_hrs`` and takes a 10-hour
+    reset after each load; one whose cycle no longer fits even the
+    shortest remaining load takes a 34-hour restart from the drop-off
+    instead. Each load is simulated from the hour of day its driver starts
+    it, so its logbook days are the plan days its on-duty hours fall on,
+    and they roll out of the driver's cycle CYCLE_DAYS days later.
+    """
+    from .fleet_feasibility import validate_trip_feasibility_batch
+
+    config = config or HOSConfig()
+    plan = DispatchPlan()
+
+    screen = validate_trip_feasibility_batch(
+        [load.total_dist for load in loads], [load.total_time_mins for load in loads], config, 0.0
+    )
+    predicted = screen.predicted_on_duty_hrs.tolist()
+
+    # Loads no driver could take even with a fresh cycle are dropped up front
+    load_heap = []
+    for index, load in enumerate(loads):
+        if predicted[index] > config.MAX_WEEKLY_CYCLE:
+            plan.unassigned.append(load.id)
+        else:
+            load_heap.append((predicted[index], index))
+    heapq.heapify(load_heap)
+
+    windows = [_CycleWindow(driver.current_cycle_hour, config) for driver in drivers]
+    # When each driver last went off duty, which a restart counts from
+    free_at = [driver.available_at_hrs for driver in drivers]
+    # (available at, cycle hours used then, insertion order, driver)
+    driver_heap = [
+        (driver.available_at_hrs, windows[order].hours_at(driver.available_at_hrs), order, driver)
+        for order, driver in enumerate(drivers)
+    ]
+    heapq.heapify(driver_heap)
+
+    simulated = {}
+    while load_heap:
+        available_at, cycle_hour, order, driver = heapq.heappop(driver_heap)
+        window = windows[order]
+        on_duty_estimate, index = load_heap[0]
+        if on_duty_estimate > config.MAX_WEEKLY_CYCLE - cycle_hour:
+            # Nothing left is short enough for this driver's cycle: restart it
+            plan.restarts += 1
+            window.clear()
+            restarted_at = free_at[order] + config.CYCLE_RESTART_DURATION
+            heapq.heappush(driver_heap, (restarted_at, 0.0, order, driver))
+            continue
+        heapq.heappop(load_heap)
+        load = loads[index]
+
+        # Logbook day k of the load is plan day first_day + k
+        first_day = math.floor(available_at / config.HOURS_IN_DAY)
+        start_hour = available_at - first_day * config.HOURS_IN_DAY
+
+        # Identical loads started at the same hour of day simulate identically
+        key = (load.total_dist, load.total_time_mins, load.pickup_time, start_hour)
+        if key not in simulated:
+            simulated[key] = _simulate(load, config, start_hour)
+            plan.simulations += 1
+        completed_in_load_hrs, day_hours = simulated[key]
+
+        for offset, hours in enumerate(day_hours):
+            if hours:
+                window.add(first_day + offset, hours)
+        completed_at = first_day * config.HOURS_IN_DAY + completed_in_load_hrs
+        plan.assignments.append(Assignment(driver.id, load.id, available_at, completed_at, sum(day_hours)))
+        free_at[order] = completed_at
+        ready_at = completed_at + config.SLEEPER_BERTH_REQUIRED
+        heapq.heappush(driver_heap, (ready_at, window.hours_at(ready_at), order, driver))
+
+    return plan
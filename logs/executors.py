@@ -0,0 +1,97 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .batch import get_process_pool
+
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+EXECUTOR_KINDS = (EXECUTOR_THREAD, EXECUTOR_PROCESS)
+
+
+class BoundedExecutor:
+    """
+    Thread or process executor that refuses new work once ``max_pending``
+    tasks are queued or running, so callers can shed load instead of
+    letting the queue grow without bound.
+    """
+
+    def __init__(self, kind: str = EXECUTOR_THREAD, max_workers: int = 4, max_pending: int = 16):
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor '{kind}'. Expected one of: {', '.join(EXECUTOR_KINDS)}")
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._pool = None
+
+    def _get_pool(self):
+        if self.kind == EXECUTOR_PROCESS:
+            # Share the batch endpoint's pool rather than forking a second one
+            return get_process_pool(self.max_workers)
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="logbook")
+            return self._pool
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def try_submit(self, fn, *args) -> Future | None:
+        """Submit ``fn(*args)``, or return None when every slot is taken."""
+        if not self._slots.acquire(blocking=False):
+            return None
+        with self._lock:
+            self._pending += 1
+        try:
+            future = self._get_pool().submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, _future=None):
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_async_executor() -> BoundedExecutor:
+    """Executor configured by ``settings.LOGBOOK_ASYNC``, created on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            options = settings.LOGBOOK_ASYNC
+            _executor = BoundedExecutor(
+                kind=options["EXECUTOR"],
+                max_workers=options["MAX_WORKERS"],
+                max_pending=options["MAX_PENDING"],
+            )
+        return _executor
+
+
+@receiver(setting_changed)
+def _reset_async_executor(*, setting, **kwargs):
+    global _executor
+    if setting == "LOGBOOK_ASYNC":
+        with _executor_lock:
+            if _executor is not None:
+                _executor.shutdown()
+            _executor = None
@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from .config import HOSConfig
+
+
+@dataclass
+class FleetFeasibility:
+    """Column results of a vectorized feasibility screen, one entry per driver/trip pair."""
+
+    feasible: np.ndarray               # bool
+    predicted_on_duty_hrs: np.ndarray  # float64
+    fuel_stops: np.ndarray             # int64
+    breaks: np.ndarray                 # int64
+    remaining_cycle_hrs: np.ndarray    # float64
+
+
+def validate_trip_feasibility_batch(
+    total_dist,
+    total_time_mins,
+    config: HOSConfig,
+    current_cycle_hour,
+) -> FleetFeasibility:
+    """
+    Vectorized ``validate_trip_feasibility`` over column arrays. Inputs
+    broadcast against each other and every pair gets the same answer the
+    scalar service gives, computed in one pass.
+    """
+    total_dist = np.asarray(total_dist, dtype=np.float64)
+    total_time_mins = np.asarray(total_time_mins, dtype=np.float64)
+    current_cycle_hour = np.asarray(current_cycle_hour, dtype=np.float64)
+
+    # Same operations, in the same order, as the scalar service
+    total_driving_required_hrs = total_time_mins / config.MINUTES_PER_HOUR
+    remaining_cycle_hrs = config.MAX_WEEKLY_CYCLE - current_cycle_hour
+
+    num_fueling_stops = np.floor_divide(total_dist, config.REFUEL_THRESHOLD_MILES)
+    fueling_duration_hrs = num_fueling_stops * config.REFUEL_DURATION
+
+    subtotal_work_hrs = total_driving_required_hrs + config.FIXED_ON_DUTY_HOURS + fueling_duration_hrs
+
+    num_breaks = np.floor_divide(subtotal_work_hrs, config.BREAK_REQUIRED_AFTER)
+    break_duration_hrs = num_breaks * config.MANDATORY_BREAK_DURATION
+
+    total_predicted_on_duty = subtotal_work_hrs + break_duration_hrs
+    feasible = ~(total_predicted_on_duty > remaining_cycle_hrs)
+
+    return FleetFeasibility(
+        feasible=feasible,
+        predicted_on_duty_hrs=total_predicted_on_duty,
+        fuel_stops=num_fueling_stops.astype(np.int64),
+        breaks=num_breaks.astype(np.int64),
+        remaining_cycle_hrs=np.broadcast_to(remaining_cycle_hrs, feasible.shape),
+    )
+
+
+def feasibility_matrix(driver_cycle_hours, trip_dist, trip_time_mins, config: HOSConfig) -> np.ndarray:
+    """
+    Boolean ``(drivers, trips)`` matrix of which driver can legally take
+    which load. Trip work is computed once per trip, then compared against
+    every driver's remaining cycle by broadcasting.
+    """
+    trips = validate_trip_feasibility_batch(trip_dist, trip_time_mins, config, 0.0)
+    remaining = config.MAX_WEEKLY_CYCLE - np.asarray(driver_cycle_hours, dtype=np.float64)
+    return ~(trips.predicted_on_duty_hrs[np.newaxis, :] > remaining[:, np.newaxis])
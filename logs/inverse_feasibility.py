@@ -0,0 +1,126 @@
+import math
+from dataclasses import dataclass
+
+from .config import HOSConfig
+from .feasibility import validate_trip_feasibility
+
+# Reported maximums are rounded down to this many minutes
+MINUTE_RESOLUTION = 0.01
+
+
+@dataclass(frozen=True)
+class MaxTrip:
+    current_cycle_hour: float
+    mph: float
+    max_driving_minutes: float
+    max_distance_miles: float
+
+    def as_dict(self) -> dict:
+        return {
+            "current_cycle_hour": self.current_cycle_hour,
+            "mph": self.mph,
+            "max_driving_minutes": self.max_driving_minutes,
+            "max_distance_miles": self.max_distance_miles,
+        }
+
+
+def _pieces(mph: float, config: HOSConfig):
+    """
+    Walk driving time in hours through the stretches where the number of
+    refuels and breaks in ``validate_trip_feasibility`` stays constant.
+    Predicted on-duty time is ``t + offset`` inside each stretch. Yields
+    ``(start, end, offset)`` until on-duty time would exceed a whole cycle.
+    """
+    start = 0.0
+    refuels = 0
+    breaks = math.floor(config.FIXED_ON_DUTY_HOURS / config.BREAK_REQUIRED_AFTER)
+    while True:
+        work_offset = config.FIXED_ON_DUTY_HOURS + refuels * config.REFUEL_DURATION
+        offset = work_offset + breaks * config.MANDATORY_BREAK_DURATION
+        if start + offset > config.MAX_WEEKLY_CYCLE:
+            return
+
+        next_break = (breaks + 1) * config.BREAK_REQUIRED_AFTER - work_offset
+        next_refuel = (refuels + 1) * config.REFUEL_THRESHOLD_MILES / mph if mph > 0 else math.inf
+        end = min(next_break, next_refuel)
+        yield start, end, offset
+
+        # Counters move explicitly so float noise at a boundary cannot stall the walk
+        if next_refuel <= end:
+            refuels += 1
+        work = end + config.FIXED_ON_DUTY_HOURS + refuels * config.REFUEL_DURATION
+        breaks = max(breaks + (next_break <= end), math.floor(work / config.BREAK_REQUIRED_AFTER))
+        start = end
+
+
+def _max_driving_hours(remaining_cycle_hrs: float, mph: float, config: HOSConfig) -> float:
+    """Supremum of driving hours whose predicted on-duty time fits ``remaining_cycle_hrs``."""
+    best = 0.0
+    for start, end, offset in _pieces(mph, config):
+        if start + offset > remaining_cycle_hrs:
+            # A refuel or break pushed the prediction past the limit right here
+            return best
+        limit = remaining_cycle_hrs - offset
+        if limit < end:
+            return limit
+        best = end
+    return best
+
+
+def _passes(minutes: float, mph: float, config: HOSConfig, current_cycle_hour: float) -> bool:
+    miles = minutes / config.MINUTES_PER_HOUR * mph
+    return validate_trip_feasibility(miles, minutes, config, current_cycle_hour)[0]
+
+
+def max_trip(current_cycle_hour: float, mph: float, config: HOSConfig | None = None) -> MaxTrip:
+    """
+    Longest trip at ``mph`` that ``validate_trip_feasibility`` accepts from
+    ``current_cycle_hour``, solved in closed form over the refuel/break
+    stretches rather than by probing. The answer is rounded down to
+    MINUTE_RESOLUTION and confirmed against the scalar check.
+    """
+    config = config or HOSConfig()
+    if mph < 0:
+        raise ValueError("mph must not be negative.")
+
+    remaining = config.MAX_WEEKLY_CYCLE - current_cycle_hour
+    hours = _max_driving_hours(remaining, mph, config)
+    minutes = math.floor(hours * config.MINUTES_PER_HOUR / MINUTE_RESOLUTION) * MINUTE_RESOLUTION
+
+    # At a refuel or break boundary the supremum itself is excluded
+    while minutes > 0 and not _passes(minutes, mph, config, current_cycle_hour):
+        minutes = round(minutes - MINUTE_RESOLUTION, 6)
+    if minutes <= 0 and not _passes(0.0, mph, config, current_cycle_hour):
+        return MaxTrip(current_cycle_hour, mph, 0.0, 0.0)
+
+    minutes = round(max(minutes, 0.0), 6)
+    return MaxTrip(current_cycle_hour, mph, minutes, round(minutes / config.MINUTES_PER_HOUR * mph, 4))
+
+
+def feasibility_breakpoints(mph: float, config: HOSConfig | None = None) -> list[dict]:
+    """
+    The feasibility boundary over cycle hours as a breakpoint table. The
+    longest legal drive is continuous and piecewise linear in the cycle
+    hours already used, so interpolating linearly between rows is exact
+    (up to the excluded boundary point itself). Rows run from 0 used hours
+    to a spent cycle.
+    """
+    config = config or HOSConfig()
+    cycle = config.MAX_WEEKLY_CYCLE
+    points = {}
+    for start, end, offset in _pieces(mph, config):
+        # Remaining hours at which this stretch starts and stops binding
+        for remaining, hours in ((start + offset, start), (min(end + offset, cycle), min(end, cycle - offset))):
+            if 0 <= remaining <= cycle:
+                points[round(cycle - remaining, 9)] = hours
+    points.setdefault(0.0, _max_driving_hours(cycle, mph, config))
+    points[cycle] = 0.0
+
+    return [
+        {
+            "cycle_hour": cycle_hour,
+            "max_driving_minutes": round(hours * config.MINUTES_PER_HOUR, 4),
+            "max_distance_miles": round(hours * mph, 4),
+        }
+        for cycle_hour, hours in sorted(points.items())
+    ]
@@ -0,0 +1,115 @@
+import json
+import math
+from itertools import chain
+
+from .segments import ROWS, SegmentStore, action_name
+
+
+def render_json(data) -> bytes:
+    """
+    Compact JSON bytes identical to DRF's default JSONRenderer output
+    (UNICODE_JSON, COMPACT_JSON and STRICT_JSON at their defaults), without
+    needing Django settings, so pool workers can render too.
+    """
+    content = json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+    # Same escaping DRF applies so the output is safe inside JavaScript
+    content = content.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+    return content.encode()
+
+
+# Day keys in the order LogbookGenerator emits them, and the value types
+# it always writes for the summary after "logbook"
+_DAY_KEYS = (
+    "logbook", "currentHour", "totalTimeTraveled", "timeSpentInOffDuty",
+    "timeSpentInOnDuty", "timeSpentInDriving", "timeSpentInSleeperBerth",
+)
+_SUMMARY_KEYS = _DAY_KEYS[1:]
+_SUMMARY_TYPES = (int, float, float, float, float, float)
+_SUMMARY_FRAGMENTS = tuple(f',"{key}":' for key in _SUMMARY_KEYS)
+
+_POINT_HEAD = '{"hour":'
+_START_TAILS = tuple("," + render_json({"row": row}).decode()[1:] for row in ROWS)
+_MAX_CACHED_HOURS = 4096
+
+
+class _NotLogbookShaped(Exception):
+    pass
+
+
+class _HourText(dict):
+    """
+    repr() of hour values, which is exactly what json writes for a finite
+    float. Logbooks reuse a small set of hours, and formatting a float is
+    the most expensive part of encoding a point. Zero is never cached
+    because 0.0 and -0.0 are the same key but print differently.
+    """
+
+    def __missing__(self, hour: float) -> str:
+        if not math.isfinite(hour):
+            raise _NotLogbookShaped
+        text = float.__repr__(hour)
+        if hour != 0.0 and len(self) < _MAX_CACHED_HOURS:
+            self[hour] = text
+        return text
+
+
+class _EndTails(dict):
+    """Encoded remainder of a segment's end point, per (row code, action id)."""
+
+    def __missing__(self, key: tuple[int, int]) -> str:
+        row_code, action_id = key
+        row = ROWS[row_code]
+        # Driving end points carry no action, matching SegmentStore.to_logbook
+        point = {"row": row} if row == "driving" else {"row": row, "action": action_name(action_id)}
+        tail = self[key] = "," + render_json(point).decode()[1:]
+        return tail
+
+
+_HOUR_TEXT = _HourText()
+_END_TAILS = _EndTails()
+
+
+def _encode_points(store: SegmentStore) -> str:
+    if not store.rows:
+        return ""
+    hour_text, start_tails, end_tails = _HOUR_TEXT.__getitem__, _START_TAILS.__getitem__, _END_TAILS.__getitem__
+    starts = map(str.__add__, map(hour_text, store.starts), map(start_tails, store.rows))
+    ends = map(str.__add__, map(hour_text, store.ends), map(end_tails, zip(store.rows, store.actions)))
+    return _POINT_HEAD + ("," + _POINT_HEAD).join(chain.from_iterable(zip(starts, ends)))
+
+
+def _encode_summary(day: dict) -> str:
+    values = list(map(day.__getitem__, _SUMMARY_KEYS))
+    # For finite ints and floats json writes exactly their repr
+    if tuple(map(type, values)) != _SUMMARY_TYPES or not all(map(math.isfinite, values)):
+        raise _NotLogbookShaped
+    return "".join(map(str.__add__, _SUMMARY_FRAGMENTS, map(repr, values)))
+
+
+class LogbookDays(list):
+    """Generated days together with the SegmentStore each one was sealed from."""
+
+    def __init__(self, days, segments: list[SegmentStore]):
+        super().__init__(days)
+        self.segments = segments
+
+
+def render_logbook_json(logbooks: list[dict], segments: list[SegmentStore]) -> bytes:
+    """
+    ``render_json(logbooks)`` for generator output, byte for byte, written
+    from the generator's SegmentStores instead of the point dicts: points
+    are joined from pre-encoded row/action fragments, looked up by the
+    interned codes, and cached hour strings. Days whose summary keys or
+    types differ from what the generator writes take the generic path.
+    """
+    try:
+        if len(logbooks) != len(segments):
+            raise _NotLogbookShaped
+        days = []
+        for day, store in zip(logbooks, segments):
+            if tuple(day) != _DAY_KEYS:
+                raise _NotLogbookShaped
+            days.append('{"logbook":[' + _encode_points(store) + "]" + _encode_summary(day) + "}")
+        return ("[" + ",".join(days) + "]").encode()
+    except _NotLogbookShaped:
+        return render_json(logbooks)
@@ -1,16 +1,112 @@
+import math
+from collections import deque
+from dataclasses import dataclass, replace
+from itertools import accumulate, repeat
+
 from .config import HOSConfig
 from .driver_state import DriverState
+from .segments import SegmentStore
+
+# Simulation engines accepted by ``LogbookGenerator``.
+ENGINE_STEP = "step"    # Fixed TIME_STEP slices, every HOS rule re-checked per slice
+ENGINE_EVENT = "event"  # Jump straight to the next duty change
+ENGINES = (ENGINE_STEP, ENGINE_EVENT)
+
+# Bump whenever a change alters generated logbooks, so cached and stored
+# copies made by older code stop matching
+ENGINE_VERSION = 1
+
+# How close (in steps) a limit must be to a slice boundary before the event
+# engine re-checks it with the stepper's own float arithmetic
+_BOUNDARY_TOLERANCE = 1e-6
+
+
+def _sums_exactly(value: float, increment: float) -> bool:
+    """True when both sit on a 1/1024 grid, so every partial sum is exact."""
+    return (value * 1024).is_integer() and (increment * 1024).is_integer()
+
+
+def _repeat_add(value: float, increment: float, times: int) -> float:
+    """``value + increment`` applied ``times`` times, rounding exactly like a loop would."""
+    if times <= 0:
+        return value
+    if _sums_exactly(value, increment):
+        return value + increment * times
+    return deque(accumulate(repeat(increment, times), initial=value), maxlen=1)[0]
+
+
+@dataclass(frozen=True)
+class GeneratorCheckpoint:
+    """
+    Everything a simulation needs to carry on from a loop boundary: the
+    driver's clocks, the open day and the rolling cycle. Segment remarks
+    are process-local ids, so checkpoints do not leave the process.
+    """
+    day_index: int
+    iterations: int
+    has_performed_pickup: bool
+    state: DriverState
+    day_log: dict
+    day_segments: SegmentStore
+    cycle_days: tuple
+    cycle_window_hrs: float
+    cycle_day_offset: float
+
+    @property
+    def elapsed_driving_hrs(self) -> float:
+        return self.state.total_trip_time_elapsed_hrs
+
 
 class LogbookGenerator:
-    def __init__(self, total_dist: float, total_time_mins: float, config: HOSConfig, current_cycle_hour: float = 0.0):
+    def __init__(
+        self,
+        total_dist: float,
+        total_time_mins: float,
+        config: HOSConfig,
+        current_cycle_hour: float = 0.0,
+        engine: str = ENGINE_STEP,
+        allow_restart: bool = False,
+        record_checkpoints: bool = False,
+    ):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'. Expected one of: {', '.join(ENGINES)}")
         self.config = config
+        self.engine = engine
         self.state = DriverState()
         self.total_dist = total_dist
         self.total_driving_required_hrs = total_time_mins / self.config.MINUTES_PER_HOUR
         self.current_cycle_hour = current_cycle_hour
         self.mph = (total_dist / self.total_driving_required_hrs) if self.total_driving_required_hrs > 0 else 0
                 
+        # Rolling cycle: on-duty totals of the previous CYCLE_DAYS - 1 days and
+        # their running sum. Hours already used count as yesterday's, the
+        # latest they could still be in the window.
+        self.allow_restart = allow_restart
+        self._cycle_days = deque(maxlen=config.CYCLE_DAYS - 1)
+        self._cycle_window_hrs = 0.0
+        self._cycle_day_offset = 0.0
+        if current_cycle_hour:
+            self._cycle_days.append(current_cycle_hour)
+            self._cycle_window_hrs = current_cycle_hour
+
         self.logbooks = []
+        self._sealed_days = deque()
+        self.day_segments = SegmentStore()
+        # Every sealed day's SegmentStore, kept by generate(); iter_days
+        # holds only the day being simulated
+        self.keep_segments = False
+        self.segments = []
+        self.iterations = 0
+        # Whole days rotated so far, and hours from the start of day one
+        # until the drop-off finished
+        self.day_index = 0
+        self.completed_at_hrs = None
+        # With record_checkpoints, a snapshot is taken at the first loop
+        # boundary after every midnight
+        self.record_checkpoints = record_checkpoints
+        self.checkpoints: list[GeneratorCheckpoint] = []
+        self._checkpoint_due = False
+        self.has_performed_pickup = False
         self.current_day_log = self._initialize_new_day_dict()
 
     def _initialize_new_day_dict(self):
@@ -26,41 +122,81 @@ class LogbookGenerator:
 
     def _finalize_day(self):
         """Helper to seal the summary values before pushing to the list."""
+        self.current_day_log["logbook"] = self.day_segments.to_logbook()
         self.current_day_log["timeSpentInOffDuty"] = round(self.state.day_off_duty, 2)
         self.current_day_log["timeSpentInOnDuty"] = round(self.state.day_on_duty, 2)
         self.current_day_log["timeSpentInDriving"] = round(self.state.day_driving, 2)
         self.current_day_log["timeSpentInSleeperBerth"] = round(self.state.day_sleeper, 2)
-        self.logbooks.append(self.current_day_log)
+        self._sealed_days.append(self.current_day_log)
+        if self.keep_segments:
+            self.segments.append(self.day_segments)
 
     def _rotate_day(self):
         self._finalize_day()
+        self._close_cycle_day()
+        self.day_index += 1
+        self._checkpoint_due = self.record_checkpoints
         self.state.current_hour_of_day = 0.0
         self.state.reset_daily_counters()
         self.current_day_log = self._initialize_new_day_dict()
+        self.day_segments = SegmentStore()
+
+    def _close_cycle_day(self):
+        day_total = self.state.day_on_duty + self.state.day_driving - self._cycle_day_offset
+        if len(self._cycle_days) == self._cycle_days.maxlen:
+            self._cycle_window_hrs -= self._cycle_days[0]
+        self._cycle_days.append(day_total)
+        self._cycle_window_hrs += day_total
+        self._cycle_day_offset = 0.0
+
+    def _cycle_hours_used(self, day_driving: float | None = None) -> float:
+        """On-duty hours in the rolling window, today included."""
+        if day_driving is None:
+            day_driving = self.state.day_driving
+        return self._cycle_window_hrs + self.state.day_on_duty + day_driving - self._cycle_day_offset
+
+    def _restart_due(self, on_duty_hrs: float) -> bool:
+        """True when ``on_duty_hrs`` more work would push past the weekly cycle."""
+        return self.allow_restart and self._cycle_hours_used() + on_duty_hrs > self.config.MAX_WEEKLY_CYCLE
+
+    def _log_cycle_restart(self):
+        remaining = self.config.CYCLE_RESTART_DURATION
+        while remaining > 0:
+            # One midnight at most per call, which is all _log_off_duty splits
+            chunk = min(remaining, self.config.HOURS_IN_DAY)
+            self._log_off_duty(chunk, "34-hour restart")
+            remaining -= chunk
+
+        # A restart also covers the 10-hour reset and the 30-minute break
+        self.state.daily_driving_hrs = 0
+        self.state.daily_duty_hrs = 0
+        self.state.hrs_since_last_break = 0
+
+        self._cycle_days.clear()
+        self._cycle_window_hrs = 0.0
+        self._cycle_day_offset = self.state.day_on_duty + self.state.day_driving
 
     def _log_sleeper(self, duration: float):
         remaining_in_day = self.config.HOURS_IN_DAY - self.state.current_hour_of_day
         
         if duration > remaining_in_day:
             # PART 1: Fill the rest of today
-            self.current_day_log["logbook"].append({"hour": self.state.current_hour_of_day, "row": "sleeper"})
+            self.day_segments.record(self.state.current_hour_of_day, self.config.HOURS_IN_DAY, "sleeper", "10-hour Reset (Part 1)")
             self.state.day_sleeper += remaining_in_day
             self.state.current_hour_of_day = self.config.HOURS_IN_DAY
-            self.current_day_log["logbook"].append({"hour": self.config.HOURS_IN_DAY, "row": "sleeper", "action": "10-hour Reset (Part 1)"})
             self._rotate_day()
             
             # PART 2: The remaining time in the new day
             remainder = duration - remaining_in_day
-            self.current_day_log["logbook"].append({"hour": 0.0, "row": "sleeper"})
             self.state.current_hour_of_day += remainder
             self.state.day_sleeper += remainder
-            self.current_day_log["logbook"].append({"hour": self.state.current_hour_of_day, "row": "sleeper", "action": "10-hour Reset (Part 2)"})
+            self.day_segments.record(0.0, self.state.current_hour_of_day, "sleeper", "10-hour Reset (Part 2)")
         else:
             # Normal logic if it fits in the current day
-            self.current_day_log["logbook"].append({"hour": self.state.current_hour_of_day, "row": "sleeper"})
+            start = self.state.current_hour_of_day
             self.state.current_hour_of_day += duration
             self.state.day_sleeper += duration
-            self.current_day_log["logbook"].append({"hour": self.state.current_hour_of_day, "row": "sleeper", "action": "10-hour Reset"})
+            self.day_segments.record(start, self.state.current_hour_of_day, "sleeper", "10-hour Reset")
 
         # Resets for HOS
         self.state.daily_driving_hrs = 0
@@ -72,74 +208,68 @@ class LogbookGenerator:
         
         if duration > remaining_in_day:
             # PART 1
-            self.current_day_log["logbook"].append({"hour": self.state.current_hour_of_day, "row": "off-duty"})
+            self.day_segments.record(self.state.current_hour_of_day, self.config.HOURS_IN_DAY, "off-duty", action)
             self.state.day_off_duty += remaining_in_day
             self.state.current_hour_of_day = self.config.HOURS_IN_DAY
-            self.current_day_log["logbook"].append({"hour": self.config.HOURS_IN_DAY, "row": "off-duty", "action": action})
             
             self._rotate_day()
             
             # PART 2
             remainder = duration - remaining_in_day
-            self.current_day_log["logbook"].append({"hour": 0.0, "row": "off-duty"})
             self.state.current_hour_of_day += remainder
             self.state.day_off_duty += remainder
-            self.current_day_log["logbook"].append({"hour": self.state.current_hour_of_day, "row": "off-duty", "action": action})
+            self.day_segments.record(0.0, self.state.current_hour_of_day, "off-duty", action)
         else:
-            self.current_day_log["logbook"].append({"hour": self.state.current_hour_of_day, "row": "off-duty"})
+            start = self.state.current_hour_of_day
             self.state.current_hour_of_day += duration
             self.state.day_off_duty += duration
-            self.current_day_log["logbook"].append({"hour": self.state.current_hour_of_day, "row": "off-duty", "action": action})
+            self.day_segments.record(start, self.state.current_hour_of_day, "off-duty", action)
         
         if duration >= self.config.MANDATORY_BREAK_DURATION: self.state.hrs_since_last_break = 0
         
     def _log_on_duty(self, duration: float, action: str):
         remaining_in_day = self.config.HOURS_IN_DAY - self.state.current_hour_of_day
         if duration > remaining_in_day:
-            self.current_day_log["logbook"].append({"hour": self.state.current_hour_of_day, "row": "on-duty"})
+            self.day_segments.record(self.state.current_hour_of_day, self.config.HOURS_IN_DAY, "on-duty", action)
             self.state.day_on_duty += remaining_in_day
             self.state.current_hour_of_day = self.config.HOURS_IN_DAY
-            self.current_day_log["logbook"].append({"hour": self.config.HOURS_IN_DAY, "row": "on-duty", "action": action})
             self._rotate_day()
             remainder = duration - remaining_in_day
-            self.current_day_log["logbook"].append({"hour": 0.0, "row": "on-duty"})
             self.state.current_hour_of_day += remainder
             self.state.day_on_duty += remainder
-            self.current_day_log["logbook"].append({"hour": self.state.current_hour_of_day, "row": "on-duty", "action": action})
+            self.day_segments.record(0.0, self.state.current_hour_of_day, "on-duty", action)
         else:
-            self.current_day_log["logbook"].append({"hour": self.state.current_hour_of_day, "row": "on-duty"})
+            start = self.state.current_hour_of_day
             self.state.current_hour_of_day += duration
             self.state.day_on_duty += duration
-            self.current_day_log["logbook"].append({"hour": self.state.current_hour_of_day, "row": "on-duty", "action": action})
+            self.day_segments.record(start, self.state.current_hour_of_day, "on-duty", action)
         
         self.state.daily_duty_hrs += duration
         self.state.hrs_since_last_break += duration
 
-    def _log_drive_step(self, is_start: bool):
+    def _log_drive_step(self):
        
         step = self.config.TIME_STEP
         remaining_in_day = self.config.HOURS_IN_DAY - self.state.current_hour_of_day
 
         if remaining_in_day < step:
             # Log the sliver of driving left today
-            if is_start: self.current_day_log["logbook"].append({"hour": self.state.current_hour_of_day, "row": "driving"})
+            self.day_segments.record(self.state.current_hour_of_day, self.config.HOURS_IN_DAY, "driving")
             self.state.day_driving += remaining_in_day
             self.state.current_hour_of_day = self.config.HOURS_IN_DAY
-            self.current_day_log["logbook"].append({"hour": self.config.HOURS_IN_DAY, "row": "driving"})
             
             self._rotate_day()
             
             # Log the rest in the next day
             remainder = step - remaining_in_day
-            self.current_day_log["logbook"].append({"hour": 0.0, "row": "driving"})
             self.state.current_hour_of_day += remainder
             self.state.day_driving += remainder
-            self.current_day_log["logbook"].append({"hour": self.state.current_hour_of_day, "row": "driving"})
+            self.day_segments.record(0.0, self.state.current_hour_of_day, "driving")
         else:
-            if is_start: self.current_day_log["logbook"].append({"hour": self.state.current_hour_of_day, "row": "driving"})
+            start = self.state.current_hour_of_day
             self.state.current_hour_of_day += step
             self.state.day_driving += step
-            self.current_day_log["logbook"].append({"hour": self.state.current_hour_of_day, "row": "driving"})
+            self.day_segments.record(start, self.state.current_hour_of_day, "driving")
 
         self.state.daily_driving_hrs += step
         self.state.daily_duty_hrs += step
@@ -147,36 +277,214 @@ class LogbookGenerator:
         self.state.total_trip_time_elapsed_hrs += step
         self.state.miles_since_refuel += (self.mph * step)
 
-    def generate(self, pickup_time_mins: float):
+    def _log_drive_block(self, steps: int):
+        """
+        Drive ``steps`` whole TIME_STEP slices at once. Segments, midnight
+        splits and accumulators match what ``_log_drive_step`` would
+        produce slice by slice.
+        """
+        step = self.config.TIME_STEP
+        state = self.state
+
+        while steps:
+            # Slices that end on or before midnight are logged in one go
+            fit = min(steps, self._steps_within(state.current_hour_of_day, self.config.HOURS_IN_DAY, step))
+            if fit:
+                start = state.current_hour_of_day
+                state.current_hour_of_day = _repeat_add(start, step, fit)
+                self.day_segments.record(start, state.current_hour_of_day, "driving")
+                state.day_driving = _repeat_add(state.day_driving, step, fit)
+                state.daily_driving_hrs = _repeat_add(state.daily_driving_hrs, step, fit)
+                state.daily_duty_hrs = _repeat_add(state.daily_duty_hrs, step, fit)
+                state.hrs_since_last_break = _repeat_add(state.hrs_since_last_break, step, fit)
+                state.total_trip_time_elapsed_hrs = _repeat_add(state.total_trip_time_elapsed_hrs, step, fit)
+                state.miles_since_refuel = _repeat_add(state.miles_since_refuel, self.mph * step, fit)
+                steps -= fit
+
+            if steps:
+                # The slice straddling midnight goes through the regular splitter
+                self._log_drive_step()
+                steps -= 1
+
+    @staticmethod
+    def _steps_until(current: float, limit: float, per_step: float) -> float:
+        """Smallest number of steps (at least one) after which ``current`` reaches ``limit``."""
+        if per_step <= 0:
+            return math.inf
+        quotient = (limit - current) / per_step
+        steps = max(1, math.ceil(quotient))
+        if abs(quotient - round(quotient)) < _BOUNDARY_TOLERANCE and not _sums_exactly(current, per_step):
+            # Right on a slice boundary: settle it the way the stepper adds
+            while steps > 1 and _repeat_add(current, per_step, steps - 1) >= limit:
+                steps -= 1
+            while _repeat_add(current, per_step, steps) < limit:
+                steps += 1
+        return steps
+
+    @staticmethod
+    def _steps_within(current: float, limit: float, per_step: float) -> int:
+        """Largest number of whole steps that keep ``current`` at or below ``limit``."""
+        quotient = (limit - current) / per_step
+        steps = max(0, math.floor(quotient))
+        if abs(quotient - round(quotient)) < _BOUNDARY_TOLERANCE and not _sums_exactly(current, per_step):
+            while steps > 0 and _repeat_add(current, per_step, steps) > limit:
+                steps -= 1
+            while _repeat_add(current, per_step, steps + 1) <= limit:
+                steps += 1
+        return steps
+
+    def _steps_to_next_event(self, pickup_time_hrs: float) -> int:
+        """
+        Slices of driving until the first of: 11h drive limit, 14h window,
+        8h break, refuel threshold, pickup, cycle restart or end of trip.
+        """
+        config = self.config
+        state = self.state
+        step = config.TIME_STEP
+        candidates = [
+            self._steps_until(state.total_trip_time_elapsed_hrs, self.total_driving_required_hrs, step),
+            self._steps_until(state.daily_driving_hrs, config.MAX_DRIVING_TIME, step),
+            self._steps_until(state.daily_duty_hrs, config.MAX_DUTY_WINDOW, step),
+            self._steps_until(state.hrs_since_last_break, config.BREAK_REQUIRED_AFTER, step),
+            self._steps_until(state.miles_since_refuel, config.REFUEL_THRESHOLD_MILES, self.mph * step),
+        ]
+        if not self.has_performed_pickup:
+            candidates.append(self._steps_until(state.total_trip_time_elapsed_hrs, pickup_time_hrs, step))
+        if self.allow_restart:
+            candidates.append(self._steps_before_restart())
+        return min(candidates)
+
+    def _steps_before_restart(self) -> int:
+        """
+        Slices that can be driven before ``_restart_due`` fires, stopping at
+        midnight since the cycle totals are rebased there.
+        """
+        config = self.config
+        step = config.TIME_STEP
+        day_driving = self.state.day_driving
+
+        def fits(steps):
+            used = self._cycle_hours_used(_repeat_add(day_driving, step, steps))
+            return used + step <= config.MAX_WEEKLY_CYCLE
+
+        steps = max(1, math.floor((config.MAX_WEEKLY_CYCLE - step - self._cycle_hours_used()) / step) + 1)
+        while steps > 1 and not fits(steps - 1):
+            steps -= 1
+        while fits(steps):
+            steps += 1
+        within_day = self._steps_within(self.state.current_hour_of_day, config.HOURS_IN_DAY, step)
+        return min(steps, max(1, within_day))
+
+    def _next_on_duty_hrs(self, pickup_time_hrs: float) -> float:
+        """Length of the next block of on-duty time the trip will log."""
+        if self.state.miles_since_refuel >= self.config.REFUEL_THRESHOLD_MILES:
+            return self.config.REFUEL_DURATION
+        if not self.has_performed_pickup and (self.state.total_trip_time_elapsed_hrs >= pickup_time_hrs):
+            return self.config.PICKUP_DURATION
+        return self.config.TIME_STEP
+
+    def _log_due_duty_change(self, pickup_time_hrs: float) -> bool:
+        """Log the highest-priority duty change that is due right now, if any."""
+        if self.allow_restart and self._restart_due(self._next_on_duty_hrs(pickup_time_hrs)):
+            self._log_cycle_restart()
+            return True
+        if self.state.daily_driving_hrs >= self.config.MAX_DRIVING_TIME or self.state.daily_duty_hrs >= self.config.MAX_DUTY_WINDOW:
+            self._log_sleeper(self.config.SLEEPER_BERTH_REQUIRED)
+            return True
+        if self.state.hrs_since_last_break >= self.config.BREAK_REQUIRED_AFTER:
+            self._log_off_duty(self.config.MANDATORY_BREAK_DURATION, "30-minute break")
+            return True
+        if self.state.miles_since_refuel >= self.config.REFUEL_THRESHOLD_MILES:
+            self._log_on_duty(self.config.REFUEL_DURATION, "Refueling")
+            self.state.miles_since_refuel = 0
+            return True
+        if not self.has_performed_pickup and (self.state.total_trip_time_elapsed_hrs >= pickup_time_hrs):
+            self._log_on_duty(self.config.PICKUP_DURATION, "Pickup")
+            self.has_performed_pickup = True
+            return True
+        return False
+
+    def _drain_sealed_days(self):
+        while self._sealed_days:
+            yield self._sealed_days.popleft()
+
+    def iter_days(self, pickup_time_mins: float):
+        """
+        Run the simulation, yielding each day's log as soon as
+        ``_finalize_day`` seals it. Sealed days and their SegmentStores
+        are not kept around unless ``keep_segments`` is set.
+        """
         pickup_time_hrs = pickup_time_mins / self.config.MINUTES_PER_HOUR
-        has_performed_pickup = False
+        self.has_performed_pickup = False
         
         self._log_off_duty(self.config.INITIAL_REST_DURATION) 
+        if self._restart_due(self.config.PRE_TRIP_DURATION):
+            self._log_cycle_restart()
         self._log_on_duty(self.config.PRE_TRIP_DURATION, "Pre-trip/TIV")
+        yield from self._drain_sealed_days()
+        yield from self._drive_to_drop_off(pickup_time_hrs)
 
+    def resume_days(self, checkpoint: "GeneratorCheckpoint", pickup_time_mins: float):
+        """
+        Continue a simulation from ``checkpoint``, yielding only the days
+        sealed after it. The caller keeps the ``checkpoint.day_index`` days
+        before it from the run that recorded the checkpoint.
+        """
+        self._restore(checkpoint)
+        yield from self._drive_to_drop_off(pickup_time_mins / self.config.MINUTES_PER_HOUR)
+
+    def _drive_to_drop_off(self, pickup_time_hrs: float):
         while self.state.total_trip_time_elapsed_hrs < self.total_driving_required_hrs:
-            if self.state.daily_driving_hrs >= self.config.MAX_DRIVING_TIME or self.state.daily_duty_hrs >= self.config.MAX_DUTY_WINDOW:
-                self._log_sleeper(self.config.SLEEPER_BERTH_REQUIRED)
-                continue
-            if self.state.hrs_since_last_break >= self.config.BREAK_REQUIRED_AFTER:
-                self._log_off_duty(self.config.MANDATORY_BREAK_DURATION, "30-minute break")
-                continue
-            if self.state.miles_since_refuel >= self.config.REFUEL_THRESHOLD_MILES:
-                self._log_on_duty(self.config.REFUEL_DURATION, "Refueling")
-                self.state.miles_since_refuel = 0
-                continue
-            if not has_performed_pickup and (self.state.total_trip_time_elapsed_hrs >= pickup_time_hrs):
-                self._log_on_duty(self.config.PICKUP_DURATION, "Pickup")
-                has_performed_pickup = True
-                continue
-
-            is_new_block = (not self.current_day_log["logbook"] or 
-                            self.current_day_log["logbook"][-1]["row"] != "driving")
-            self._log_drive_step(is_start=is_new_block)
+            if self._checkpoint_due:
+                self.checkpoints.append(self._snapshot())
+                self._checkpoint_due = False
+
+            self.iterations += 1
+            if not self._log_due_duty_change(pickup_time_hrs):
+                if self.engine == ENGINE_EVENT:
+                    self._log_drive_block(self._steps_to_next_event(pickup_time_hrs))
+                else:
+                    self._log_drive_step()
 
+            if self._sealed_days:
+                yield from self._drain_sealed_days()
+
+        if self._restart_due(self.config.POST_TRIP_DURATION):
+            self._log_cycle_restart()
         self._log_on_duty(self.config.POST_TRIP_DURATION, "Drop-off")
+        self.completed_at_hrs = self.day_index * self.config.HOURS_IN_DAY + self.state.current_hour_of_day
         if self.state.current_hour_of_day < self.config.HOURS_IN_DAY:
             self._log_off_duty(self.config.HOURS_IN_DAY - self.state.current_hour_of_day)
         
         self._finalize_day()
+        yield from self._drain_sealed_days()
+
+    def _snapshot(self) -> "GeneratorCheckpoint":
+        return GeneratorCheckpoint(
+            day_index=self.day_index,
+            iterations=self.iterations,
+            has_performed_pickup=self.has_performed_pickup,
+            state=replace(self.state),
+            day_log=dict(self.current_day_log),
+            day_segments=self.day_segments.copy(),
+            cycle_days=tuple(self._cycle_days),
+            cycle_window_hrs=self._cycle_window_hrs,
+            cycle_day_offset=self._cycle_day_offset,
+        )
+
+    def _restore(self, checkpoint: "GeneratorCheckpoint"):
+        self.day_index = checkpoint.day_index
+        self.iterations = checkpoint.iterations
+        self.has_performed_pickup = checkpoint.has_performed_pickup
+        self.state = replace(checkpoint.state)
+        self.current_day_log = dict(checkpoint.day_log)
+        self.day_segments = checkpoint.day_segments.copy()
+        self.segments = []
+        self._cycle_days = deque(checkpoint.cycle_days, maxlen=self.config.CYCLE_DAYS - 1)
+        self._cycle_window_hrs = checkpoint.cycle_window_hrs
+        self._cycle_day_offset = checkpoint.cycle_day_offset
+
+    def generate(self, pickup_time_mins: float):
+        self.keep_segments = True
+        self.logbooks.extend(self.iter_days(pickup_time_mins))
         return self.logbooks
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from logs.benchmarks import TARGETS, compare_to_baseline, load_report, run_benchmarks, save_report
+
+
+class Command(BaseCommand):
+    help = "Benchmark the HOS engine and API path over a grid of trips and check for regressions."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--target", action="append", choices=TARGETS, help="Limit to one target (repeatable).")
+        parser.add_argument("--repeat", type=int, default=20, help="Timed runs per trip.")
+        parser.add_argument("--output", type=Path, help="Write this run's report to a JSON file.")
+        parser.add_argument("--baseline", type=Path, default=settings.HOS_BENCHMARK["BASELINE_PATH"])
+        parser.add_argument("--budget", type=float, default=settings.HOS_BENCHMARK["REGRESSION_BUDGET"])
+        parser.add_argument("--update-baseline", action="store_true", help="Save this run as the new baseline.")
+
+    def handle(self, *args, **options):
+        report = run_benchmarks(targets=options["target"], repeat=options["repeat"])
+
+        for target, summary in report["summary"].items():
+            throughput = f"  {summary['days_per_sec']:10.1f} days/s" if "days_per_sec" in summary else ""
+            self.stdout.write(
+                f"{target:<16} p50 {summary['p50_ms']:8.3f} ms  p95 {summary['p95_ms']:8.3f} ms  "
+                f"p99 {summary['p99_ms']:8.3f} ms  peak {summary['peak_alloc_kib']:9.2f} KiB{throughput}"
+            )
+
+        if options["output"]:
+            save_report(report, options["output"])
+        if options["update_baseline"]:
+            save_report(report, options["baseline"])
+            self.stdout.write(self.style.SUCCESS(f"Baseline saved to {options['baseline']}"))
+            return
+
+        baseline = load_report(options["baseline"])
+        if baseline is None:
+            self.stdout.write(f"No baseline at {options['baseline']}; run with --update-baseline to create one.")
+            return
+
+        regressions = compare_to_baseline(report, baseline, options["budget"])
+        if regressions:
+            raise CommandError("Benchmark regressions:\n" + "\n".join(regressions))
+        self.stdout.write(self.style.SUCCESS("No regressions against the baseline."))
@@ -0,0 +1,43 @@
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from logs.services import TripInputError
+from logs.trip_import import FORMATS, guess_format, import_trips
+
+
+class Command(BaseCommand):
+    help = "Bulk import trips into LogbookTrip from a CSV or NDJSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import, or - for standard input.")
+        parser.add_argument("--format", choices=FORMATS, help="Input format (default: from the file extension).")
+        parser.add_argument("--chunk-size", type=int, default=settings.LOGBOOK_TRIP_IMPORT["CHUNK_SIZE"])
+        parser.add_argument("--max-errors", type=int, default=settings.LOGBOOK_TRIP_IMPORT["MAX_ERRORS"],
+                            help="Rejected rows to list; all of them are counted.")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        input_format = options["format"] or guess_format(path)
+        if input_format is None:
+            raise CommandError(f"Cannot tell the format of {path}; pass --format.")
+
+        stream = sys.stdin.buffer if path == "-" else open(path, "rb")
+        try:
+            report = import_trips(
+                stream, input_format, chunk_size=options["chunk_size"], max_errors=options["max_errors"]
+            )
+        except TripInputError as e:
+            raise CommandError(str(e))
+        finally:
+            if stream is not sys.stdin.buffer:
+                stream.close()
+
+        for error in report.errors:
+            details = "; ".join(f"{name} {message}" for name, message in error["errors"].items())
+            self.stderr.write(f"line {error['line']}: {details}")
+        self.stdout.write(
+            f"Imported {report.imported} of {report.rows} rows with {report.method} "
+            f"in {report.wall_time_ms / 1000:.1f} s; {report.error_count} rejected."
+        )
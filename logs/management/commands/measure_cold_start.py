@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from logs.cold_start import PROBES, PROFILES, measure_profile
+
+
+class Command(BaseCommand):
+    help = "Measure import time, first-request and steady-state latency of each deployment profile."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--profile", action="append", choices=list(PROFILES), help="Limit to one profile (repeatable).")
+        parser.add_argument("--requests", type=int, default=200, help="Steady-state requests per probe.")
+
+    def handle(self, *args, **options):
+        for profile in options["profile"] or PROFILES:
+            result = measure_profile(profile, options["requests"])
+            self.stdout.write(f"{profile:<16} import {result['import_ms']:8.1f} ms")
+            for name in PROBES:
+                probe = result[name]
+                self.stdout.write(
+                    f"  {name:<18} {probe['status']:<16} first {probe['first_ms']:7.2f} ms  "
+                    f"p50 {probe['p50_ms']:7.3f} ms  p95 {probe['p95_ms']:7.3f} ms"
+                )
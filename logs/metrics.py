@@ -0,0 +1,197 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+from django.conf import settings
+
+
+def _format_labels(labelnames: tuple, labelvalues: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """Monotonic counter, optionally split by labels. Safe to bump from any thread."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues, amount: float = 1.0):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues) -> float:
+        with self._lock:
+            return self._values.get(labelvalues, 0.0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}" for labels, value in values]
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense, optionally split by labels."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: tuple, labelnames: tuple = ()):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.labelnames = labelnames
+        self._series: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                # Per-bucket counts (+Inf last), sum, count
+                series = self._series[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *labelvalues) -> int:
+        with self._lock:
+            series = self._series.get(labelvalues)
+            return series[2] if series else 0
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            snapshot = sorted((labels, (list(counts), total, count)) for labels, (counts, total, count) in self._series.items())
+        lines = []
+        for labels, (counts, total, count) in snapshot:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += bucket_count
+                le = bound if bound == "+Inf" else _format_value(bound)
+                bucket_labels = _format_labels(self.labelnames, labels, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+REQUESTS = REGISTRY.register(Counter(
+    "logbook_requests_total", "generate_logbook requests by HTTP status.", ("status",),
+))
+REQUEST_LATENCY = REGISTRY.register(Histogram(
+    "logbook_request_duration_seconds", "End-to-end generate_logbook latency inside the view.",
+    (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+))
+STAGE_LATENCY = REGISTRY.register(Histogram(
+    "logbook_stage_duration_seconds", "Time spent per generate_logbook stage.",
+    (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+    ("stage",),
+))
+SIMULATED_DAYS = REGISTRY.register(Histogram(
+    "logbook_simulated_days", "Days per generated logbook.",
+    (1, 2, 3, 5, 7, 10, 14, 21, 28, 42),
+))
+LOGBOOK_ENTRIES = REGISTRY.register(Histogram(
+    "logbook_entries_per_trip", "Duty-status points per generated logbook.",
+    (10, 25, 50, 100, 250, 500, 1000, 2500),
+))
+AUDIT_RECORDS = REGISTRY.register(Counter(
+    "logbook_audit_records_total", "Audit records by fate: written, dropped (queue full) or failed.", ("result",),
+))
+
+
+class RequestTimer:
+    """Collects per-stage timings for one request and publishes them when it finishes."""
+
+    __slots__ = ("started", "stages", "days", "entries")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: list[tuple[str, float]] = []
+        self.days = None
+        self.entries = None
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append((name, time.perf_counter() - started))
+
+    def record_logbook(self, logbooks: list[dict]):
+        self.days = len(logbooks)
+        self.entries = sum(len(day["logbook"]) for day in logbooks)
+
+    def server_timing(self) -> str:
+        return ", ".join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in self.stages)
+
+    def finish(self, response):
+        REQUESTS.inc(str(response.status_code))
+        REQUEST_LATENCY.observe(time.perf_counter() - self.started)
+        for name, seconds in self.stages:
+            STAGE_LATENCY.observe(seconds, name)
+        if self.days is not None:
+            SIMULATED_DAYS.observe(self.days)
+            LOGBOOK_ENTRIES.observe(self.entries)
+        if self.stages:
+            response["Server-Timing"] = self.server_timing()
+        return response
+
+
+class NullTimer:
+    """Stand-in used when metrics are disabled: every call is a no-op."""
+
+    __slots__ = ()
+    _stage = nullcontext()
+
+    def stage(self, name: str):
+        return self._stage
+
+    def record_logbook(self, logbooks: list[dict]):
+        pass
+
+    def finish(self, response):
+        return response
+
+
+NULL_TIMER = NullTimer()
+
+
+def start_request_timer() -> RequestTimer | NullTimer:
+    if not settings.LOGBOOK_METRICS["ENABLED"]:
+        return NULL_TIMER
+    return RequestTimer()
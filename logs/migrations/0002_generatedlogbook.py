@@ -0,0 +1,22 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GeneratedLogbook',
+            fields=[
+                ('trip', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='generated_logbook', serialize=False, to='logs.logbooktrip')),
+                ('etag', models.CharField(max_length=64)),
+                ('engine_version', models.PositiveIntegerField()),
+                ('content', models.BinaryField()),
+                ('generated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
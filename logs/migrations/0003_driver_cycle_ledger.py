@@ -0,0 +1,38 @@
+# Generated by Django 6.1.2 on 2026-10-17 19:41
+
+import django.db.models.deletion
+import logs.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logs', '0002_generatedlogbook'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Driver',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=120)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('ledger_date', models.DateField(blank=True, null=True)),
+                ('ledger_ring', models.JSONField(default=logs.models._empty_ledger_ring)),
+                ('ledger_total', models.FloatField(default=0.0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='DriverDutyDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('on_duty_hrs', models.FloatField(default=0.0)),
+                ('driver', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='duty_days', to='logs.driver')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('driver', 'date'), name='unique_driver_duty_day')],
+            },
+        ),
+    ]
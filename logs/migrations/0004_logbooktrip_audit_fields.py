@@ -0,0 +1,44 @@
+# Generated by Django 6.1.2 on 2026-10-17 20:04
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logs', '0003_driver_cycle_ledger'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='logbooktrip',
+            name='allow_restart',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='logbooktrip',
+            name='days',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logbooktrip',
+            name='engine',
+            field=models.CharField(blank=True, default='', max_length=8),
+        ),
+        migrations.AddField(
+            model_name='logbooktrip',
+            name='error',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='logbooktrip',
+            name='outcome',
+            field=models.CharField(blank=True, choices=[('generated', 'Generated'), ('rejected', 'Rejected')], default='', max_length=16),
+        ),
+        migrations.AlterField(
+            model_name='logbooktrip',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.1.2 on 2026-10-17 20:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logs', '0004_logbooktrip_audit_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='logbooktrip',
+            index=models.Index(fields=['created_at', 'id'], name='logbooktrip_created_id'),
+        ),
+    ]
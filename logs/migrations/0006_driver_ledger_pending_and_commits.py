@@ -0,0 +1,32 @@
+# Generated by Django 6.1.2 on 2026-10-17 20:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logs', '0005_logbooktrip_created_id_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='driver',
+            name='ledger_pending',
+            field=models.JSONField(default=dict),
+        ),
+        migrations.CreateModel(
+            name='DriverTripCommit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64)),
+                ('start_date', models.DateField()),
+                ('committed_at', models.DateTimeField(auto_now_add=True)),
+                ('driver', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='trip_commits', to='logs.driver')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('driver', 'key'), name='unique_driver_trip_commit')],
+            },
+        ),
+    ]
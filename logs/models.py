@@ -1,11 +1,175 @@
+import zlib
+from datetime import date, timedelta
+
 from django.db import models
+from django.utils import timezone
+
+from .config import HOSConfig
+
+
+def _empty_ledger_ring():
+    return [0.0] * HOSConfig.CYCLE_DAYS
+
 
 class LogbookTrip(models.Model):
-    created_at = models.DateTimeField(auto_now_add=True)
+    """
+    A saved trip, or an audit record of one generation request. Audit
+    records carry an ``outcome``; trips saved through the API leave it blank.
+    """
+    OUTCOME_GENERATED = "generated"
+    OUTCOME_REJECTED = "rejected"
+    OUTCOME_CHOICES = [(OUTCOME_GENERATED, "Generated"), (OUTCOME_REJECTED, "Rejected")]
+
+    # Set explicitly by the audit recorder, which writes after the request
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
     total_distance_miles = models.FloatField()
     total_driving_time_mins = models.FloatField()
     pickup_time_mins = models.FloatField()
     current_cycle_hour = models.FloatField(default=0.0)
-    
+    engine = models.CharField(max_length=8, blank=True, default="")
+    allow_restart = models.BooleanField(default=False)
+    outcome = models.CharField(max_length=16, blank=True, default="", choices=OUTCOME_CHOICES)
+    error = models.CharField(max_length=255, blank=True, default="")
+    days = models.PositiveIntegerField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Keyset order of the trip list and export
+            models.Index(fields=["created_at", "id"], name="logbooktrip_created_id"),
+        ]
+
+    def __str__(self):
+        return f"Trip {self.id} - {self.total_distance_miles} miles"
+
+
+class GeneratedLogbook(models.Model):
+    """
+    Rendered logbook JSON of a trip, zlib-compressed into one row. ``etag``
+    covers the trip inputs, HOS config and engine version, so a stored
+    logbook is only reused while all three still match.
+    """
+    trip = models.OneToOneField(
+        LogbookTrip, on_delete=models.CASCADE, primary_key=True, related_name="generated_logbook"
+    )
+    etag = models.CharField(max_length=64)
+    engine_version = models.PositiveIntegerField()
+    content = models.BinaryField()
+    generated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Logbook for trip {self.trip_id}"
+
+    @staticmethod
+    def compress(content: bytes) -> bytes:
+        return zlib.compress(content, 6)
+
+    def rendered_content(self) -> bytes:
+        return zlib.decompress(self.content)
+
+
+class Driver(models.Model):
+    """
+    A driver and their rolling cycle ledger: on-duty hours of the
+    CYCLE_DAYS days ending on ``ledger_date``, kept in a ring indexed by
+    date ordinal together with its running sum. The window ends on the
+    start date of the latest committed trip, so a multi-day trip does not
+    push it into the future; its later days wait in ``ledger_pending`` until
+    the window reaches them. Reading or advancing the window touches at
+    most CYCLE_DAYS slots plus the pending days, never the day history.
+    """
+    name = models.CharField(max_length=120)
+    created_at = models.DateTimeField(auto_now_add=True)
+    ledger_date = models.DateField(null=True, blank=True)
+    ledger_ring = models.JSONField(default=_empty_ledger_ring)
+    ledger_total = models.FloatField(default=0.0)
+    # Hours of days after ledger_date, by date ordinal (as a string key)
+    ledger_pending = models.JSONField(default=dict)
+
+    def __str__(self):
+        return f"Driver {self.id} - {self.name}"
+
+    def _expiring_days(self, on_date: date) -> range:
+        """Ordinals that drop out of the window when it moves forward to ``on_date``."""
+        newest = self.ledger_date.toordinal()
+        shift = min(on_date.toordinal() - newest, HOSConfig.CYCLE_DAYS)
+        oldest = newest - HOSConfig.CYCLE_DAYS + 1
+        return range(oldest, oldest + shift)
+
+    def cycle_hours_on(self, on_date: date) -> float:
+        """On-duty hours in the CYCLE_DAYS-day window ending on ``on_date``."""
+        if self.ledger_date is None:
+            return 0.0
+        if on_date < self.ledger_date:
+            # Looking back past the ring needs the day history
+            window_start = on_date - timedelta(days=HOSConfig.CYCLE_DAYS - 1)
+            days = self.duty_days.filter(date__gte=window_start, date__lte=on_date)
+            return round(sum(days.values_list("on_duty_hrs", flat=True)), 2)
+        expired = sum(self.ledger_ring[day % HOSConfig.CYCLE_DAYS] for day in self._expiring_days(on_date))
+        last = on_date.toordinal()
+        pending = sum(
+            hours for day, hours in self.ledger_pending.items() if last - HOSConfig.CYCLE_DAYS < int(day) <= last
+        )
+        return round(max(self.ledger_total - expired, 0.0) + pending, 2)
+
+    def advance_ledger(self, on_date: date):
+        """Move the window forward so it ends on ``on_date``, folding in the pending days it reaches."""
+        if self.ledger_date is None:
+            self.ledger_date = on_date
+        elif on_date > self.ledger_date:
+            for day in self._expiring_days(on_date):
+                slot = day % HOSConfig.CYCLE_DAYS
+                self.ledger_total -= self.ledger_ring[slot]
+                self.ledger_ring[slot] = 0.0
+            self.ledger_date = on_date
+        last = on_date.toordinal()
+        for day in [day for day in self.ledger_pending if int(day) <= last]:
+            hours = self.ledger_pending.pop(day)
+            if int(day) > last - HOSConfig.CYCLE_DAYS:
+                self.ledger_ring[int(day) % HOSConfig.CYCLE_DAYS] += hours
+                self.ledger_total += hours
+
+    def add_to_ledger(self, on_date: date, hours: float):
+        """
+        Count ``hours`` of on-duty time on ``on_date``: in the ring if it is
+        inside the window, as pending if it comes after it.
+        """
+        if self.ledger_date is None:
+            self.ledger_date = on_date
+        day = on_date.toordinal()
+        newest = self.ledger_date.toordinal()
+        if day > newest:
+            self.ledger_pending[str(day)] = self.ledger_pending.get(str(day), 0.0) + hours
+        elif day > newest - HOSConfig.CYCLE_DAYS:
+            self.ledger_ring[day % HOSConfig.CYCLE_DAYS] += hours
+            self.ledger_total += hours
+
+
+class DriverDutyDay(models.Model):
+    """On-duty (driving included) hours a driver logged on one calendar day."""
+    driver = models.ForeignKey(Driver, on_delete=models.CASCADE, related_name="duty_days")
+    date = models.DateField()
+    on_duty_hrs = models.FloatField(default=0.0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["driver", "date"], name="unique_driver_duty_day"),
+        ]
+
+    def __str__(self):
+        return f"Driver {self.driver_id} on {self.date}: {self.on_duty_hrs}h"
+
+
+class DriverTripCommit(models.Model):
+    """A trip committed to a driver's ledger, so committing it again changes nothing."""
+    driver = models.ForeignKey(Driver, on_delete=models.CASCADE, related_name="trip_commits")
+    key = models.CharField(max_length=64)
+    start_date = models.DateField()
+    committed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["driver", "key"], name="unique_driver_trip_commit"),
+        ]
+
     def __str__(self):
-        return f"Trip {self.id} - {self.total_distance_miles} miles"
\ No newline at end of file
+        return f"Driver {self.driver_id} trip from {self.start_date}"
@@ -0,0 +1,89 @@
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+# Keyset of the trip list, backed by the logbooktrip_created_id index
+TRIP_ORDERING = ("created_at", "id")
+
+
+def encode_cursor(created_at: datetime, pk: int) -> str:
+    return urlsafe_b64encode(f"{created_at.isoformat()}|{pk}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """(created_at, id) of the last row of the previous page. Raises ValueError if malformed."""
+    try:
+        text = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(cursor) from e
+    created_at, _, pk = text.rpartition("|")
+    return datetime.fromisoformat(created_at), int(pk)
+
+
+class TripKeysetPagination(BasePagination):
+    """
+    Forward-only keyset pagination over ``(created_at, id)``. The cursor is
+    the key of the last row served, and the next page is the rows after it,
+    so page N costs an index range scan
+    instead of the OFFSET N * page_size that page-number pagination reads
+    and discards. Rows written after the first page appear at the end.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_page_size(self, request) -> int:
+        options = settings.LOGBOOK_TRIP_LIST
+        try:
+            requested = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return options["PAGE_SIZE"]
+        return min(max(requested, 1), options["MAX_PAGE_SIZE"])
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*TRIP_ORDERING)
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            try:
+                position = decode_cursor(cursor)
+            except ValueError:
+                raise NotFound(self.invalid_cursor_message)
+            created_at, pk = position
+            queryset = queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk))
+
+        # One extra row tells whether there is a next page without a COUNT
+        rows = list(queryset[:page_size + 1])
+        self.has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        self.next_position = (rows[-1].created_at, rows[-1].pk) if self.has_next else None
+        return rows
+
+    def get_next_link(self) -> str | None:
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, encode_cursor(*self.next_position))
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
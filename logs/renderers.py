@@ -0,0 +1,88 @@
+import csv
+import io
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+from .json_encoding import render_logbook_json
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Newline-delimited JSON: one compact JSON document per list item."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        items = data if isinstance(data, list) else [data]
+        return b"".join(render_ndjson_line(item) for item in items)
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    CSV of a dict or a list of dicts, header row from the first one's keys.
+    Exports stream their own rows; this renders their error responses.
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        items = data if isinstance(data, list) else [data]
+        buffer = io.StringIO()
+        if items:
+            writer = csv.DictWriter(buffer, fieldnames=list(items[0]), extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(items)
+        return buffer.getvalue().encode(self.charset)
+
+
+class SVGRenderer(BaseRenderer):
+    """
+    ``LogbookDays`` drawn as one SVG document of duty-status grids. Other
+    data (error responses) becomes a one-line SVG of its message.
+    """
+
+    media_type = "image/svg+xml"
+    format = "svg"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # Drawing code is only loaded by clients that ask for SVG
+        from .svg_logbook import iter_svg_document, render_message
+
+        if data is None:
+            return b""
+        segments = getattr(data, "segments", None)
+        if segments is not None:
+            return b"".join(iter_svg_document(data, segments))
+        message = (data.get("error") or data.get("detail")) if isinstance(data, dict) else None
+        return render_message(str(message or data))
+
+
+class LogbookJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that writes ``LogbookDays`` through the logbook encoder.
+    Any other data, an indented response or non-default JSON settings take
+    the generic path, so endpoints can list it in place of JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        segments = getattr(data, "segments", None)
+        generic = (
+            segments is None
+            or self.ensure_ascii or not self.compact or not self.strict
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        )
+        if generic:
+            return super().render(data, accepted_media_type, renderer_context)
+        return render_logbook_json(data, segments)
+
+
+def render_ndjson_line(item) -> bytes:
+    return JSONRenderer().render(item) + b"\n"
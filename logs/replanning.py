@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+
+from .config import HOSConfig
+from .logbook_generator import ENGINE_EVENT, GeneratorCheckpoint, LogbookGenerator
+
+
+@dataclass(frozen=True)
+class PlanParams:
+    total_dist: float
+    total_time_mins: float
+    pickup_time_mins: float
+    current_cycle_hour: float = 0.0
+    allow_restart: bool = False
+
+
+@dataclass
+class CheckpointedPlan:
+    """A generated logbook plus the day-boundary checkpoints recorded while producing it."""
+    params: PlanParams
+    config: HOSConfig
+    mph: float
+    logbooks: list[dict]
+    checkpoints: list[GeneratorCheckpoint]
+    # Days actually simulated for this plan, the rest came from a previous one
+    simulated_days: int
+
+
+def _generator(params: PlanParams, config: HOSConfig, engine: str) -> LogbookGenerator:
+    return LogbookGenerator(
+        params.total_dist,
+        params.total_time_mins,
+        config,
+        current_cycle_hour=params.current_cycle_hour,
+        engine=engine,
+        allow_restart=params.allow_restart,
+        record_checkpoints=True,
+    )
+
+
+def plan_with_checkpoints(params: PlanParams, config: HOSConfig | None = None, engine: str = ENGINE_EVENT) -> CheckpointedPlan:
+    config = config or HOSConfig()
+    generator = _generator(params, config, engine)
+    logbooks = generator.generate(pickup_time_mins=params.pickup_time_mins)
+    return CheckpointedPlan(params, config, generator.mph, logbooks, generator.checkpoints, len(logbooks))
+
+
+def checkpoint_is_valid(checkpoint: GeneratorCheckpoint, plan: CheckpointedPlan, params: PlanParams, mph: float) -> bool:
+    """
+    True when the simulation under ``params`` would reach exactly the same
+    state at ``checkpoint`` as the plan that recorded it.
+
+    Everything before a checkpoint depends only on the config, the cycle
+    inputs and the speed. The trip length only matters once driving reaches
+    it. The pickup only matters once it is due, or must be unchanged if it
+    already happened.
+    """
+    old = plan.params
+    if mph != plan.mph:
+        return False
+    if (params.current_cycle_hour, params.allow_restart) != (old.current_cycle_hour, old.allow_restart):
+        return False
+    if params.total_time_mins / plan.config.MINUTES_PER_HOUR <= checkpoint.elapsed_driving_hrs:
+        return False
+    if checkpoint.has_performed_pickup:
+        return params.pickup_time_mins == old.pickup_time_mins
+    return params.pickup_time_mins / plan.config.MINUTES_PER_HOUR > checkpoint.elapsed_driving_hrs
+
+
+def replan(plan: CheckpointedPlan, params: PlanParams, engine: str = ENGINE_EVENT) -> CheckpointedPlan:
+    """
+    Logbook for ``params`` that reuses the days of ``plan`` up to its last
+    checkpoint still valid under the new parameters. Only the days after
+    it are simulated again. Falls back to a full run when no checkpoint
+    survives the change.
+    """
+    generator = _generator(params, plan.config, engine)
+
+    # Checkpoints are in time order and validity only ever shrinks with time
+    resume_from = None
+    for index in range(len(plan.checkpoints) - 1, -1, -1):
+        if checkpoint_is_valid(plan.checkpoints[index], plan, params, generator.mph):
+            resume_from = index
+            break
+    if resume_from is None:
+        return plan_with_checkpoints(params, plan.config, engine)
+
+    checkpoint = plan.checkpoints[resume_from]
+    suffix = list(generator.resume_days(checkpoint, params.pickup_time_mins))
+    return CheckpointedPlan(
+        params=params,
+        config=plan.config,
+        mph=generator.mph,
+        logbooks=plan.logbooks[:checkpoint.day_index] + suffix,
+        checkpoints=plan.checkpoints[:resume_from + 1] + generator.checkpoints,
+        simulated_days=len(suffix),
+    )
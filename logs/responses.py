@@ -0,0 +1,32 @@
+import json
+
+from rest_framework.response import Response
+
+
+class PreRenderedResponse(Response):
+    """
+    DRF response whose JSON body has already been rendered, e.g. served
+    from the result cache. ``data`` is decoded from the body only if some
+    caller actually reads it.
+    """
+
+    def __init__(self, content: bytes, data=None, **kwargs):
+        self.prerendered_content = content
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(data=data, **kwargs)
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = json.loads(self.prerendered_content)
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+
+    @property
+    def rendered_content(self):
+        # DRF normally sets the header while rendering, which is skipped here
+        self["Content-Type"] = self.content_type
+        return self.prerendered_content
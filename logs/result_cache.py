@@ -0,0 +1,168 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .config import HOSConfig
+from .logbook_generator import ENGINE_VERSION
+from .services import TripRequest
+
+
+def config_fingerprint(config: HOSConfig) -> str:
+    """Short, stable digest of every HOSConfig field value."""
+    payload = json.dumps(asdict(config), sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def _canonical_number(value: float) -> str:
+    # 500, 500.0 and -0.0 style variants must land on the same key
+    value = float(value) + 0.0
+    return repr(value)
+
+
+def trip_cache_key(trip: TripRequest, config: HOSConfig) -> str:
+    parts = [
+        _canonical_number(trip.total_dist),
+        _canonical_number(trip.total_time_mins),
+        _canonical_number(trip.current_cycle_hour),
+        _canonical_number(trip.pickup_time),
+        trip.engine,
+        "restart" if trip.allow_restart else "no-restart",
+        str(ENGINE_VERSION),
+        config_fingerprint(config),
+    ]
+    for leg in trip.legs:
+        parts += [
+            _canonical_number(leg.distance_miles),
+            _canonical_number(leg.driving_time_mins),
+            "default" if leg.dwell_mins is None else _canonical_number(leg.dwell_mins),
+            leg.stop,
+        ]
+    digest = hashlib.sha256("|".join(parts).encode()).hexdigest()
+    return f"logbook:{digest}"
+
+
+class LogbookResultCache:
+    """
+    Rendered ``generate_logbook`` responses keyed on canonical trip inputs.
+
+    A per-process LRU, bounded by entry count and total bytes with an
+    optional TTL, sits in front of an optional Django cache backend that
+    every worker on the host shares (e.g. FileBasedCache). Eviction in the
+    shared tier is left to that backend's own culling.
+    """
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 64 * 1024 * 1024, ttl: float | None = None, shared_alias: str | None = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.shared = caches[shared_alias] if shared_alias else None
+
+        self._entries: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, content = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return content
+                self._discard(key)
+                self.expirations += 1
+
+        content = self.shared.get(key) if self.shared is not None else None
+        with self._lock:
+            if content is None:
+                self.misses += 1
+                return None
+            self.shared_hits += 1
+            self._store(key, content)
+        return content
+
+    def set(self, key: str, content: bytes):
+        with self._lock:
+            self._store(key, content)
+        if self.shared is not None:
+            self.shared.set(key, content, timeout=self.ttl)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.shared is not None:
+            self.shared.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def _store(self, key: str, content: bytes):
+        if len(content) > self.max_bytes:
+            return
+        self._discard(key)
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        self._entries[key] = (expires_at, content)
+        self._bytes += len(content)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def _discard(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+
+_result_cache = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> LogbookResultCache | None:
+    """Process-wide cache built from ``settings.LOGBOOK_RESULT_CACHE``, or None when disabled."""
+    global _result_cache
+    options = getattr(settings, "LOGBOOK_RESULT_CACHE", {})
+    if not options.get("ENABLED", False):
+        return None
+    with _result_cache_lock:
+        if _result_cache is None:
+            _result_cache = LogbookResultCache(
+                max_entries=options.get("MAX_ENTRIES", 512),
+                max_bytes=options.get("MAX_BYTES", 64 * 1024 * 1024),
+                ttl=options.get("TTL"),
+                shared_alias=options.get("SHARED_ALIAS"),
+            )
+        return _result_cache
+
+
+@receiver(setting_changed)
+def _reset_result_cache(*, setting, **kwargs):
+    global _result_cache
+    if setting in ("LOGBOOK_RESULT_CACHE", "CACHES"):
+        _result_cache = None
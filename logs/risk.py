@@ -0,0 +1,337 @@
+"""
+Monte Carlo risk of a planned trip.
+
+The trip is planned once with ``LogbookGenerator``. Its activities (drive
+legs, pickup, refuels, breaks, resets) are then replayed thousands of times
+with perturbed durations. Each drive leg covers the planned miles at a
+random fraction of the planned speed, and pickup dwell and refuel time are
+drawn outright. Resets stay where the plan put them.
+
+Only the rules a slower run can break whatever the driver does are
+reported: a shift running past MAX_DUTY_WINDOW on-duty hours, and work
+past the weekly cycle since the trip start or last restart (hours rolling
+off the window are not credited), both on the clocks the generator keeps.
+The 11-hour driving limit and the 30-minute break are left out. Plans
+drive the full 8 and 11 hours, so with the stops held in place any slow
+run breaks them, while a driver would simply stop earlier.
+
+Runs are simulated together as ``(runs, activities)`` numpy arrays, in
+batches of ``batch_size`` runs, so 10,000 runs cost a few array passes
+rather than 10,000 simulations.
+"""
+
+import math
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from .config import HOSConfig
+from .logbook_generator import ENGINE_EVENT, LogbookGenerator
+from .services import TripInputError, TripRequest, build_generator
+from .split_sleeper import ENGINE_SPLIT
+
+# Parameters each distribution kind needs
+DISTRIBUTION_KINDS = {
+    "fixed": ("value",),
+    "normal": ("mean", "sd"),
+    "uniform": ("low", "high"),
+    "triangular": ("low", "mode", "high"),
+    "lognormal": ("mean", "sd"),
+}
+
+# Perturbed quantities, and the floor every draw is clamped to
+RISK_VARIABLES = {
+    "speed": 0.05,        # Multiplier on the planned average speed
+    "pickup_dwell": 0.0,  # Hours spent at the pickup
+    "refuel": 0.0,        # Hours spent refueling
+}
+
+VIOLATIONS = ("duty_14h", "cycle")
+ARRIVAL_PERCENTILES = (5, 25, 50, 75, 95, 99)
+
+# Activity kinds of a plan
+_DRIVE, _PICKUP, _REFUEL, _WORK, _OFF, _REST, _RESTART = range(7)
+_WORK_KINDS = (_DRIVE, _PICKUP, _REFUEL, _WORK)
+
+# Limits are compared with this much slack for float noise
+_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class Distribution:
+    kind: str
+    params: dict
+    low: float | None = None
+    high: float | None = None
+
+    def sample(self, rng: np.random.Generator, shape: tuple) -> np.ndarray:
+        p = self.params
+        if self.kind == "fixed":
+            values = np.full(shape, float(p["value"]))
+        elif self.kind == "normal":
+            values = rng.normal(p["mean"], p["sd"], shape)
+        elif self.kind == "uniform":
+            values = rng.uniform(p["low"], p["high"], shape)
+        elif self.kind == "triangular":
+            values = rng.triangular(p["low"], p["mode"], p["high"], shape)
+        else:
+            # Parameterised by the mean and sd of the values themselves
+            sigma2 = math.log1p((p["sd"] / p["mean"]) ** 2)
+            values = rng.lognormal(math.log(p["mean"]) - sigma2 / 2, math.sqrt(sigma2), shape)
+        if self.low is not None or self.high is not None:
+            np.clip(values, self.low, self.high, out=values)
+        return values
+
+
+def parse_distribution(name: str, spec) -> Distribution:
+    """
+    Build a distribution from ``{"kind": ..., <params>, "min": ..., "max": ...}``.
+    Draws are clamped to ``min``/``max`` and to the variable's own floor.
+    """
+    if not isinstance(spec, dict):
+        raise TripInputError(f"Distribution '{name}' must be an object.")
+    kind = spec.get("kind")
+    if kind not in DISTRIBUTION_KINDS:
+        raise TripInputError(
+            f"Distribution '{name}' has unknown kind '{kind}'. Expected one of: {', '.join(DISTRIBUTION_KINDS)}"
+        )
+    values = {}
+    for key in (*DISTRIBUTION_KINDS[kind], "min", "max"):
+        if key not in spec:
+            continue
+        value = spec[key]
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            raise TripInputError(f"Distribution '{name}': '{key}' must be a finite number.")
+        values[key] = float(value)
+    missing = [key for key in DISTRIBUTION_KINDS[kind] if key not in values]
+    if missing:
+        raise TripInputError(f"Distribution '{name}' ({kind}) needs: {', '.join(missing)}")
+
+    params = {key: values[key] for key in DISTRIBUTION_KINDS[kind]}
+    if params.get("sd", 0.0) < 0:
+        raise TripInputError(f"Distribution '{name}': 'sd' must not be negative.")
+    if kind == "lognormal" and params["mean"] <= 0:
+        raise TripInputError(f"Distribution '{name}': a lognormal 'mean' must be positive.")
+    if kind in ("uniform", "triangular") and not params["low"] <= params.get("mode", params["low"]) <= params["high"]:
+        raise TripInputError(f"Distribution '{name}': needs low <= mode <= high.")
+
+    floor = RISK_VARIABLES[name]
+    low = max(values.get("min", floor), floor)
+    return Distribution(kind, params, low=low, high=values.get("max"))
+
+
+@dataclass(frozen=True)
+class RiskModel:
+    speed: Distribution
+    pickup_dwell: Distribution
+    refuel: Distribution
+
+    @classmethod
+    def from_specs(cls, specs: dict, overrides=None) -> "RiskModel":
+        """Distributions from ``specs`` (the settings), each replaceable by ``overrides``."""
+        if overrides is None:
+            overrides = {}
+        if not isinstance(overrides, dict):
+            raise TripInputError("'distributions' must be an object.")
+        unknown = [name for name in overrides if name not in RISK_VARIABLES]
+        if unknown:
+            raise TripInputError(
+                f"Unknown distributions: {', '.join(unknown)}. Expected some of: {', '.join(RISK_VARIABLES)}"
+            )
+        return cls(**{name: parse_distribution(name, overrides.get(name, specs[name])) for name in RISK_VARIABLES})
+
+
+def _spans(pairs: list[tuple[int, int]]) -> np.ndarray:
+    return np.array(pairs, dtype=np.intp).reshape(-1, 2)
+
+
+@dataclass(frozen=True)
+class TripPlan:
+    """
+    Activities of a planned trip up to the end of the drop-off, with
+    midnight splits joined, and the activity spans each HOS clock covers.
+    Spans are ``(first work activity, last drive)`` index pairs.
+    """
+    durations: np.ndarray     # Planned hours per activity
+    kinds: np.ndarray
+    shift_spans: np.ndarray   # Between 10-hour resets
+    cycle_spans: np.ndarray   # (first, last work activity) between restarts
+    cycle_offsets: np.ndarray # Cycle hours already used when each span starts
+    planned_arrival_hrs: float
+
+    @classmethod
+    def from_generator(cls, generator: LogbookGenerator, config: HOSConfig) -> "TripPlan":
+        activities = []
+        for store in generator.segments:
+            for start, end, row, action in store:
+                last = activities[-1] if activities else None
+                # A reset's halves carry "(Part 1)" and "(Part 2)" remarks
+                continues = last and last[0] == row and (last[1] == action or row == "sleeper")
+                if continues and last[3] == config.HOURS_IN_DAY and start == 0.0:
+                    last[2] += end
+                    last[3] = end
+                else:
+                    activities.append([row, action, end - start, end])
+        drop_off = max(i for i, (row, action, _, _) in enumerate(activities) if action == "Drop-off")
+        activities = activities[:drop_off + 1]
+
+        kinds = [cls._kind(row, action, duration, config) for row, action, duration, _ in activities]
+        durations = np.array([duration for _, _, duration, _ in activities], dtype=np.float64)
+        shift_spans, cycle_spans, cycle_offsets = [], [], []
+        shift = None
+        period = None
+        offset = generator.current_cycle_hour
+        for i, kind in enumerate(kinds):
+            if kind in _WORK_KINDS:
+                shift = shift or [i, None]
+                period = period or [i, i]
+                period[1] = i
+                if kind == _DRIVE:
+                    shift[1] = i
+                continue
+            if kind in (_REST, _RESTART) and shift:
+                if shift[1] is not None:
+                    shift_spans.append(shift)
+                shift = None
+            if kind == _RESTART:
+                if period:
+                    cycle_spans.append(period)
+                    cycle_offsets.append(offset)
+                period, offset = None, 0.0
+        if shift and shift[1] is not None:
+            shift_spans.append(shift)
+        if period:
+            cycle_spans.append(period)
+            cycle_offsets.append(offset)
+
+        return cls(
+            durations=durations,
+            kinds=np.array(kinds, dtype=np.int8),
+            shift_spans=_spans(shift_spans),
+            cycle_spans=_spans(cycle_spans),
+            cycle_offsets=np.array(cycle_offsets, dtype=np.float64),
+            planned_arrival_hrs=generator.completed_at_hrs,
+        )
+
+    @staticmethod
+    def _kind(row: str, action: str | None, duration: float, config: HOSConfig) -> int:
+        if row == "driving":
+            return _DRIVE
+        if row == "on-duty":
+            return {"Pickup": _PICKUP, "Refueling": _REFUEL}.get(action, _WORK)
+        if action == "34-hour restart":
+            return _RESTART
+        if row == "sleeper" or duration >= config.SLEEPER_BERTH_REQUIRED:
+            return _REST
+        return _OFF
+
+
+def plan_trip_activities(trip: TripRequest, config: HOSConfig) -> TripPlan:
+    if trip.legs:
+        generator = build_generator(trip, config)
+    else:
+        generator = LogbookGenerator(
+            trip.total_dist,
+            trip.total_time_mins,
+            config,
+            current_cycle_hour=trip.current_cycle_hour,
+            engine=ENGINE_EVENT,
+            allow_restart=trip.allow_restart,
+        )
+    generator.generate(pickup_time_mins=trip.pickup_time)
+    return TripPlan.from_generator(generator, config)
+
+
+def _span_totals(cumulative: np.ndarray, spans: np.ndarray) -> np.ndarray:
+    """Per-run sums over each inclusive span, from prefix sums with a leading zero column."""
+    return cumulative[:, spans[:, 1] + 1] - cumulative[:, spans[:, 0]]
+
+
+def simulate_runs(plan: TripPlan, model: RiskModel, runs: int, rng: np.random.Generator, config: HOSConfig):
+    """
+    Arrival hours and per-rule violation flags of ``runs`` perturbed
+    replays of ``plan``, each keeping the plan's resets in place.
+    """
+    durations = np.repeat(plan.durations[np.newaxis, :], runs, axis=0)
+    drives = plan.kinds == _DRIVE
+    durations[:, drives] /= model.speed.sample(rng, (runs, int(drives.sum())))
+    for kind, distribution in ((_PICKUP, model.pickup_dwell), (_REFUEL, model.refuel)):
+        selected = plan.kinds == kind
+        durations[:, selected] = distribution.sample(rng, (runs, int(selected.sum())))
+
+    arrivals = durations.sum(axis=1)
+
+    def prefix_sums(mask):
+        sums = np.zeros((runs, len(plan.kinds) + 1))
+        np.cumsum(durations * mask, axis=1, out=sums[:, 1:])
+        return sums
+
+    work = prefix_sums(np.isin(plan.kinds, _WORK_KINDS))
+    violations = {
+        "duty_14h": _span_totals(work, plan.shift_spans) > config.MAX_DUTY_WINDOW + _TOLERANCE,
+        "cycle": _span_totals(work, plan.cycle_spans) + plan.cycle_offsets > config.MAX_WEEKLY_CYCLE + _TOLERANCE,
+    }
+    return arrivals, {name: flags.any(axis=1) for name, flags in violations.items()}
+
+
+@dataclass
+class RiskResult:
+    runs: int
+    seed: int
+    planned_arrival_hrs: float
+    violation_probability: dict[str, float]
+    arrival_percentiles_hrs: dict[str, float]
+    mean_arrival_hrs: float
+    wall_time_ms: float
+
+    def as_dict(self) -> dict:
+        return {
+            "runs": self.runs,
+            "seed": self.seed,
+            "planned_arrival_hrs": self.planned_arrival_hrs,
+            "violation_probability": self.violation_probability,
+            "arrival_hrs": self.arrival_percentiles_hrs,
+            "mean_arrival_hrs": self.mean_arrival_hrs,
+            "wall_time_ms": self.wall_time_ms,
+        }
+
+
+def analyze_trip_risk(
+    trip: TripRequest,
+    config: HOSConfig,
+    model: RiskModel,
+    runs: int = 10000,
+    seed: int = 0,
+    batch_size: int = 2000,
+) -> RiskResult:
+    """
+    Plan ``trip`` and replay it ``runs`` times. The same seed, runs and
+    batch size give the same result.
+    """
+    if trip.engine == ENGINE_SPLIT:
+        raise TripInputError("Risk analysis replays plans with full resets; the split engine is not supported.")
+    started = time.perf_counter()
+    plan = plan_trip_activities(trip, config)
+    rng = np.random.default_rng(seed)
+
+    arrivals = np.empty(runs)
+    violated = {name: 0 for name in (*VIOLATIONS, "any")}
+    for first in range(0, runs, batch_size):
+        count = min(batch_size, runs - first)
+        batch_arrivals, flags = simulate_runs(plan, model, count, rng, config)
+        arrivals[first:first + count] = batch_arrivals
+        for name in VIOLATIONS:
+            violated[name] += int(flags[name].sum())
+        violated["any"] += int(np.logical_or.reduce([flags[name] for name in VIOLATIONS]).sum())
+
+    percentiles = np.percentile(arrivals, ARRIVAL_PERCENTILES)
+    return RiskResult(
+        runs=runs,
+        seed=seed,
+        planned_arrival_hrs=round(plan.planned_arrival_hrs, 3),
+        violation_probability={name: count / runs for name, count in violated.items()},
+        arrival_percentiles_hrs={f"p{p}": round(float(value), 3) for p, value in zip(ARRIVAL_PERCENTILES, percentiles)},
+        mean_arrival_hrs=round(float(arrivals.mean()), 3),
+        wall_time_ms=round((time.perf_counter() - started) * 1000, 3),
+    )
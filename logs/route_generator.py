@@ -0,0 +1,194 @@
+from dataclasses import dataclass
+
+from .config import HOSConfig
+from .logbook_generator import LogbookGenerator
+
+ENGINE_ROUTE = "route"
+
+# Kinds of stop at the end of a leg, and the remark logged for their dwell
+STOP_KINDS = {"pickup": "Pickup", "delivery": "Delivery", "stop": "Stop"}
+
+# Slack when deciding whether a clock has reached its limit
+_EPSILON_HRS = 1e-9
+_EPSILON_MILES = 1e-6
+
+# Tie-break between events due at the same moment, in the order
+# ``_log_due_duty_change`` of the base generator handles them
+_CYCLE, _SHIFT_LIMIT, _BREAK, _REFUEL, _LEG_END, _MIDNIGHT = range(6)
+
+
+@dataclass(frozen=True)
+class RouteLeg:
+    """
+    One leg of a route: drive ``distance_miles`` in ``driving_time_mins``,
+    then stop for ``dwell_mins`` on duty (None takes the config's pickup
+    time, or its post-trip time at the final stop).
+    """
+    distance_miles: float
+    driving_time_mins: float
+    dwell_mins: float | None = None
+    stop: str = "stop"
+
+    @property
+    def driving_hrs(self) -> float:
+        return self.driving_time_mins / 60
+
+    @property
+    def mph(self) -> float:
+        return self.distance_miles / self.driving_hrs if self.driving_time_mins > 0 else 0.0
+
+
+class RouteLogbookGenerator(LogbookGenerator):
+    """
+    Logbook of a multi-stop route whose legs each have their own speed.
+
+    Driving advances straight to the next event. For every stretch, the
+    leg end, 11-hour and 14-hour limits, break, refuel (from the miles the
+    leg actually covers), cycle limit and midnight are measured in hours
+    ahead, and the soonest one ends the stretch. Cost grows with
+    the number of events, not with trip length in time slices. Duty
+    changes, remarks and day splits come from the base generator's helpers,
+    so the output has the same shape; the final stop is the drop-off.
+    """
+
+    def __init__(
+        self,
+        legs: list[RouteLeg],
+        config: HOSConfig,
+        current_cycle_hour: float = 0.0,
+        allow_restart: bool = False,
+    ):
+        if not legs:
+            raise ValueError("A route needs at least one leg.")
+        super().__init__(
+            total_dist=sum(leg.distance_miles for leg in legs),
+            total_time_mins=sum(leg.driving_time_mins for leg in legs),
+            config=config,
+            current_cycle_hour=current_cycle_hour,
+            allow_restart=allow_restart,
+        )
+        self.engine = ENGINE_ROUTE
+        self.legs = list(legs)
+        self.mph = 0.0
+
+    def _dwell_hrs(self, leg: RouteLeg, final: bool) -> float:
+        if leg.dwell_mins is not None:
+            return leg.dwell_mins / self.config.MINUTES_PER_HOUR
+        return self.config.POST_TRIP_DURATION if final else self.config.PICKUP_DURATION
+
+    def _cycle_exhausted(self, on_duty_hrs: float) -> bool:
+        """Whether ``on_duty_hrs`` more work (or any driving, when 0) needs a restart first."""
+        if not self.allow_restart:
+            return False
+        used = self._cycle_hours_used()
+        if on_duty_hrs:
+            return used + on_duty_hrs > self.config.MAX_WEEKLY_CYCLE + _EPSILON_HRS
+        return used >= self.config.MAX_WEEKLY_CYCLE - _EPSILON_HRS
+
+    def _log_route_duty_change(self, next_on_duty_hrs: float) -> bool:
+        """Log the highest-priority duty change that is due right now, if any."""
+        config = self.config
+        state = self.state
+        refuel_due = state.miles_since_refuel >= config.REFUEL_THRESHOLD_MILES - _EPSILON_MILES
+        if self._cycle_exhausted(config.REFUEL_DURATION if refuel_due else next_on_duty_hrs):
+            self._log_cycle_restart()
+            return True
+        if (state.daily_driving_hrs >= config.MAX_DRIVING_TIME - _EPSILON_HRS
+                or state.daily_duty_hrs >= config.MAX_DUTY_WINDOW - _EPSILON_HRS):
+            self._log_sleeper(config.SLEEPER_BERTH_REQUIRED)
+            return True
+        if state.hrs_since_last_break >= config.BREAK_REQUIRED_AFTER - _EPSILON_HRS:
+            self._log_off_duty(config.MANDATORY_BREAK_DURATION, "30-minute break")
+            return True
+        if refuel_due:
+            self._log_on_duty(config.REFUEL_DURATION, "Refueling")
+            state.miles_since_refuel = 0
+            return True
+        return False
+
+    def _next_event(self, leg_remaining_hrs: float, mph: float) -> tuple[float, int]:
+        """Hours of driving until the soonest event, and which event it is."""
+        config = self.config
+        state = self.state
+        events = [
+            (leg_remaining_hrs, _LEG_END),
+            (config.MAX_DRIVING_TIME - state.daily_driving_hrs, _SHIFT_LIMIT),
+            (config.MAX_DUTY_WINDOW - state.daily_duty_hrs, _SHIFT_LIMIT),
+            (config.BREAK_REQUIRED_AFTER - state.hrs_since_last_break, _BREAK),
+            (config.HOURS_IN_DAY - state.current_hour_of_day, _MIDNIGHT),
+        ]
+        if mph > 0:
+            events.append(((config.REFUEL_THRESHOLD_MILES - state.miles_since_refuel) / mph, _REFUEL))
+        if self.allow_restart:
+            events.append((config.MAX_WEEKLY_CYCLE - self._cycle_hours_used(), _CYCLE))
+        return min(events)
+
+    def _log_drive(self, hours: float, mph: float):
+        state = self.state
+        start = state.current_hour_of_day
+        state.current_hour_of_day += hours
+        state.day_driving += hours
+        self.day_segments.record(start, state.current_hour_of_day, "driving")
+        state.daily_driving_hrs += hours
+        state.daily_duty_hrs += hours
+        state.hrs_since_last_break += hours
+        state.total_trip_time_elapsed_hrs += hours
+        state.miles_since_refuel += mph * hours
+
+    def _drive_leg(self, leg: RouteLeg):
+        remaining = leg.driving_hrs
+        while remaining > _EPSILON_HRS:
+            self.iterations += 1
+            if self._log_route_duty_change(0.0):
+                if self._sealed_days:
+                    yield from self._drain_sealed_days()
+                continue
+            if self.state.current_hour_of_day >= self.config.HOURS_IN_DAY - _EPSILON_HRS:
+                # Stretches stop at midnight, so the cycle and day totals roll over here
+                self.state.current_hour_of_day = self.config.HOURS_IN_DAY
+                self._rotate_day()
+                yield from self._drain_sealed_days()
+                continue
+            hours, event = self._next_event(remaining, leg.mph)
+            # Ending on the leg's own remainder leaves no float residue behind
+            hours = remaining if event == _LEG_END else min(max(hours, 0.0), remaining)
+            self._log_drive(hours, leg.mph)
+            remaining -= hours
+
+    def iter_days(self, pickup_time_mins: float | None = None):
+        """
+        Run the route, yielding each day's log as soon as it is sealed.
+        Stops come from the legs, so ``pickup_time_mins`` is ignored.
+        """
+        config = self.config
+        self._log_off_duty(config.INITIAL_REST_DURATION)
+        if self._cycle_exhausted(config.PRE_TRIP_DURATION):
+            self._log_cycle_restart()
+        self._log_on_duty(config.PRE_TRIP_DURATION, "Pre-trip/TIV")
+        yield from self._drain_sealed_days()
+
+        last = len(self.legs) - 1
+        for index, leg in enumerate(self.legs):
+            yield from self._drive_leg(leg)
+            if index == last:
+                break
+            dwell = self._dwell_hrs(leg, final=False)
+            while self._log_route_duty_change(dwell):
+                self.iterations += 1
+            self._log_on_duty(dwell, STOP_KINDS[leg.stop])
+            self.has_performed_pickup = self.has_performed_pickup or leg.stop == "pickup"
+            yield from self._drain_sealed_days()
+
+        drop_off = self._dwell_hrs(self.legs[last], final=True)
+        if self._cycle_exhausted(drop_off):
+            self._log_cycle_restart()
+        self._log_on_duty(drop_off, "Drop-off")
+        self.completed_at_hrs = self.day_index * config.HOURS_IN_DAY + self.state.current_hour_of_day
+        if self.state.current_hour_of_day < config.HOURS_IN_DAY:
+            self._log_off_duty(config.HOURS_IN_DAY - self.state.current_hour_of_day)
+
+        self._finalize_day()
+        yield from self._drain_sealed_days()
+
+    def generate(self, pickup_time_mins: float | None = None):
+        return super().generate(pickup_time_mins)
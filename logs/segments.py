@@ -0,0 +1,88 @@
+from array import array
+from typing import NamedTuple
+
+# Duty-status rows of the FMCSA grid, in drawing order. Stored as 1-byte codes.
+ROWS = ("off-duty", "sleeper", "driving", "on-duty")
+ROW_CODES = {row: code for code, row in enumerate(ROWS)}
+
+# Remarks are interned once per process and stored as 2-byte ids.
+_ACTIONS: list[str | None] = [None]
+_ACTION_IDS: dict[str | None, int] = {None: 0}
+
+
+def _intern_action(action: str | None) -> int:
+    action_id = _ACTION_IDS.get(action)
+    if action_id is None:
+        action_id = _ACTION_IDS[action] = len(_ACTIONS)
+        _ACTIONS.append(action)
+    return action_id
+
+
+def action_name(action_id: int) -> str | None:
+    return _ACTIONS[action_id]
+
+
+class Segment(NamedTuple):
+    start: float
+    end: float
+    row: str
+    action: str | None
+
+
+class SegmentStore:
+    """
+    One day of duty-status segments held in parallel typed arrays.
+    Adjacent segments with the same row and remark are merged as they are
+    recorded, so a long driving block is a single entry however it was logged.
+    """
+
+    __slots__ = ("starts", "ends", "rows", "actions")
+
+    def __init__(self):
+        self.starts = array("d")
+        self.ends = array("d")
+        self.rows = array("B")
+        self.actions = array("H")
+
+    def record(self, start: float, end: float, row: str, action: str | None = None):
+        if end <= start:
+            return
+        row_code = ROW_CODES[row]
+        action_id = _intern_action(action)
+        if self.rows and self.rows[-1] == row_code and self.actions[-1] == action_id and self.ends[-1] == start:
+            self.ends[-1] = end
+            return
+        self.starts.append(start)
+        self.ends.append(end)
+        self.rows.append(row_code)
+        self.actions.append(action_id)
+
+    def copy(self) -> "SegmentStore":
+        clone = SegmentStore()
+        clone.starts = array("d", self.starts)
+        clone.ends = array("d", self.ends)
+        clone.rows = array("B", self.rows)
+        clone.actions = array("H", self.actions)
+        return clone
+
+    @property
+    def last_row(self) -> str | None:
+        return ROWS[self.rows[-1]] if self.rows else None
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        for start, end, row_code, action_id in zip(self.starts, self.ends, self.rows, self.actions):
+            yield Segment(start, end, ROWS[row_code], _ACTIONS[action_id])
+
+    def to_logbook(self) -> list[dict]:
+        """Build the ``{"hour", "row", "action"}`` point list the API returns."""
+        points = []
+        for start, end, row, action in self:
+            points.append({"hour": start, "row": row})
+            if row == "driving":
+                points.append({"hour": end, "row": row})
+            else:
+                points.append({"hour": end, "row": row, "action": action})
+        return points
@@ -1,8 +1,23 @@
 from rest_framework import serializers
 
-from .models import LogbookTrip
+from .models import Driver, LogbookTrip
 
 class LogSerializers(serializers.ModelSerializer):
+    """Pass ``fields`` to serialize only those fields, e.g. for a ``?fields=`` projection."""
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
     class Meta:
         model = LogbookTrip
-        fields = "__all__"
\ No newline at end of file
+        fields = "__all__"
+        read_only_fields = ["outcome", "error", "days"]
+
+class DriverSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Driver
+        fields = ["id", "name", "created_at", "ledger_date", "ledger_total"]
+        read_only_fields = ["ledger_date", "ledger_total"]
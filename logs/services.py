@@ -0,0 +1,170 @@
+from dataclasses import dataclass
+
+from .config import HOSConfig
+from .feasibility import validate_trip_feasibility
+from .json_encoding import render_logbook_json
+from .logbook_generator import ENGINE_STEP, ENGINES, LogbookGenerator
+from .route_generator import ENGINE_ROUTE, STOP_KINDS, RouteLeg, RouteLogbookGenerator
+from .split_sleeper import ENGINE_SPLIT, SplitSleeperGenerator
+
+REQUIRED_TRIP_FIELDS = ["total_distance_miles", "total_driving_time", "current_cycle_hour", "pickup_time"]
+# With "legs", the totals and pickup come from the legs
+REQUIRED_ROUTE_FIELDS = ["current_cycle_hour"]
+# Engines a request may ask for; "split" plans its own rests
+TRIP_ENGINES = (*ENGINES, ENGINE_SPLIT)
+
+
+class TripInputError(ValueError):
+    """Raised when trip parameters are missing, malformed or not legally drivable."""
+
+
+@dataclass(frozen=True)
+class TripRequest:
+    total_dist: float
+    total_time_mins: float
+    current_cycle_hour: float
+    pickup_time: float
+    engine: str = ENGINE_STEP
+    allow_restart: bool = False
+    # Multi-stop route; empty for a single pickup and drop-off
+    legs: tuple[RouteLeg, ...] = ()
+
+
+def _parse_leg(index: int, data) -> RouteLeg:
+    if not isinstance(data, dict):
+        raise TripInputError(f"Leg {index} must be a JSON object.")
+    values = {}
+    for field, required in (("distance_miles", True), ("driving_time", True), ("dwell_time", False)):
+        value = data.get(field)
+        if value is None:
+            if required:
+                raise TripInputError(f"Leg {index} is missing '{field}'.")
+            continue
+        try:
+            values[field] = float(value)
+        except (ValueError, TypeError):
+            raise TripInputError(f"Leg {index}: '{field}' must be a number.")
+        if not 0 <= values[field] < float("inf"):
+            raise TripInputError(f"Leg {index}: '{field}' must be a non-negative number.")
+    if values["distance_miles"] > 0 and values["driving_time"] == 0:
+        raise TripInputError(f"Leg {index} covers distance in no driving time.")
+    stop = data.get("stop", "stop")
+    if stop not in STOP_KINDS:
+        raise TripInputError(f"Leg {index}: unknown stop '{stop}'. Expected one of: {', '.join(STOP_KINDS)}")
+    return RouteLeg(
+        distance_miles=values["distance_miles"],
+        driving_time_mins=values["driving_time"],
+        dwell_mins=values.get("dwell_time"),
+        stop=stop,
+    )
+
+
+def parse_route_legs(data) -> tuple[RouteLeg, ...]:
+    """Legs of a ``"legs"`` list, each driven and then ended with a stop."""
+    if not isinstance(data, list) or not data:
+        raise TripInputError("'legs' must be a non-empty list.")
+    return tuple(_parse_leg(index, leg) for index, leg in enumerate(data))
+
+
+def parse_trip_request(data) -> TripRequest:
+    """Extract and normalize trip parameters from a request payload."""
+    if not isinstance(data, dict):
+        raise TripInputError("Trip parameters must be a JSON object.")
+
+    legs = parse_route_legs(data["legs"]) if "legs" in data else ()
+    required = REQUIRED_ROUTE_FIELDS if legs else REQUIRED_TRIP_FIELDS
+    missing = [field for field in required if field not in data]
+    if missing:
+        raise TripInputError(f"Missing required fields: {', '.join(missing)}")
+
+    try:
+        current_cycle_hour = float(data.get("current_cycle_hour"))
+        if legs:
+            total_dist = sum(leg.distance_miles for leg in legs)
+            total_time_mins = sum(leg.driving_time_mins for leg in legs)
+            pickup_time = 0.0
+        else:
+            total_dist = float(data.get("total_distance_miles"))
+            total_time_mins = float(data.get("total_driving_time"))
+            pickup_time = float(data.get("pickup_time"))
+    except (ValueError, TypeError) as e:
+        raise TripInputError(f"Invalid input format: {str(e)}. Numeric values required.")
+
+    if legs:
+        if "engine" in data:
+            raise TripInputError("Routes are always simulated event by event; leave out 'engine'.")
+        engine = ENGINE_ROUTE
+    else:
+        engine = data.get("engine", ENGINE_STEP)
+        if engine not in TRIP_ENGINES:
+            raise TripInputError(f"Unknown engine '{engine}'. Expected one of: {', '.join(TRIP_ENGINES)}")
+
+    allow_restart = data.get("allow_restart", False)
+    if not isinstance(allow_restart, bool):
+        raise TripInputError("allow_restart must be true or false.")
+    if allow_restart and engine == ENGINE_SPLIT:
+        raise TripInputError("The split engine does not plan 34-hour restarts; leave out allow_restart.")
+
+    return TripRequest(
+        total_dist=total_dist,
+        total_time_mins=total_time_mins,
+        current_cycle_hour=current_cycle_hour,
+        pickup_time=pickup_time,
+        engine=engine,
+        allow_restart=allow_restart,
+        legs=legs,
+    )
+
+
+def check_trip_feasibility(trip: TripRequest, config: HOSConfig):
+    """
+    Raise TripInputError when the trip would break the HOS cycle limit.
+    Trips allowed to take 34-hour restarts can always be planned.
+    """
+    if trip.allow_restart:
+        return
+    is_possible, error_msg = validate_trip_feasibility(
+        total_dist=trip.total_dist,
+        total_time_mins=trip.total_time_mins,
+        config=config,
+        current_cycle_hour=trip.current_cycle_hour
+    )
+    if not is_possible:
+        raise TripInputError(error_msg)
+
+
+def build_generator(trip: TripRequest, config: HOSConfig) -> LogbookGenerator:
+    if trip.legs:
+        return RouteLogbookGenerator(
+            list(trip.legs),
+            config,
+            current_cycle_hour=trip.current_cycle_hour,
+            allow_restart=trip.allow_restart,
+        )
+    if trip.engine == ENGINE_SPLIT:
+        return SplitSleeperGenerator(
+            trip.total_dist, trip.total_time_mins, config, current_cycle_hour=trip.current_cycle_hour
+        )
+    return LogbookGenerator(
+        total_dist=trip.total_dist,
+        total_time_mins=trip.total_time_mins,
+        config=config,
+        current_cycle_hour=trip.current_cycle_hour,
+        engine=trip.engine,
+        allow_restart=trip.allow_restart,
+    )
+
+
+def plan_trip(trip: TripRequest, config: HOSConfig | None = None) -> list[dict]:
+    """Feasibility check followed by logbook generation for one trip."""
+    config = config or HOSConfig()
+    check_trip_feasibility(trip, config)
+    return build_generator(trip, config).generate(pickup_time_mins=trip.pickup_time)
+
+
+def generate_trip_json(trip: TripRequest, config: HOSConfig | None = None) -> bytes:
+    """Generate an already feasibility-checked trip and render it, e.g. inside a pool worker."""
+    config = config or HOSConfig()
+    generator = build_generator(trip, config)
+    logbooks = generator.generate(pickup_time_mins=trip.pickup_time)
+    return render_logbook_json(logbooks, generator.segments)
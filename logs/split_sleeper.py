@@ -0,0 +1,283 @@
+"""
+Split sleeper-berth rest planning.
+
+The standard generators take a full SLEEPER_BERTH_REQUIRED reset as soon
+as the 11-hour or 14-hour limit is reached. HOS also lets a driver split
+that reset into two rests: a sleeper period of at least 7 hours and a
+second rest of at least 2, together at least 10 (7/3 or 8/2, see
+HOSConfig.SPLIT_SLEEPER_PAIRS). Neither half counts against the 14-hour
+limit. Once both halves are taken, the shift limits only count work done
+since the end of the first half, and the second half can start the next
+pair.
+
+``plan_rests`` searches for the quickest legal way to work through a trip.
+The trip is a fixed sequence of work items: pre-trip, drive slices with
+the pickup and refuel stops at their usual points, and the drop-off.
+Before each item the search may insert a 30-minute break, a full reset or
+a split half. It is an A* search over driver states (item, driving and
+duty hours, hours since the last break, the open split half and the work
+done since it) ordered by elapsed time, with the remaining work as the
+bound. Each state keeps its best elapsed time, and a state is dropped
+when another one at the same item with the same open half is no later
+and no more tired on every clock.
+"""
+
+import heapq
+from dataclasses import dataclass
+
+from .config import HOSConfig
+from .logbook_generator import LogbookGenerator
+
+ENGINE_SPLIT = "split"
+
+_EPSILON = 1e-9
+
+
+@dataclass(frozen=True)
+class WorkItem:
+    row: str                   # "driving" or "on-duty"
+    hours: float
+    remark: str | None = None
+
+
+@dataclass(frozen=True)
+class Rest:
+    row: str                   # "off-duty" or "sleeper"
+    hours: float
+    remark: str
+    kind: str                  # "break", "reset" or "split"
+
+
+def trip_work_items(total_dist: float, total_time_mins: float, pickup_time_mins: float, config: HOSConfig) -> list[WorkItem]:
+    """
+    The work of a trip in order. Drive slices are TIME_STEP long except
+    the last, and the pickup and refuels fall at the same slice boundaries
+    as in the step engine.
+    """
+    total_hrs = total_time_mins / config.MINUTES_PER_HOUR
+    pickup_hrs = pickup_time_mins / config.MINUTES_PER_HOUR
+    mph = total_dist / total_hrs if total_hrs > 0 else 0.0
+    items = [WorkItem("on-duty", config.PRE_TRIP_DURATION, "Pre-trip/TIV")]
+    driven = miles = 0.0
+    picked_up = False
+    while driven < total_hrs - _EPSILON:
+        if miles >= config.REFUEL_THRESHOLD_MILES:
+            items.append(WorkItem("on-duty", config.REFUEL_DURATION, "Refueling"))
+            miles = 0.0
+        if not picked_up and driven >= pickup_hrs:
+            items.append(WorkItem("on-duty", config.PICKUP_DURATION, "Pickup"))
+            picked_up = True
+        hours = min(config.TIME_STEP, total_hrs - driven)
+        items.append(WorkItem("driving", hours))
+        driven += config.TIME_STEP
+        miles += mph * config.TIME_STEP
+    items.append(WorkItem("on-duty", config.POST_TRIP_DURATION, "Drop-off"))
+    return items
+
+
+def rest_options(config: HOSConfig) -> list[Rest]:
+    rests = [
+        Rest("off-duty", config.MANDATORY_BREAK_DURATION, "30-minute break", "break"),
+        Rest("sleeper", config.SLEEPER_BERTH_REQUIRED, "10-hour Reset", "reset"),
+    ]
+    for sleeper_hrs, other_hrs in config.SPLIT_SLEEPER_PAIRS:
+        rests.append(Rest("sleeper", sleeper_hrs, f"Split sleeper berth ({sleeper_hrs:g}h)", "split"))
+        rests.append(Rest("off-duty", other_hrs, f"Split rest ({other_hrs:g}h)", "split"))
+    # Pairs may share a half length; keep one of each
+    return list({(rest.row, rest.hours): rest for rest in rests}.values())
+
+
+def _pairs(first: Rest, second: Rest, config: HOSConfig) -> bool:
+    """Whether two split halves, in either order, make up a reset."""
+    for sleeper_hrs, other_hrs in config.SPLIT_SLEEPER_PAIRS:
+        for long, short in ((first, second), (second, first)):
+            if long.row == "sleeper" and long.hours >= sleeper_hrs and short.hours >= other_hrs:
+                return True
+    return False
+
+
+class _Front:
+    """Non-dominated (elapsed, clocks...) tuples seen for one item and open half."""
+
+    __slots__ = ("entries",)
+
+    def __init__(self):
+        self.entries = []
+
+    def admit(self, point: tuple) -> bool:
+        for other in self.entries:
+            if all(o <= p + _EPSILON for o, p in zip(other, point)):
+                return False
+        self.entries = [
+            other for other in self.entries
+            if not all(p <= o + _EPSILON for p, o in zip(point, other))
+        ]
+        self.entries.append(point)
+        return True
+
+
+@dataclass
+class RestPlan:
+    steps: list                # WorkItem and Rest objects in order
+    elapsed_hrs: float         # From the pre-trip to the end of the drop-off
+    states_expanded: int
+
+
+def plan_rests(items: list[WorkItem], config: HOSConfig) -> RestPlan:
+    """Quickest legal order of ``items`` and rests, starting fully rested."""
+    rests = rest_options(config)
+    splits = [index for index, rest in enumerate(rests) if rest.kind == "split"]
+    break_index = next(index for index, rest in enumerate(rests) if rest.kind == "break")
+    reset_index = next(index for index, rest in enumerate(rests) if rest.kind == "reset")
+    pairs = {(a, b) for a in splits for b in splits if _pairs(rests[a], rests[b], config)}
+
+    remaining = [0.0] * (len(items) + 1)
+    for index in range(len(items) - 1, -1, -1):
+        remaining[index] = remaining[index + 1] + items[index].hours
+
+    # state: (item, driving, duty, since_break, open_half, driving_after, duty_after)
+    start = (0, 0.0, 0.0, 0.0, -1, 0.0, 0.0)
+    best = {start: 0.0}
+    parents = {start: None}
+    fronts = {}
+    queue = [(remaining[0], 0.0, 0, start)]
+    counter = expanded = 0
+
+    def push(state, elapsed, parent, step):
+        nonlocal counter
+        key = _state_key(state)
+        if best.get(key, float("inf")) <= elapsed + _EPSILON:
+            return
+        front = fronts.setdefault((state[0], state[4]), _Front())
+        if not front.admit((elapsed, *state[1:4], *state[5:])):
+            return
+        best[key] = elapsed
+        parents[key] = (parent, step)
+        counter += 1
+        heapq.heappush(queue, (elapsed + remaining[state[0]], elapsed, counter, key))
+
+    while queue:
+        _, elapsed, _, state = heapq.heappop(queue)
+        if elapsed > best[state] + _EPSILON:
+            continue
+        index, driving, duty, since_break, open_half, driving_after, duty_after = state
+        if index == len(items):
+            return RestPlan(_unwind(parents, state, items, rests), elapsed, expanded)
+        expanded += 1
+        item = items[index]
+
+        if item.row == "driving":
+            blocked_by_break = since_break + item.hours > config.BREAK_REQUIRED_AFTER + _EPSILON
+            blocked_by_shift = (driving + item.hours > config.MAX_DRIVING_TIME + _EPSILON
+                                or duty + item.hours > config.MAX_DUTY_WINDOW + _EPSILON)
+        else:
+            blocked_by_break = blocked_by_shift = False
+
+        if not (blocked_by_break or blocked_by_shift):
+            driven = item.hours if item.row == "driving" else 0.0
+            push(
+                (index + 1, driving + driven, duty + item.hours, since_break + item.hours,
+                 open_half, driving_after + driven, duty_after + item.hours),
+                elapsed + item.hours, state, ("work", index),
+            )
+        # A break or reset is never worth taking before it is needed
+        if blocked_by_break and not blocked_by_shift:
+            push(
+                (index, driving, duty, 0.0, open_half, driving_after, duty_after),
+                elapsed + rests[break_index].hours, state, ("rest", break_index),
+            )
+        if blocked_by_break or blocked_by_shift:
+            push((index, 0.0, 0.0, 0.0, -1, 0.0, 0.0), elapsed + rests[reset_index].hours, state, ("rest", reset_index))
+        if index == 0 or not (driving or duty):
+            continue
+        for half in splits:
+            if (open_half, half) in pairs:
+                # The pair is complete: only work since the first half counts
+                after = (driving_after, duty_after)
+            else:
+                after = (driving, duty)
+            push(
+                (index, *after, 0.0, half, 0.0, 0.0),
+                elapsed + rests[half].hours, state, ("rest", half),
+            )
+    raise ValueError("No legal schedule covers this trip.")
+
+
+def _state_key(state: tuple) -> tuple:
+    return (state[0], *(round(value, 6) for value in state[1:4]), state[4], round(state[5], 6), round(state[6], 6))
+
+
+def _unwind(parents: dict, state: tuple, items: list[WorkItem], rests: list[Rest]) -> list:
+    steps = []
+    while parents[state] is not None:
+        state, (kind, index) = parents[state]
+        steps.append(items[index] if kind == "work" else rests[index])
+    steps.reverse()
+    return steps
+
+
+class SplitSleeperGenerator(LogbookGenerator):
+    """
+    Logbook of the quickest schedule ``plan_rests`` finds for a trip, with
+    split sleeper-berth rests where they save time. Days, remarks and
+    totals are logged through the base generator's helpers.
+    """
+
+    def __init__(self, total_dist: float, total_time_mins: float, config: HOSConfig, current_cycle_hour: float = 0.0):
+        super().__init__(total_dist, total_time_mins, config, current_cycle_hour=current_cycle_hour)
+        self.engine = ENGINE_SPLIT
+        self.plan: RestPlan | None = None
+
+    def _log_drive(self, hours: float):
+        state = self.state
+        state.total_trip_time_elapsed_hrs += hours
+        while hours > _EPSILON:
+            if state.current_hour_of_day >= self.config.HOURS_IN_DAY:
+                self._rotate_day()
+            chunk = min(hours, self.config.HOURS_IN_DAY - state.current_hour_of_day)
+            start = state.current_hour_of_day
+            state.current_hour_of_day += chunk
+            state.day_driving += chunk
+            self.day_segments.record(start, state.current_hour_of_day, "driving")
+            hours -= chunk
+
+    def _log_sleeper_half(self, duration: float, remark: str):
+        state = self.state
+        remaining_in_day = self.config.HOURS_IN_DAY - state.current_hour_of_day
+        if duration > remaining_in_day:
+            self.day_segments.record(state.current_hour_of_day, self.config.HOURS_IN_DAY, "sleeper", remark)
+            state.day_sleeper += remaining_in_day
+            state.current_hour_of_day = self.config.HOURS_IN_DAY
+            self._rotate_day()
+            duration -= remaining_in_day
+        start = state.current_hour_of_day
+        state.current_hour_of_day += duration
+        state.day_sleeper += duration
+        self.day_segments.record(start, state.current_hour_of_day, "sleeper", remark)
+
+    def iter_days(self, pickup_time_mins: float):
+        config = self.config
+        items = trip_work_items(self.total_dist, self.total_driving_required_hrs * config.MINUTES_PER_HOUR, pickup_time_mins, config)
+        self.plan = plan_rests(items, config)
+        self.iterations = self.plan.states_expanded
+
+        self._log_off_duty(config.INITIAL_REST_DURATION)
+        for step in self.plan.steps:
+            if isinstance(step, WorkItem) and step.row == "driving":
+                self._log_drive(step.hours)
+            elif isinstance(step, WorkItem):
+                self._log_on_duty(step.hours, step.remark)
+                self.has_performed_pickup = self.has_performed_pickup or step.remark == "Pickup"
+            elif step.kind == "reset":
+                self._log_sleeper(step.hours)
+            elif step.row == "sleeper":
+                self._log_sleeper_half(step.hours, step.remark)
+            else:
+                self._log_off_duty(step.hours, step.remark)
+            yield from self._drain_sealed_days()
+
+        self.completed_at_hrs = self.day_index * config.HOURS_IN_DAY + self.state.current_hour_of_day
+        if self.state.current_hour_of_day < config.HOURS_IN_DAY:
+            self._log_off_duty(config.HOURS_IN_DAY - self.state.current_hour_of_day)
+        self._finalize_day()
+        yield from self._drain_sealed_days()
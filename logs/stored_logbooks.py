@@ -0,0 +1,43 @@
+from .config import HOSConfig
+from .logbook_generator import ENGINE_VERSION
+from .models import GeneratedLogbook, LogbookTrip
+from .result_cache import trip_cache_key
+from .services import TripRequest, check_trip_feasibility, generate_trip_json
+
+
+def trip_request_for(trip: LogbookTrip) -> TripRequest:
+    return TripRequest(
+        total_dist=trip.total_distance_miles,
+        total_time_mins=trip.total_driving_time_mins,
+        current_cycle_hour=trip.current_cycle_hour,
+        pickup_time=trip.pickup_time_mins,
+    )
+
+
+def logbook_etag(trip: LogbookTrip, config: HOSConfig) -> str:
+    """Entity tag of a trip's logbook, computable without touching the stored copy."""
+    return trip_cache_key(trip_request_for(trip), config).removeprefix("logbook:")
+
+
+def load_trip_logbook(trip: LogbookTrip, config: HOSConfig, etag: str | None = None) -> bytes:
+    """
+    Rendered logbook JSON of a saved trip. Served from its stored copy while
+    that still matches ``etag``; otherwise generated once and stored.
+    """
+    etag = etag or logbook_etag(trip, config)
+    stored = GeneratedLogbook.objects.filter(trip=trip, etag=etag).first()
+    if stored is not None:
+        return stored.rendered_content()
+
+    trip_request = trip_request_for(trip)
+    check_trip_feasibility(trip_request, config)
+    content = generate_trip_json(trip_request, config)
+    GeneratedLogbook.objects.update_or_create(
+        trip=trip,
+        defaults={
+            "etag": etag,
+            "engine_version": ENGINE_VERSION,
+            "content": GeneratedLogbook.compress(content),
+        },
+    )
+    return content
@@ -0,0 +1,162 @@
+"""
+SVG rendering of logbook days on the FMCSA 24-hour duty-status grid.
+
+The grid never changes: frame, row labels, hour lines and quarter-hour
+ticks. It is built once per process, placed in the document's ``<defs>``
+and drawn into every day with ``<use>``. Per day only the duty-status
+line, the row totals and the remarks are written, straight from the day's
+SegmentStore. ``iter_svg_document`` yields the document a day at a time,
+so long trips can be streamed page by page.
+"""
+
+from collections.abc import Iterator
+from functools import lru_cache
+from html import escape
+
+from .segments import ROWS, SegmentStore, action_name
+
+HOURS = 24
+HOUR_WIDTH = 40
+LABEL_WIDTH = 170
+TOTALS_WIDTH = 60
+ROW_HEIGHT = 30
+TITLE_HEIGHT = 40
+REMARKS_HEIGHT = 120
+DAY_GAP = 20
+
+GRID_WIDTH = HOURS * HOUR_WIDTH
+GRID_HEIGHT = len(ROWS) * ROW_HEIGHT
+PAGE_WIDTH = LABEL_WIDTH + GRID_WIDTH + TOTALS_WIDTH
+DAY_HEIGHT = TITLE_HEIGHT + GRID_HEIGHT + REMARKS_HEIGHT
+
+GRID_ID = "hos-grid"
+
+ROW_LABELS = {
+    "off-duty": "1. Off Duty",
+    "sleeper": "2. Sleeper Berth",
+    "driving": "3. Driving",
+    "on-duty": "4. On Duty (not driving)",
+}
+# Day summary field behind each row's total
+ROW_TOTALS = {
+    "off-duty": "timeSpentInOffDuty",
+    "sleeper": "timeSpentInSleeperBerth",
+    "driving": "timeSpentInDriving",
+    "on-duty": "timeSpentInOnDuty",
+}
+
+_STYLE = (
+    "text{font-family:Helvetica,Arial,sans-serif;font-size:11px}"
+    ".title{font-size:14px;font-weight:bold}"
+    ".frame{fill:none;stroke:#000;stroke-width:1.5}"
+    ".hour{stroke:#000;stroke-width:.75}"
+    ".tick{stroke:#000;stroke-width:.5}"
+    ".duty{fill:none;stroke:#1f4fd1;stroke-width:2.5;stroke-linejoin:round}"
+    ".remark{stroke:#1f4fd1;stroke-width:1}"
+)
+
+
+def _number(value: float) -> str:
+    text = f"{value:.2f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def _hour_label(hour: int) -> str:
+    if hour % 12 == 0:
+        return "Noon" if hour == 12 else "Mid"
+    return str(hour % 12)
+
+
+@lru_cache(maxsize=1)
+def grid_background() -> str:
+    """The static grid as a ``<g>``, with its origin at the top left of the rows."""
+    parts = [f'<g id="{GRID_ID}">']
+    for code, row in enumerate(ROWS):
+        y = (code + 0.5) * ROW_HEIGHT + 4
+        parts.append(f'<text x="{LABEL_WIDTH - 8}" y="{_number(y)}" text-anchor="end">{ROW_LABELS[row]}</text>')
+    parts.append(f'<text x="{LABEL_WIDTH + GRID_WIDTH + 8}" y="-6">Total hrs</text>')
+    for hour in range(HOURS + 1):
+        x = LABEL_WIDTH + hour * HOUR_WIDTH
+        parts.append(f'<text x="{x}" y="-6" text-anchor="middle">{_hour_label(hour)}</text>')
+
+    hour_lines = [f"M{LABEL_WIDTH + hour * HOUR_WIDTH} 0V{GRID_HEIGHT}" for hour in range(1, HOURS)]
+    hour_lines += [f"M{LABEL_WIDTH} {code * ROW_HEIGHT}h{GRID_WIDTH}" for code in range(1, len(ROWS))]
+    ticks = []
+    for code in range(len(ROWS)):
+        top = code * ROW_HEIGHT
+        for hour in range(HOURS):
+            for quarter, length in ((1, 0.25), (2, 0.5), (3, 0.25)):
+                x = LABEL_WIDTH + (hour + quarter / 4) * HOUR_WIDTH
+                ticks.append(f"M{_number(x)} {top}v{_number(ROW_HEIGHT * length)}")
+    parts.append(f'<path class="hour" d="{"".join(hour_lines)}"/>')
+    parts.append(f'<path class="tick" d="{"".join(ticks)}"/>')
+    parts.append(f'<rect class="frame" x="{LABEL_WIDTH}" y="0" width="{GRID_WIDTH}" height="{GRID_HEIGHT}"/>')
+    parts.append(f'<text x="{LABEL_WIDTH - 8}" y="{GRID_HEIGHT + 16}" text-anchor="end">Remarks</text>')
+    parts.append("</g>")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def _document_head(width: int, height: int) -> bytes:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+        f"<defs><style>{_STYLE}</style>{grid_background()}</defs>"
+    ).encode()
+
+
+_ROW_Y = tuple(_number(TITLE_HEIGHT + (code + 0.5) * ROW_HEIGHT) for code in range(len(ROWS)))
+_TOTALS = tuple(
+    (f'<text x="{LABEL_WIDTH + GRID_WIDTH + 8}" y="{_number(TITLE_HEIGHT + (code + 0.5) * ROW_HEIGHT + 4)}">', ROW_TOTALS[row])
+    for code, row in enumerate(ROWS)
+)
+
+
+def render_day(store: SegmentStore, summary: dict, index: int, top: float = 0.0) -> str:
+    """One day as a ``<g>`` placed ``top`` pixels down the document."""
+    points = []
+    remarks = []
+    remark_y = TITLE_HEIGHT + GRID_HEIGHT
+    for start, end, row_code, action_id in zip(store.starts, store.ends, store.rows, store.actions):
+        x = _number(LABEL_WIDTH + start * HOUR_WIDTH)
+        y = _ROW_Y[row_code]
+        points.append(f"{x},{y} {_number(LABEL_WIDTH + end * HOUR_WIDTH)},{y}")
+        if action_id:
+            remarks.append(
+                f'<path class="remark" d="M{x} {remark_y}v10"/>'
+                f'<text transform="translate({x} {remark_y + 14}) rotate(45)">'
+                f"{escape(action_name(action_id), quote=False)}</text>"
+            )
+    totals = "".join(f"{head}{_number(summary.get(key, 0))}</text>" for head, key in _TOTALS)
+    return (
+        f'<g transform="translate(0 {_number(top)})">'
+        f'<text class="title" x="{LABEL_WIDTH}" y="16">Day {index + 1}</text>'
+        f'<use href="#{GRID_ID}" y="{TITLE_HEIGHT}"/>'
+        f'<polyline class="duty" points="{" ".join(points)}"/>'
+        f"{totals}{''.join(remarks)}</g>"
+    )
+
+
+def document_height(day_count: int) -> int:
+    return max(day_count, 1) * (DAY_HEIGHT + DAY_GAP) - DAY_GAP
+
+
+def iter_svg_document(days, segments) -> Iterator[bytes]:
+    """
+    An SVG document of ``days`` stacked top to bottom, each with its
+    SegmentStore from ``segments``: the head with the grid first, then one
+    chunk per day.
+    """
+    yield _document_head(PAGE_WIDTH, document_height(len(days)))
+    for index, (summary, store) in enumerate(zip(days, segments)):
+        yield render_day(store, summary, index, index * (DAY_HEIGHT + DAY_GAP)).encode()
+    yield b"</svg>"
+
+
+def render_message(message: str) -> bytes:
+    """A one-line SVG, for errors answered to clients that asked for SVG."""
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{PAGE_WIDTH}" height="{TITLE_HEIGHT}">'
+        f'<text x="8" y="24">{escape(message, quote=False)}</text></svg>'
+    ).encode()
@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_result_cache(settings):
+    """Give every test a fresh, in-process-only result cache."""
+    settings.LOGBOOK_RESULT_CACHE = {**settings.LOGBOOK_RESULT_CACHE, "SHARED_ALIAS": None}
+
+
+@pytest.fixture(autouse=True)
+def audit_disabled(settings):
+    """Keep the write-behind audit thread out of tests that do not ask for it."""
+    settings.LOGBOOK_AUDIT = {**settings.LOGBOOK_AUDIT, "ENABLED": False}
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+
+import pytest
+from django.test import AsyncClient, Client, override_settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from logs.executors import BoundedExecutor
+from logs.json_encoding import render_json
+
+pytestmark = pytest.mark.django_db
+
+ASYNC_URL = "/api/logs/generate_logbook_async/"
+SYNC_URL = "/api/logs/generate_logbook/"
+
+
+@pytest.fixture
+def payload():
+    return {
+        "total_distance_miles": 1500,
+        "total_driving_time": 1500,
+        "current_cycle_hour": 0,
+        "pickup_time": 60,
+    }
+
+
+def test_render_json_matches_drf_renderer():
+    data = [{"day": 1, "hour": 0.25, "note": "café  "}, None, True]
+    assert render_json(data) == JSONRenderer().render(data)
+
+
+def test_async_endpoint_matches_sync_endpoint(payload):
+    expected = APIClient().post(SYNC_URL, payload, format="json")
+    response = Client().post(ASYNC_URL, payload, content_type="application/json")
+
+    assert response.status_code == 200
+    assert response.content == expected.content
+
+
+def test_async_endpoint_under_async_client(payload):
+    async def call():
+        return await AsyncClient().post(ASYNC_URL, payload, content_type="application/json")
+
+    response = asyncio.run(call())
+    assert response.status_code == 200
+    assert response.json()[0]["logbook"][0]["hour"] == 0.0
+
+
+def test_async_endpoint_rejects_bad_input(payload):
+    client = Client()
+
+    response = client.post(ASYNC_URL, "not json", content_type="application/json")
+    assert response.status_code == 400
+
+    del payload["pickup_time"]
+    response = client.post(ASYNC_URL, payload, content_type="application/json")
+    assert response.status_code == 400
+    assert "pickup_time" in response.json()["error"]
+
+    assert client.get(ASYNC_URL).status_code == 405
+
+
+def test_async_endpoint_sheds_load_when_saturated(payload):
+    release = threading.Event()
+    settings_override = {"EXECUTOR": "thread", "MAX_WORKERS": 1, "MAX_PENDING": 1, "RETRY_AFTER": 3}
+
+    with override_settings(LOGBOOK_ASYNC=settings_override):
+        from logs.executors import get_async_executor
+
+        blocker = get_async_executor().try_submit(release.wait)
+        try:
+            response = Client().post(ASYNC_URL, payload, content_type="application/json")
+        finally:
+            release.set()
+            blocker.result(timeout=5)
+
+    assert response.status_code == 503
+    assert response["Retry-After"] == "3"
+
+
+def test_bounded_executor_frees_slots_when_tasks_finish():
+    executor = BoundedExecutor(max_workers=1, max_pending=2)
+    release = threading.Event()
+    try:
+        first = executor.try_submit(release.wait)
+        second = executor.try_submit(release.wait)
+        assert executor.try_submit(release.wait) is None
+        assert executor.pending == 2
+
+        release.set()
+        first.result(timeout=5)
+        second.result(timeout=5)
+        assert executor.try_submit(sum, [1, 2]).result(timeout=5) == 3
+    finally:
+        executor.shutdown()
+
+
+def test_bounded_executor_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        BoundedExecutor(kind="greenlet")
@@ -0,0 +1,111 @@
+import time
+from unittest import mock
+
+import pytest
+from rest_framework.test import APIClient
+
+from logs.audit import AuditRecorder, get_audit_recorder
+from logs.metrics import AUDIT_RECORDS
+from logs.models import LogbookTrip
+
+# The writer thread uses its own connection, so rows must really be committed
+pytestmark = pytest.mark.django_db(transaction=True)
+
+ROW = {
+    "total_distance_miles": 600.0,
+    "total_driving_time_mins": 600.0,
+    "pickup_time_mins": 0.0,
+    "current_cycle_hour": 0.0,
+    "outcome": LogbookTrip.OUTCOME_GENERATED,
+}
+
+
+@pytest.fixture
+def recorder():
+    recorder = AuditRecorder(max_queue=100, batch_size=3, flush_interval=60.0)
+    yield recorder
+    recorder.close()
+
+
+@pytest.fixture
+def audit_enabled(settings):
+    settings.LOGBOOK_AUDIT = {**settings.LOGBOOK_AUDIT, "ENABLED": True, "FLUSH_INTERVAL": 60.0}
+    yield get_audit_recorder()
+
+
+def test_full_batches_are_written_without_waiting(recorder):
+    """Reaching batch_size writes right away; the remainder waits for a flush."""
+    for _ in range(7):
+        assert recorder.record(**ROW)
+
+    deadline = time.monotonic() + 5
+    while LogbookTrip.objects.count() < 6 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert LogbookTrip.objects.count() == 6
+
+    assert recorder.flush()
+    assert LogbookTrip.objects.count() == 7
+    assert recorder.stats() == {"queued": 0, "written": 7, "dropped": 0, "failed": 0}
+
+def test_partial_batch_is_written_after_the_interval():
+    """A lone record does not wait for a full batch."""
+    recorder = AuditRecorder(batch_size=100, flush_interval=0.05)
+    try:
+        recorder.record(**ROW)
+        deadline = time.monotonic() + 5
+        while not LogbookTrip.objects.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert LogbookTrip.objects.count() == 1
+    finally:
+        recorder.close()
+
+def test_overflow_drops_and_counts(monkeypatch):
+    """A full queue drops new records instead of blocking the caller."""
+    overflowing = AuditRecorder(max_queue=2, batch_size=10, flush_interval=60.0)
+    # No writer thread, so nothing drains the queue
+    monkeypatch.setattr(overflowing, "_ensure_started", lambda: None)
+    dropped_before = AUDIT_RECORDS.value("dropped")
+
+    results = [overflowing.record(**ROW) for _ in range(5)]
+
+    assert results == [True, True, False, False, False]
+    assert overflowing.stats()["dropped"] == 3
+    assert AUDIT_RECORDS.value("dropped") == dropped_before + 3
+
+def test_close_drains_and_refuses_later_records(recorder):
+    """Shutdown writes what is queued; records after it are dropped."""
+    for _ in range(2):
+        recorder.record(**ROW)
+
+    assert recorder.close()
+    assert LogbookTrip.objects.count() == 2
+    assert recorder.record(**ROW) is False
+    assert recorder.stats()["dropped"] == 1
+
+def test_write_failures_are_counted(recorder):
+    """A failed bulk insert is logged and counted, and the writer keeps going."""
+    with mock.patch.object(LogbookTrip.objects, "bulk_create", side_effect=RuntimeError("db down")):
+        recorder.record(**ROW)
+        recorder.flush()
+    recorder.record(**ROW)
+    recorder.flush()
+
+    assert recorder.stats()["failed"] == 1
+    assert recorder.stats()["written"] == 1
+
+def test_generation_requests_are_audited(audit_enabled):
+    """Generated and rejected trips are recorded; unparseable requests are not."""
+    client = APIClient()
+    url = "/api/logs/generate_logbook/"
+    ok = {"total_distance_miles": 600, "total_driving_time": 600, "current_cycle_hour": 0, "pickup_time": 0}
+
+    assert client.post(url, ok, format="json").status_code == 200
+    assert client.post(url, {**ok, "current_cycle_hour": 69.5}, format="json").status_code == 400
+    assert client.post(url, {**ok, "pickup_time": "soon"}, format="json").status_code == 400
+    assert audit_enabled.flush()
+
+    generated, rejected = LogbookTrip.objects.order_by("created_at")
+    assert (generated.outcome, generated.days, generated.engine) == (LogbookTrip.OUTCOME_GENERATED, 1, "step")
+    assert rejected.outcome == LogbookTrip.OUTCOME_REJECTED
+    assert rejected.current_cycle_hour == 69.5
+    assert rejected.error
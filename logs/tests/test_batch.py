@@ -0,0 +1,82 @@
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from logs.batch import run_batch
+from logs.services import TripRequest, plan_trip
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture
+def api_url():
+    return "/api/logs/generate_logbook_batch/"
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def trips():
+    """A mixed batch: two good trips around one the cycle limit rejects."""
+    return [
+        {"total_distance_miles": 500, "total_driving_time": 480, "current_cycle_hour": 10, "pickup_time": 30},
+        {"total_distance_miles": 1000, "total_driving_time": 1200, "current_cycle_hour": 65, "pickup_time": 30},
+        {"total_distance_miles": 2500, "total_driving_time": 2700, "current_cycle_hour": 0, "pickup_time": 90},
+    ]
+
+
+def test_batch_returns_results_in_input_order(api_client, api_url, trips):
+    """Per-trip results come back in order and one bad trip does not fail the batch."""
+    response = api_client.post(api_url, data={"trips": trips}, format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+    results = response.data["results"]
+    assert [result["index"] for result in results] == [0, 1, 2]
+    assert [result["status"] for result in results] == ["ok", "error", "ok"]
+    assert "Insufficient cycle hours" in results[1]["error"]
+    assert response.data["error_count"] == 1
+    assert response.data["wall_time_ms"] >= 0
+    assert all(result["compute_ms"] >= 0 for result in results)
+
+def test_batch_results_match_single_trip_endpoint(api_client, api_url, trips):
+    """A batched trip yields the same logbook as the single-trip endpoint."""
+    batch = api_client.post(api_url, data={"trips": trips}, format='json')
+    single = api_client.post("/api/logs/generate_logbook/", data=trips[2], format='json')
+
+    assert batch.data["results"][2]["logbooks"] == single.data
+
+def test_batch_reports_malformed_trips(api_client, api_url):
+    """Missing fields and non-objects are reported per trip."""
+    trips = [{"total_distance_miles": 100}, "not a trip"]
+    response = api_client.post(api_url, data={"trips": trips}, format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+    errors = [result["error"] for result in response.data["results"]]
+    assert "Missing required fields" in errors[0]
+    assert "must be a JSON object" in errors[1]
+
+@pytest.mark.parametrize("body", [{}, {"trips": []}, {"trips": "nope"}])
+def test_batch_requires_trip_list(api_client, api_url, body):
+    """Verify 400 when the body carries no trips."""
+    response = api_client.post(api_url, data=body, format='json')
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+def test_batch_size_limit(api_client, api_url, trips, settings):
+    """Verify 400 when the batch exceeds the configured size."""
+    settings.LOGBOOK_BATCH = {**settings.LOGBOOK_BATCH, "MAX_TRIPS": 2}
+    response = api_client.post(api_url, data={"trips": trips}, format='json')
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Too many trips" in response.data["error"]
+
+def test_process_pool_matches_serial(trips):
+    """Fanning out across worker processes gives the same answers as running serially."""
+    pooled = run_batch(trips * 3, max_workers=2, serial_threshold=0)
+    serial = run_batch(trips * 3, max_workers=1)
+
+    def without_timings(results):
+        return [{k: v for k, v in result.items() if k != "compute_ms"} for result in results]
+
+    assert without_timings(pooled) == without_timings(serial)
+    assert pooled[2]["logbooks"] == plan_trip(TripRequest(2500, 2700, 0, 90))
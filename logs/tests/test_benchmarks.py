@@ -0,0 +1,84 @@
+import os
+from unittest import mock
+
+import pytest
+
+from logs.audit import AuditRecorder
+from logs.benchmarks import (
+    benchmark_trips,
+    compare_to_baseline,
+    load_report,
+    percentile,
+    run_benchmarks,
+)
+
+
+def test_percentile_interpolates():
+    """Percentiles interpolate between ranks."""
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 95) == pytest.approx(4.8)
+    assert percentile([], 99) == 0.0
+
+def test_grid_spans_short_hop_to_multi_week():
+    """The trip grid covers every route, pickup offset and cycle start."""
+    trips = benchmark_trips()
+    names = {trip.name for trip in trips}
+
+    assert len(trips) == len(names) == 30
+    assert max(trip.total_dist for trip in trips) == 10000.0
+
+def test_report_records_per_trip_metrics():
+    """A tiny run records timings, iterations, entries and allocations."""
+    trips = benchmark_trips()[:2]
+    report = run_benchmarks(targets=["generator:event"], repeat=2, trips=trips)
+
+    result = report["results"]["generator:event"][trips[0].name]
+    assert {"p50_ms", "p95_ms", "p99_ms", "peak_alloc_kib", "iterations", "entries"} <= result.keys()
+    assert result["entries"] > 0
+    assert report["summary"]["generator:event"]["p95_ms"] > 0
+
+def test_render_targets_time_only_rendering():
+    """Both render targets write the same bytes from a logbook generated up front."""
+    trips = benchmark_trips()[-1:]
+    report = run_benchmarks(targets=["render:drf", "render:logbook"], repeat=2, trips=trips)
+
+    drf, logbook = (report["results"][target][trips[0].name] for target in ("render:drf", "render:logbook"))
+    assert drf["bytes"] == logbook["bytes"] > 0
+
+def test_every_trip_is_planned_and_nothing_is_audited(settings):
+    """The view plans every trip instead of timing a 400, and no benchmark trip is audited."""
+    settings.LOGBOOK_AUDIT = {**settings.LOGBOOK_AUDIT, "ENABLED": True}
+    trips = [trip for trip in benchmark_trips() if trip.pickup_time == 0.0]
+    with mock.patch.object(AuditRecorder, "record") as record:
+        report = run_benchmarks(targets=["view", "generator:event"], repeat=1, trips=trips)
+
+    assert {result["status"] for result in report["results"]["view"].values()} == {200}
+    assert not record.called
+    # The starting cycle hours reach the generator
+    generated = report["results"]["generator:event"]
+    assert generated["cross-country/pickup=0/cycle=0"]["days"] < generated["cross-country/pickup=0/cycle=30"]["days"]
+
+def test_regression_budget():
+    """Growth beyond the budget is reported; growth within it is not."""
+    baseline = {"results": {"view": {"trip": {"p95_ms": 1.0, "peak_alloc_kib": 100.0}}}}
+    within = {"results": {"view": {"trip": {"p95_ms": 1.2, "peak_alloc_kib": 110.0}}}}
+    beyond = {"results": {"view": {"trip": {"p95_ms": 1.5, "peak_alloc_kib": 100.0}}}}
+
+    assert compare_to_baseline(within, baseline, budget=0.25) == []
+    assert len(compare_to_baseline(beyond, baseline, budget=0.25)) == 1
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(os.environ.get("HOS_BENCHMARK") != "1", reason="set HOS_BENCHMARK=1 to run the benchmark suite")
+def test_no_regressions_against_baseline(settings):
+    """Full benchmark grid, failing when the configured regression budget is exceeded."""
+    baseline = load_report(settings.HOS_BENCHMARK["BASELINE_PATH"])
+    if baseline is None:
+        pytest.skip("no benchmark baseline; create one with manage.py benchmark_hos --update-baseline")
+
+    report = run_benchmarks()
+    regressions = compare_to_baseline(report, baseline, settings.HOS_BENCHMARK["REGRESSION_BUDGET"])
+
+    assert not regressions, "\n".join(regressions)
@@ -0,0 +1,47 @@
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from logs.cold_start import PROBES, measure_profile, warm_up
+
+PAYLOAD = {"total_distance_miles": 600, "total_driving_time": 600, "current_cycle_hour": 0, "pickup_time": 0}
+
+
+@pytest.fixture
+def compute_urls(settings):
+    settings.ROOT_URLCONF = "core.urls_compute"
+
+def test_compute_urls_serve_the_planning_endpoints(compute_urls):
+    """The compute URLconf keeps the public paths of the planning endpoints."""
+    client = APIClient()
+
+    assert client.post("/api/logs/generate_logbook/", PAYLOAD, format="json").status_code == status.HTTP_200_OK
+    assert client.get("/api/logs/max_trip/?current_cycle_hour=0&mph=60").status_code == status.HTTP_200_OK
+
+def test_compute_urls_leave_out_database_endpoints(compute_urls):
+    """Admin, trip CRUD and drivers are not routed in the compute profile."""
+    client = APIClient()
+
+    for path in ("/admin/", "/api/logs/", "/api/drivers/"):
+        assert client.get(path).status_code == status.HTTP_404_NOT_FOUND
+
+def test_driver_ledger_can_be_switched_off(settings):
+    """Without a database a driver_id is a client error, not a failed query."""
+    settings.LOGBOOK_DRIVER_LEDGER = False
+    response = APIClient().post("/api/logs/generate_logbook/", {**PAYLOAD, "driver_id": 1}, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "not available" in response.data["error"]
+
+def test_warm_up_runs_without_a_database():
+    """Warming up plans a trip and resolves URLs but never queries."""
+    warm_up()
+
+def test_compute_profile_starts_and_serves_in_a_fresh_process():
+    """The compute profile boots with no database configured and answers every probe."""
+    result = measure_profile("compute", requests=2)
+
+    assert result["import_ms"] > 0
+    for name in PROBES:
+        assert result[name]["status"] == "200 OK"
+        assert result[name]["p50_ms"] > 0
@@ -0,0 +1,221 @@
+from datetime import date, timedelta
+from unittest import mock
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from logs.config import HOSConfig
+from logs.cycle_ledger import (
+    LedgerChangedError,
+    commit_key,
+    commit_logbook,
+    fleet_cycle_hours,
+    fleet_feasibility,
+    with_driver_cycle,
+)
+from logs.models import Driver, DriverDutyDay, DriverTripCommit
+from logs.services import TripRequest
+
+pytestmark = pytest.mark.django_db
+
+START = date(2026, 3, 2)
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def driver():
+    return Driver.objects.create(name="R. Alvarez")
+
+
+def day_log(on_duty, driving):
+    return {"logbook": [], "timeSpentInOnDuty": on_duty, "timeSpentInDriving": driving}
+
+
+def test_ledger_window_rolls_over_eight_days(driver):
+    for offset in range(10):
+        driver.add_to_ledger(START + timedelta(days=offset), offset + 1.0)
+
+    # Days 3..10 (hours 3..10) are inside the window ending on day 10
+    assert driver.cycle_hours_on(START + timedelta(days=9)) == sum(range(3, 11))
+    # Two days later the two oldest of those have expired
+    assert driver.cycle_hours_on(START + timedelta(days=11)) == sum(range(5, 11))
+    # A long gap empties the window entirely
+    assert driver.cycle_hours_on(START + timedelta(days=30)) == 0.0
+
+
+def test_ledger_ignores_days_older_than_the_window(driver):
+    driver.add_to_ledger(START + timedelta(days=10), 5.0)
+    driver.add_to_ledger(START, 9.0)
+
+    assert driver.ledger_total == 5.0
+
+
+def test_commit_logbook_records_days_and_updates_ledger(driver):
+    logbooks = [day_log(2.0, 6.5), day_log(1.0, 11.0), day_log(0.0, 0.0), day_log(1.5, 3.0)]
+
+    commit_logbook(driver, logbooks, START, "first")
+    driver.refresh_from_db()
+
+    days = dict(DriverDutyDay.objects.filter(driver=driver).values_list("date", "on_duty_hrs"))
+    assert days == {START: 8.5, START + timedelta(days=1): 12.0, START + timedelta(days=3): 4.5}
+    assert driver.cycle_hours_on(START + timedelta(days=3)) == 25.0
+
+    # Committing another trip on an existing day adds to it
+    commit_logbook(driver, [day_log(1.0, 0.0)], START, "second")
+    driver.refresh_from_db()
+    assert DriverDutyDay.objects.get(driver=driver, date=START).on_duty_hrs == 9.5
+    assert driver.cycle_hours_on(START + timedelta(days=3)) == 26.0
+
+
+def test_committing_a_trip_twice_counts_it_once(driver):
+    trip = TripRequest(1200, 1200, 0, 60)
+    for _ in range(2):
+        commit_logbook(driver, [day_log(1.0, 9.0)] * 3, START, commit_key(trip, START))
+    driver.refresh_from_db()
+
+    assert driver.cycle_hours_on(START + timedelta(days=2)) == 30.0
+    assert DriverDutyDay.objects.get(driver=driver, date=START).on_duty_hrs == 10.0
+    # Another start date is another trip
+    assert commit_key(trip, START) != commit_key(trip, START + timedelta(days=1))
+
+
+def test_later_days_of_a_trip_wait_outside_the_window(driver):
+    """A multi-day trip keeps the window on its start date; later days are pending."""
+    commit_logbook(driver, [day_log(0.0, 10.0)] * 12, START, "long")
+    driver.refresh_from_db()
+
+    assert driver.ledger_date == START
+    assert driver.cycle_hours_on(START + timedelta(days=11)) == 80.0
+    assert driver.cycle_hours_on(START + timedelta(days=2)) == 30.0
+
+    # The next trip moves the window and folds in the days it passes
+    commit_logbook(driver, [day_log(0.0, 4.0)], START + timedelta(days=12), "next")
+    driver.refresh_from_db()
+    assert driver.ledger_date == START + timedelta(days=12)
+    assert driver.ledger_total == 74.0
+    assert len(driver.ledger_pending) == 0
+
+
+def test_past_dates_fall_back_to_day_history(driver):
+    commit_logbook(driver, [day_log(0.0, 10.0)] * 3, START, "first")
+    commit_logbook(driver, [day_log(0.0, 5.0)], START + timedelta(days=20), "second")
+    driver.refresh_from_db()
+
+    assert driver.cycle_hours_on(START + timedelta(days=2)) == 30.0
+    assert driver.cycle_hours_on(START + timedelta(days=20)) == 5.0
+
+
+def test_fleet_cycle_hours_is_one_query(driver, django_assert_num_queries):
+    other = Driver.objects.create(name="K. Osei")
+    commit_logbook(driver, [day_log(1.0, 9.0)] * 3, START, "first")
+    commit_logbook(other, [day_log(0.0, 2.0)] * 10, START - timedelta(days=1), "second")
+
+    # Both ledgers end on their trip's start date, so the later days asked for are pending
+    for offset, expected in ((0, {driver.pk: 10.0, other.pk: 4.0}), (2, {driver.pk: 30.0, other.pk: 8.0})):
+        with django_assert_num_queries(1):
+            assert fleet_cycle_hours(START + timedelta(days=offset)) == expected
+
+    driver_ids, matrix = fleet_feasibility([600, 3000], [600, 3000], HOSConfig(), START + timedelta(days=2))
+    assert driver_ids == [driver.pk, other.pk]
+    assert matrix.tolist() == [[True, False], [True, True]]
+
+
+def test_generate_logbook_takes_cycle_hours_from_driver(api_client, driver):
+    commit_logbook(driver, [day_log(1.0, 10.0)] * 6, START, "first")
+    payload = {
+        "total_distance_miles": 1200,
+        "total_driving_time": 1200,
+        "pickup_time": 60,
+        "driver_id": driver.pk,
+        "start_date": (START + timedelta(days=5)).isoformat(),
+    }
+
+    response = api_client.post("/api/logs/generate_logbook/", payload, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "4.0h left" in response.data["error"]
+
+    payload["start_date"] = (START + timedelta(days=12)).isoformat()
+    response = api_client.post("/api/logs/generate_logbook/", payload, format="json")
+    assert response.status_code == status.HTTP_200_OK
+    assert not DriverDutyDay.objects.filter(date__gt=START + timedelta(days=5)).exists()
+
+
+def test_generate_logbook_commit_updates_ledger(api_client, driver):
+    payload = {
+        "total_distance_miles": 1200,
+        "total_driving_time": 1200,
+        "pickup_time": 60,
+        "driver_id": driver.pk,
+        "start_date": START.isoformat(),
+        "commit": True,
+    }
+
+    # A retried commit of the same trip is not counted again
+    for _ in range(2):
+        response = api_client.post("/api/logs/generate_logbook/", payload, format="json")
+        assert response.status_code == status.HTTP_200_OK
+
+    expected = sum(day["timeSpentInOnDuty"] + day["timeSpentInDriving"] for day in response.data)
+    cycle = api_client.get(f"/api/drivers/{driver.pk}/cycle/", {"date": (START + timedelta(days=3)).isoformat()})
+    assert cycle.data["cycle_hours"] == round(expected, 2)
+    assert cycle.data["remaining_hours"] == round(70 - expected, 2)
+
+
+def test_generate_logbook_rejects_unknown_driver(api_client):
+    payload = {"total_distance_miles": 100, "total_driving_time": 100, "pickup_time": 0, "driver_id": 999}
+
+    response = api_client.post("/api/logs/generate_logbook/", payload, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Unknown driver_id" in response.data["error"]
+
+
+@pytest.mark.parametrize("commit", ["false", "0", 1, None])
+def test_generate_logbook_commit_must_be_a_bool(api_client, driver, commit):
+    payload = {
+        "total_distance_miles": 100,
+        "total_driving_time": 100,
+        "pickup_time": 0,
+        "driver_id": driver.pk,
+        "commit": commit,
+    }
+
+    response = api_client.post("/api/logs/generate_logbook/", payload, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "commit must be true or false" in response.data["error"]
+    assert not DriverDutyDay.objects.exists()
+
+
+def test_commit_is_refused_when_the_ledger_changed_since_planning(driver):
+    commit_logbook(driver, [day_log(1.0, 9.0)], START, "first", cycle_hours=0.0)
+
+    with pytest.raises(LedgerChangedError):
+        commit_logbook(driver, [day_log(1.0, 9.0)], START, "second", cycle_hours=0.0)
+    assert not DriverTripCommit.objects.filter(key="second").exists()
+    assert DriverDutyDay.objects.get(driver=driver).on_duty_hrs == 10.0
+
+
+def test_generate_logbook_commit_conflicts_with_a_commit_made_meanwhile(api_client, driver):
+    payload = {
+        "total_distance_miles": 100,
+        "total_driving_time": 100,
+        "pickup_time": 0,
+        "driver_id": driver.pk,
+        "start_date": START.isoformat(),
+        "commit": True,
+    }
+
+    def read_then_commit_elsewhere(data):
+        read = with_driver_cycle(data)
+        commit_logbook(driver, [day_log(0.0, 5.0)], START, "meanwhile")
+        return read
+
+    with mock.patch("logs.cycle_ledger.with_driver_cycle", read_then_commit_elsewhere):
+        response = api_client.post("/api/logs/generate_logbook/", payload, format="json")
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert "Generate it again" in response.data["error"]
+    assert DriverDutyDay.objects.get(driver=driver).on_duty_hrs == 5.0
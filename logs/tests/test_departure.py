@@ -0,0 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from logs.config import HOSConfig
+from logs.departure import search_departures, start_hours
+from logs.services import TripInputError, TripRequest, build_generator
+
+CONFIG = HOSConfig()
+HOURS = start_hours(15, CONFIG)
+PAYLOAD = {"total_distance_miles": 1200, "total_driving_time": 1300, "current_cycle_hour": 10, "pickup_time": 60}
+
+
+def _simulated(trip, start_hour):
+    generator = build_generator(trip, replace(CONFIG, INITIAL_REST_DURATION=start_hour))
+    days = generator.generate(pickup_time_mins=trip.pickup_time)
+    return generator.completed_at_hrs, len(days)
+
+
+def test_grid_covers_the_day():
+    assert len(HOURS) == 96
+    assert (HOURS[0], HOURS[1], HOURS[-1]) == (0.0, 0.25, 23.75)
+    with pytest.raises(TripInputError):
+        start_hours(0, CONFIG)
+
+@pytest.mark.parametrize("trip", [
+    TripRequest(300, 300, 0, 0),
+    TripRequest(1200, 1300, 10, 600),
+    TripRequest(2500, 2700, 20, 45, engine="split"),
+    TripRequest(6000, 6500, 0, 60, engine="event"),
+])
+def test_one_run_answers_every_start_hour(trip):
+    """Without restarts each start hour's arrival and day count follow from a single simulation."""
+    search = search_departures(trip, CONFIG, HOURS)
+
+    assert search.simulations == 1
+    for option in search.options:
+        assert (option.completed_at_hrs, option.days) == pytest.approx(_simulated(trip, option.start_hour))
+
+def test_restart_trips_simulate_each_start_hour():
+    trip = TripRequest(6000, 6500, 60, 60, engine="event", allow_restart=True)
+    hours = HOURS[::8]
+    with ThreadPoolExecutor(2) as pool:
+        search = search_departures(trip, CONFIG, hours, pool=pool)
+
+    assert search.simulations == len(hours)
+    for option in search.options:
+        assert (option.completed_at_hrs, option.days) == pytest.approx(_simulated(trip, option.start_hour))
+
+def test_rankings():
+    trip = TripRequest(1200, 1300, 10, 60)
+    by_days = search_departures(trip, CONFIG, HOURS, pickup_times=[0, 60, 600])
+    by_arrival = search_departures(trip, CONFIG, HOURS, pickup_times=[0, 60, 600], rank_by="arrival")
+
+    assert len(by_days.options) == 3 * 96
+    assert by_days.simulations == 3
+    days = [option.days for option in by_days.options]
+    assert days == sorted(days)
+    assert by_arrival.best.start_hour == 0.0
+    assert by_arrival.best.completed_at_hrs == min(option.completed_at_hrs for option in by_days.options)
+    with pytest.raises(TripInputError, match="Unknown ranking"):
+        search_departures(trip, CONFIG, HOURS, rank_by="vibes")
+
+def test_departure_search_endpoint():
+    response = APIClient().post("/api/logs/departure_search/", {
+        **PAYLOAD, "pickup_times": [0, 60], "alternatives": 3,
+    }, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["evaluated"] == 192
+    assert len(body["alternatives"]) == 3
+    assert len(body["logbooks"]) == body["best"]["days"]
+    # The best plan goes on duty at its start time
+    first_on_duty = next(point for point in body["logbooks"][0]["logbook"] if point["row"] == "on-duty")
+    assert first_on_duty["hour"] == body["best"]["start_hour"]
+
+@pytest.mark.parametrize("extra, message", [
+    ({"step_minutes": 0}, "step_minutes"),
+    ({"pickup_times": []}, "pickup_times"),
+    ({"pickup_times": [-5]}, "non-negative"),
+    ({"pickup_times": [0, 1301]}, "within the trip's 1300 driving minutes"),
+    ({"pickup_times": [1e6]}, "within the trip"),
+    ({"rank_by": "vibes"}, "Unknown ranking"),
+    ({"alternatives": "many"}, "alternatives"),
+])
+def test_departure_search_rejects_bad_requests(extra, message):
+    response = APIClient().post("/api/logs/departure_search/", {**PAYLOAD, **extra}, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert message in response.data["error"]
@@ -0,0 +1,158 @@
+import random
+import time
+from dataclasses import replace
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from logs.config import HOSConfig
+from logs.dispatch import DispatchDriver, DispatchLoad, plan_dispatch
+from logs.feasibility import validate_trip_feasibility
+from logs.logbook_generator import LogbookGenerator
+
+
+@pytest.fixture
+def config():
+    return HOSConfig()
+
+
+def test_generator_reports_completion_time(config):
+    generator = LogbookGenerator(600, 600, config)
+    logbooks = generator.generate(pickup_time_mins=0)
+
+    drop_off = next(
+        entry for day in logbooks for entry in day["logbook"] if entry.get("action") == "Drop-off"
+    )
+    assert generator.day_index == len(logbooks) - 1
+    assert generator.completed_at_hrs == generator.day_index * 24 + drop_off["hour"]
+
+
+def test_every_assignment_is_feasible_and_drivers_never_overlap(config):
+    rng = random.Random(7)
+    drivers = [DispatchDriver(f"d{i}", rng.uniform(0, 60), rng.uniform(0, 12)) for i in range(8)]
+    loads = [DispatchLoad(f"t{i}", miles, miles * rng.uniform(1.0, 1.3), 60) for i, miles in
+             enumerate(rng.uniform(100, 2500) for _ in range(40))]
+
+    plan = plan_dispatch(drivers, loads, config)
+    assert len(plan.assignments) + len(plan.unassigned) == len(loads)
+    assert {a.load_id for a in plan.assignments}.isdisjoint(plan.unassigned)
+
+    by_load = {load.id: load for load in loads}
+    for driver in drivers:
+        # On-duty hours by plan day; earlier hours count as the day before the plan
+        duty_days = {-1: driver.current_cycle_hour}
+        free_at = driver.available_at_hrs
+        for assignment in (a for a in plan.assignments if a.driver_id == driver.id):
+            load = by_load[assignment.load_id]
+            today = int(assignment.start_at_hrs // 24)
+            cycle_hour = sum(hours for day, hours in duty_days.items() if day > today - config.CYCLE_DAYS)
+            if not validate_trip_feasibility(load.total_dist, load.total_time_mins, config, cycle_hour)[0]:
+                # Only allowed after a 34-hour restart
+                assert assignment.start_at_hrs >= free_at + config.CYCLE_RESTART_DURATION
+                duty_days, cycle_hour = {}, 0.0
+            assert validate_trip_feasibility(load.total_dist, load.total_time_mins, config, cycle_hour)[0]
+            assert assignment.start_at_hrs >= free_at
+
+            start = replace(config, INITIAL_REST_DURATION=assignment.start_at_hrs - today * 24)
+            generator = LogbookGenerator(load.total_dist, load.total_time_mins, start)
+            for offset, day in enumerate(generator.generate(pickup_time_mins=load.pickup_time)):
+                hours = day["timeSpentInOnDuty"] + day["timeSpentInDriving"]
+                duty_days[today + offset] = duty_days.get(today + offset, 0.0) + hours
+            assert generator.completed_at_hrs == pytest.approx(assignment.completed_at_hrs - today * 24)
+            free_at = assignment.completed_at_hrs
+
+
+def test_shortest_loads_go_first_and_restarts_free_up_cycle(config):
+    drivers = [DispatchDriver("a", current_cycle_hour=50)]
+    loads = [
+        DispatchLoad("long", 3000, 3000),
+        DispatchLoad("short", 200, 200),
+        DispatchLoad("oversized", 5000, 5000),
+        DispatchLoad("medium", 500, 500),
+    ]
+
+    plan = plan_dispatch(drivers, loads, config)
+    assert [a.load_id for a in plan.assignments] == ["short", "medium", "long"]
+    assert plan.unassigned == ["oversized"]
+    assert plan.restarts == 1
+
+    short, medium, long = plan.assignments
+    assert medium.start_at_hrs == short.completed_at_hrs + config.SLEEPER_BERTH_REQUIRED
+    assert long.start_at_hrs == medium.completed_at_hrs + config.CYCLE_RESTART_DURATION
+
+
+def test_cycle_hours_roll_off_after_eight_days(config):
+    """A driver idle for more than CYCLE_DAYS days has their earlier hours back without a restart."""
+    drivers = [DispatchDriver("a", current_cycle_hour=65, available_at_hrs=8 * 24)]
+    plan = plan_dispatch(drivers, [DispatchLoad("t", 600, 600)], config)
+
+    assert plan.restarts == 0
+    assert plan.assignments[0].start_at_hrs == 8 * 24
+
+def test_back_to_back_loads_keep_only_the_last_eight_days(config):
+    """Short hauls over twelve days add up past 70 hours, but no eight days of them do."""
+    plan = plan_dispatch([DispatchDriver("a")], [DispatchLoad(i, 100, 100) for i in range(30)], config)
+
+    assert sum(a.on_duty_hrs for a in plan.assignments) > config.MAX_WEEKLY_CYCLE
+    assert plan.restarts == 0
+
+def test_identical_loads_are_simulated_once(config):
+    drivers = [DispatchDriver(i) for i in range(5)]
+    loads = [DispatchLoad(i, 600, 600) for i in range(5)]
+
+    plan = plan_dispatch(drivers, loads, config)
+    assert len(plan.assignments) == 5
+    assert plan.simulations == 1
+
+
+def test_fleet_scale_plans_in_seconds(config):
+    rng = random.Random(11)
+    drivers = [DispatchDriver(i, rng.uniform(0, 50), rng.uniform(0, 24)) for i in range(300)]
+    loads = [DispatchLoad(i, miles, miles * 1.1, 30) for i, miles in
+             enumerate(rng.randrange(50, 3000, 25) for _ in range(3000))]
+
+    started = time.perf_counter()
+    plan = plan_dispatch(drivers, loads, config)
+    assert time.perf_counter() - started < 10
+    assert len(plan.assignments) == len(loads)
+
+
+@pytest.mark.django_db
+def test_dispatch_endpoint():
+    payload = {
+        "drivers": [{"id": "d1", "current_cycle_hour": 10}, {"id": "d2", "available_at_hrs": 5}],
+        "trips": [
+            {"id": "t1", "total_distance_miles": 600, "total_driving_time": 600},
+            {"id": "t2", "total_distance_miles": 300, "total_driving_time": 320, "pickup_time": 30},
+        ],
+    }
+    response = APIClient().post("/api/logs/dispatch_trips/", payload, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["assigned_count"] == 2
+    assert {a["trip_id"] for a in response.data["assignments"]} == {"t1", "t2"}
+    assert response.data["unassigned"] == []
+
+    payload["trips"][0].pop("total_driving_time")
+    response = APIClient().post("/api/logs/dispatch_trips/", payload, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["error"].startswith("trips[0]")
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("driver, trip", [
+    ({}, {"total_driving_time": -600}),
+    ({"current_cycle_hour": -5}, {}),
+    ({"available_at_hrs": "inf"}, {}),
+    ({}, {"total_distance_miles": "nan"}),
+])
+def test_dispatch_rejects_negative_and_non_finite_numbers(driver, trip):
+    payload = {
+        "drivers": [{"id": "d1", **driver}],
+        "trips": [{"id": "t1", "total_distance_miles": 600, "total_driving_time": 600, **trip}],
+    }
+    response = APIClient().post("/api/logs/dispatch_trips/", payload, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "non-negative number" in response.data["error"]
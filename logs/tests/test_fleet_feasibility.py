@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from logs.config import HOSConfig
+from logs.feasibility import validate_trip_feasibility
+from logs.fleet_feasibility import feasibility_matrix, validate_trip_feasibility_batch
+
+@pytest.fixture
+def config() -> HOSConfig:
+    """Fixture to provide HOSConfig instance for tests."""
+    return HOSConfig()
+
+@pytest.fixture
+def pairs():
+    """Random driver/trip pairs, including refuel and break boundaries."""
+    rng = np.random.default_rng(7)
+    dist = np.concatenate([rng.uniform(0, 6000, 5000), [0.0, 980.0, 1960.0, 400.0]])
+    mins = np.concatenate([rng.uniform(0, 6000, 5000), [0.0, 600.0, 390.0, 600.0]])
+    cycle = np.concatenate([rng.uniform(0, 70, 5000), [0.0, 55.0, 61.0, 58.0]])
+    return dist, mins, cycle
+
+
+def test_batch_matches_scalar_service(config, pairs):
+    """Every pair gets exactly the verdict of validate_trip_feasibility."""
+    dist, mins, cycle = pairs
+    result = validate_trip_feasibility_batch(dist, mins, config, cycle)
+
+    expected = [
+        validate_trip_feasibility(float(d), float(m), config, float(c))[0]
+        for d, m, c in zip(dist, mins, cycle)
+    ]
+    assert result.feasible.tolist() == expected
+
+def test_batch_predictions(config):
+    """On-duty hours, fuel stops and breaks are reported per pair."""
+    result = validate_trip_feasibility_batch([400.0, 2000.0], [600.0, 600.0], config, [58.0, 0.0])
+
+    assert result.fuel_stops.tolist() == [0, 2]
+    assert result.breaks.tolist() == [1, 1]
+    assert result.predicted_on_duty_hrs.tolist() == [12.0, 13.0]
+    assert result.feasible.tolist() == [True, True]
+    assert result.remaining_cycle_hrs.tolist() == [12.0, 70.0]
+
+def test_feasibility_matrix(config):
+    """The driver x trip matrix agrees with the scalar service cell by cell."""
+    drivers = np.array([0.0, 40.0, 65.0])
+    dist = np.array([300.0, 1000.0, 3000.0])
+    mins = np.array([300.0, 1200.0, 3000.0])
+
+    matrix = feasibility_matrix(drivers, dist, mins, config)
+
+    assert matrix.shape == (3, 3)
+    for i, cycle in enumerate(drivers):
+        for j in range(3):
+            assert matrix[i, j] == validate_trip_feasibility(dist[j], mins[j], config, cycle)[0]
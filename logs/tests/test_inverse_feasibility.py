@@ -0,0 +1,92 @@
+import random
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from logs.config import HOSConfig
+from logs.feasibility import validate_trip_feasibility
+from logs.inverse_feasibility import MINUTE_RESOLUTION, feasibility_breakpoints, max_trip
+
+
+@pytest.fixture
+def config():
+    return HOSConfig()
+
+
+def passes(minutes, mph, config, cycle_hour):
+    return validate_trip_feasibility(minutes / 60 * mph, minutes, config, cycle_hour)[0]
+
+
+def test_max_trip_is_the_feasibility_boundary(config):
+    """The longest trip passes the feasibility check and anything longer fails it."""
+    rng = random.Random(3)
+    for _ in range(300):
+        cycle_hour = rng.uniform(0, 69)
+        mph = rng.uniform(20, 80)
+        result = max_trip(cycle_hour, mph, config)
+
+        if result.max_driving_minutes:
+            assert passes(result.max_driving_minutes, mph, config, cycle_hour)
+        for extra in (MINUTE_RESOLUTION * 2, 1, 30):
+            assert not passes(result.max_driving_minutes + extra, mph, config, cycle_hour)
+        assert result.max_distance_miles == pytest.approx(result.max_driving_minutes / 60 * mph, abs=1e-3)
+
+
+def test_max_trip_below_a_break_boundary(config):
+    """Right where a break would be added the supremum itself is not legal."""
+    # 8.2h left: 6.5h driving + 1.5h fixed = 8h of work adds a break (8.5h on duty)
+    result = max_trip(61.8, 50, config)
+    assert result.max_driving_minutes == pytest.approx(389.99, abs=1e-9)
+
+
+def test_max_trip_with_spent_cycle(config):
+    """A driver with no cycle hours left cannot take any trip."""
+    result = max_trip(69, 60, config)
+    assert result.max_driving_minutes == 0.0
+    assert result.max_distance_miles == 0.0
+
+
+def test_breakpoint_table_interpolates_the_boundary(config):
+    """Interpolating between breakpoints reproduces max_trip at any cycle hour."""
+    mph = 57.5
+    table = feasibility_breakpoints(mph, config)
+    hours = [row["cycle_hour"] for row in table]
+    assert hours == sorted(hours)
+    assert hours[0] == 0.0 and hours[-1] == config.MAX_WEEKLY_CYCLE
+
+    for cycle_hour in [0, 3.3, 17.25, 41.0, 66.6]:
+        upper = next(i for i, row in enumerate(table) if row["cycle_hour"] >= cycle_hour)
+        lower = max(upper - 1, 0)
+        a, b = table[lower], table[upper]
+        span = b["cycle_hour"] - a["cycle_hour"]
+        fraction = (cycle_hour - a["cycle_hour"]) / span if span else 0.0
+        interpolated = a["max_driving_minutes"] + fraction * (b["max_driving_minutes"] - a["max_driving_minutes"])
+        assert max_trip(cycle_hour, mph, config).max_driving_minutes == pytest.approx(interpolated, abs=0.02)
+
+
+@pytest.mark.django_db
+def test_max_trip_endpoint():
+    """The endpoint answers max_trip with its breakpoint table."""
+    client = APIClient()
+    response = client.get("/api/logs/max_trip/", {"current_cycle_hour": 20, "mph": 55})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["max_driving_minutes"] == max_trip(20, 55).max_driving_minutes
+    assert response.data["breakpoints"][0]["cycle_hour"] == 0.0
+
+    response = client.get("/api/logs/max_trip/", {"current_cycle_hour": 20})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("params", [
+    {"current_cycle_hour": 20, "mph": "inf"},
+    {"current_cycle_hour": "nan", "mph": 55},
+    {"current_cycle_hour": 20, "mph": -5},
+])
+def test_max_trip_endpoint_rejects_bad_numbers(params):
+    """Infinite, NaN and negative speeds answer 400 instead of failing the request."""
+    response = APIClient().get("/api/logs/max_trip/", params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
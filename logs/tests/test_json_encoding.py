@@ -0,0 +1,87 @@
+import pytest
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from logs.config import HOSConfig
+from logs.json_encoding import LogbookDays, render_json, render_logbook_json
+from logs.logbook_generator import ENGINES, LogbookGenerator
+from logs.renderers import LogbookJSONRenderer
+
+
+def _generate(total_dist, total_time_mins, pickup_mins, cycle=0.0, engine="event", allow_restart=False):
+    generator = LogbookGenerator(
+        total_dist, total_time_mins, HOSConfig(),
+        current_cycle_hour=cycle, engine=engine, allow_restart=allow_restart,
+    )
+    return LogbookDays(generator.generate(pickup_time_mins=pickup_mins), generator.segments)
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("total_dist, total_time_mins, pickup_mins, cycle, allow_restart", [
+    (0, 0, 0, 0.0, False),
+    (150, 180, 0, 0.0, False),
+    (600, 600, 45, 12.5, False),
+    (1234, 1400, 700, 30.0, False),
+    (10000, 9000, 900, 0.0, False),
+    (6000, 6000, 3000, 65.0, True),
+])
+def test_output_is_byte_identical(engine, total_dist, total_time_mins, pickup_mins, cycle, allow_restart):
+    """Generator output encodes to exactly the bytes of the generic encoder."""
+    days = _generate(total_dist, total_time_mins, pickup_mins, cycle, engine, allow_restart)
+
+    assert render_logbook_json(days, days.segments) == render_json(days) == JSONRenderer().render(days)
+
+def test_negative_zero_hours_keep_their_sign():
+    """0.0 and -0.0 are equal as cache keys but must print differently."""
+    days = _generate(600, 600, 0)
+    days.segments[0].starts[0] = -0.0
+    days[0]["logbook"][0]["hour"] = -0.0
+
+    # A cached 0.0 from an earlier render must not leak into this one
+    warm = _generate(600, 600, 0)
+    render_logbook_json(warm, warm.segments)
+    content = render_logbook_json(days, days.segments)
+
+    assert content.startswith(b'[{"logbook":[{"hour":-0.0,')
+    assert content == render_json(days)
+
+@pytest.mark.parametrize("change", [
+    lambda days: days[0].__setitem__("timeSpentInDriving", 11),
+    lambda days: days[0].__setitem__("timeSpentInDriving", True),
+    lambda days: days[0].__setitem__("extra", 1),
+    lambda days: days.__setitem__(0, dict(reversed(days[0].items()))),
+    lambda days: days.segments.pop(),
+])
+def test_unexpected_shapes_fall_back_to_the_generic_encoder(change):
+    """Anything the generator would not write is encoded generically."""
+    days = _generate(3000, 3000, 60)
+    change(days)
+
+    assert render_logbook_json(days, days.segments) == render_json(days)
+
+def test_non_finite_values_are_rejected_like_the_generic_encoder():
+    """NaN has no JSON encoding on either path."""
+    days = _generate(600, 600, 0)
+    days[0]["totalTimeTraveled"] = float("nan")
+
+    with pytest.raises(ValueError):
+        render_logbook_json(days, days.segments)
+
+def test_renderer_uses_generic_path_without_segments_or_with_indent():
+    """Plain data and indented responses render exactly like JSONRenderer."""
+    days = _generate(1500, 1500, 60)
+    renderer = LogbookJSONRenderer()
+
+    assert renderer.render(days) == render_logbook_json(days, days.segments)
+    assert renderer.render({"error": "x"}) == JSONRenderer().render({"error": "x"})
+    indented = renderer.render(days, "application/json; indent=2")
+    assert indented == JSONRenderer().render(list(days), "application/json; indent=2")
+    assert indented.startswith(b"[\n")
+
+def test_generate_logbook_endpoint_uses_logbook_renderer():
+    """The endpoint's JSON body matches what the generic encoder writes."""
+    payload = {"total_distance_miles": 1800, "total_driving_time": 1900, "current_cycle_hour": 4, "pickup_time": 90}
+    response = APIClient().post("/api/logs/generate_logbook/", payload, format="json")
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    assert response.content == render_json(_generate(1800, 1900, 90, cycle=4.0, engine="step"))
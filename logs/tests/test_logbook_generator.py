@@ -0,0 +1,103 @@
+import pytest
+
+from logs.config import HOSConfig
+from logs.logbook_generator import ENGINE_EVENT, ENGINE_STEP, LogbookGenerator
+
+@pytest.fixture
+def config() -> HOSConfig:
+    """Fixture to provide HOSConfig instance for tests."""
+    return HOSConfig()
+
+
+@pytest.mark.parametrize("total_dist, total_time_mins", [
+    (0.0, 0.0),          # Empty trip
+    (300.0, 300.0),      # Short hop
+    (1234.5, 1111.0),    # Odd durations and a refuel
+    (2000.0, 9000.0),    # Slow haul, refuel lands on a slice boundary
+    (10000.0, 9000.0),   # Multi-week haul
+])
+@pytest.mark.parametrize("pickup_time", [0.0, 45.0, 600.0])
+def test_event_engine_matches_stepper(config, total_dist, total_time_mins, pickup_time):
+    """The event-jump engine must produce exactly the per-day output of the stepper."""
+    stepped = LogbookGenerator(total_dist, total_time_mins, config, engine=ENGINE_STEP)
+    jumped = LogbookGenerator(total_dist, total_time_mins, config, engine=ENGINE_EVENT)
+
+    assert jumped.generate(pickup_time) == stepped.generate(pickup_time)
+
+
+def test_event_engine_matches_stepper_with_inexact_step():
+    """Parity also holds when TIME_STEP does not add up exactly in floating point."""
+    config = HOSConfig(TIME_STEP=0.1, REFUEL_DURATION=0.3)
+    stepped = LogbookGenerator(2500.0, 2500.0, config, engine=ENGINE_STEP).generate(70.0)
+    jumped = LogbookGenerator(2500.0, 2500.0, config, engine=ENGINE_EVENT).generate(70.0)
+
+    assert jumped == stepped
+
+
+def test_event_engine_iterates_per_duty_change(config):
+    """The event engine's loop count tracks duty changes, not trip length."""
+    stepped = LogbookGenerator(10000.0, 9000.0, config, engine=ENGINE_STEP)
+    jumped = LogbookGenerator(10000.0, 9000.0, config, engine=ENGINE_EVENT)
+    stepped.generate(60.0)
+    jumped.generate(60.0)
+
+    assert jumped.iterations * 4 < stepped.iterations
+
+
+def test_unknown_engine_rejected(config):
+    """Selecting an engine that does not exist fails loudly."""
+    with pytest.raises(ValueError, match="Unknown engine"):
+        LogbookGenerator(100.0, 120.0, config, engine="warp")
+
+
+def _restart_days(logbooks):
+    return [
+        index for index, day in enumerate(logbooks)
+        if any(entry.get("action") == "34-hour restart" for entry in day["logbook"])
+    ]
+
+
+def test_cycle_restart_inserted_when_cycle_runs_out(config):
+    """Work past the remaining cycle hours is preceded by a 34-hour restart."""
+    logbooks = LogbookGenerator(3000, 3000, config, current_cycle_hour=60, allow_restart=True).generate(60)
+    restart_days = _restart_days(logbooks)
+    assert restart_days
+
+    day_totals = [day["timeSpentInOnDuty"] + day["timeSpentInDriving"] for day in logbooks]
+    # Everything before the restart fits into the 10 hours that were left
+    assert sum(day_totals[:restart_days[0]]) <= 10.0
+
+    # Total driving still adds up to the full trip
+    assert sum(day["timeSpentInDriving"] for day in logbooks) == pytest.approx(50.0)
+
+
+def test_cycle_never_exceeded_between_restarts(config):
+    """No rolling 8-day window after a restart holds more than 70 on-duty hours."""
+    logbooks = LogbookGenerator(14000, 14000, config, current_cycle_hour=40, allow_restart=True).generate(60)
+    restart_days = _restart_days(logbooks)
+    assert len(restart_days) >= 2
+
+    day_totals = [day["timeSpentInOnDuty"] + day["timeSpentInDriving"] for day in logbooks]
+    for first, last in zip(restart_days, [*restart_days[1:], len(logbooks)]):
+        # A restart spans whole days, so the day it ends on only has post-restart work
+        run = day_totals[first + 1:last]
+        for end in range(len(run)):
+            assert sum(run[max(0, end - 7):end + 1]) <= config.MAX_WEEKLY_CYCLE
+
+
+def test_no_restart_without_opt_in(config):
+    """Cycle tracking alone leaves the plan untouched."""
+    tracked = LogbookGenerator(3000, 3000, config, current_cycle_hour=60).generate(60)
+    assert not _restart_days(tracked)
+    assert tracked == LogbookGenerator(3000, 3000, config).generate(60)
+
+
+@pytest.mark.parametrize("step_config", [HOSConfig(), HOSConfig(TIME_STEP=0.1, REFUEL_DURATION=0.3)])
+@pytest.mark.parametrize("current_cycle_hour", [0.0, 33.3, 69.9, 75.0])
+def test_event_engine_matches_stepper_with_restarts(step_config, current_cycle_hour):
+    kwargs = {"current_cycle_hour": current_cycle_hour, "allow_restart": True}
+    stepped = LogbookGenerator(9000, 8000, step_config, engine=ENGINE_STEP, **kwargs)
+    jumped = LogbookGenerator(9000, 8000, step_config, engine=ENGINE_EVENT, **kwargs)
+
+    assert jumped.generate(700) == stepped.generate(700)
+    assert jumped.iterations < stepped.iterations
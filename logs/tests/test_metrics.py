@@ -0,0 +1,89 @@
+import threading
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from logs.metrics import REQUESTS, Counter, Histogram
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture
+def api_url():
+    return "/api/logs/generate_logbook/"
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def payload():
+    return {
+        "total_distance_miles": 900,
+        "total_driving_time": 840,
+        "current_cycle_hour": 5,
+        "pickup_time": 45,
+    }
+
+
+def test_server_timing_header_lists_stages(api_client, api_url, payload):
+    """Each stage of a generated logbook shows up in Server-Timing."""
+    response = api_client.post(api_url, data=payload, format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+    stages = [part.split(";")[0] for part in response["Server-Timing"].split(", ")]
+    assert stages == ["parse", "cache", "feasibility", "generate", "render"]
+
+def test_metrics_endpoint_exposes_histograms(api_client, api_url, payload):
+    """Requests are aggregated and exposed in the Prometheus text format."""
+    before = REQUESTS.value("200")
+    api_client.post(api_url, data=payload, format='json')
+
+    response = api_client.get("/metrics")
+    body = response.content.decode()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"].startswith("text/plain")
+    assert REQUESTS.value("200") == before + 1
+    assert "# TYPE logbook_request_duration_seconds histogram" in body
+    assert 'logbook_stage_duration_seconds_bucket{stage="generate",le="+Inf"}' in body
+    assert "logbook_simulated_days_count" in body
+    assert "logbook_entries_per_trip_sum" in body
+
+def test_disabled_metrics_add_no_header(api_client, api_url, payload, settings):
+    """With metrics disabled the response carries no timing data."""
+    settings.LOGBOOK_METRICS = {"ENABLED": False}
+    response = api_client.post(api_url, data=payload, format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "Server-Timing" not in response
+
+def test_histogram_buckets_are_cumulative():
+    """Bucket samples are cumulative and end in +Inf."""
+    histogram = Histogram("sample", "Sample.", (1, 5))
+    for value in (0.5, 1, 3, 10):
+        histogram.observe(value)
+
+    assert histogram.samples() == [
+        'sample_bucket{le="1"} 2',
+        'sample_bucket{le="5"} 3',
+        'sample_bucket{le="+Inf"} 4',
+        "sample_sum 14.5",
+        "sample_count 4",
+    ]
+
+def test_counter_is_thread_safe():
+    """Concurrent increments from many threads are never lost."""
+    counter = Counter("hits", "Hits.", ("status",))
+
+    def bump():
+        for _ in range(10000):
+            counter.inc("200")
+
+    threads = [threading.Thread(target=bump) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.value("200") == 80000
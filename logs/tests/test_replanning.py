@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from logs.config import HOSConfig
+from logs.logbook_generator import ENGINE_EVENT, ENGINE_STEP, LogbookGenerator
+from logs.replanning import PlanParams, plan_with_checkpoints, replan
+
+
+@pytest.fixture
+def config():
+    return HOSConfig()
+
+
+def test_one_checkpoint_per_day_boundary(config):
+    """Checkpoints are recorded once per day boundary, in day order."""
+    plan = plan_with_checkpoints(PlanParams(6000, 6000, 60), config)
+
+    # At most one per midnight the driving loop runs past
+    assert 0 < len(plan.checkpoints) <= len(plan.logbooks) - 1
+    assert [cp.day_index for cp in plan.checkpoints] == sorted({cp.day_index for cp in plan.checkpoints})
+
+
+def test_resume_reproduces_the_rest_of_the_trip(config):
+    """Resuming from any checkpoint yields exactly the days after it."""
+    generator = LogbookGenerator(6000, 6000, config, record_checkpoints=True)
+    logbooks = generator.generate(pickup_time_mins=60)
+
+    for checkpoint in generator.checkpoints:
+        resumed = LogbookGenerator(6000, 6000, config)
+        suffix = list(resumed.resume_days(checkpoint, pickup_time_mins=60))
+        assert logbooks[:checkpoint.day_index] + suffix == logbooks
+
+
+@pytest.mark.parametrize("change, reuses_days", [
+    ({"total_dist": 9000, "total_time_mins": 9000}, True),  # Longer trip, same speed
+    ({"total_time_mins": 1200, "total_dist": 1200}, True),  # Shorter trip
+    ({"pickup_time_mins": 4000}, True),                      # Later pickup
+    ({"pickup_time_mins": 30}, False),                       # Earlier pickup
+    ({"total_dist": 6500}, False),                           # Different speed from the start
+    ({"current_cycle_hour": 20}, False),
+])
+def test_replan_matches_full_run(config, change, reuses_days):
+    """A replan equals a full run, reusing days only when the edit leaves a prefix unchanged."""
+    base = PlanParams(total_dist=6000, total_time_mins=6000, pickup_time_mins=3000, allow_restart=True)
+    plan = plan_with_checkpoints(base, config)
+    params = PlanParams(**{**base.__dict__, **change})
+
+    replanned = replan(plan, params)
+    assert replanned.logbooks == plan_with_checkpoints(params, config).logbooks
+    assert (replanned.simulated_days < len(replanned.logbooks)) == reuses_days
+
+
+def test_random_edits_match_full_runs(config):
+    """Chained random edits, across both engines, keep matching full runs."""
+    rng = random.Random(5)
+    plan = plan_with_checkpoints(PlanParams(9000, 9000, 60, 30, True), config, engine=ENGINE_STEP)
+    for _ in range(25):
+        minutes = rng.choice([3000, 9000, 12000, 15000])
+        params = PlanParams(minutes, minutes, rng.choice([60, 600, 5000]), 30, True)
+        engine = rng.choice([ENGINE_STEP, ENGINE_EVENT])
+
+        replanned = replan(plan, params, engine=engine)
+        assert replanned.logbooks == plan_with_checkpoints(params, config).logbooks
+        plan = replanned
+
+
+def test_suffix_edit_only_simulates_changed_days(config):
+    """Lengthening a long trip simulates only the last few days again."""
+    plan = plan_with_checkpoints(PlanParams(12000, 12000, 60), config)
+    replanned = replan(plan, PlanParams(13200, 13200, 60))
+
+    assert len(replanned.logbooks) > 15
+    assert replanned.simulated_days <= 5
@@ -0,0 +1,105 @@
+import json
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from logs.config import HOSConfig
+from logs.result_cache import LogbookResultCache, get_result_cache, trip_cache_key
+from logs.services import TripRequest
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture
+def api_url():
+    return "/api/logs/generate_logbook/"
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def payload():
+    return {
+        "total_distance_miles": 1200,
+        "total_driving_time": 1080,
+        "current_cycle_hour": 15,
+        "pickup_time": 60,
+    }
+
+
+def test_repeat_request_is_served_from_cache(api_client, api_url, payload):
+    """The second identical request is a hit with byte-identical output."""
+    first = api_client.post(api_url, data=payload, format='json')
+    second = api_client.post(api_url, data=payload, format='json')
+
+    assert first.status_code == second.status_code == status.HTTP_200_OK
+    assert second.content == first.content
+    assert second["Content-Type"] == first["Content-Type"] == "application/json"
+    assert json.loads(second.content) == first.data
+
+    stats = api_client.get("/api/logs/cache_stats/").data
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+def test_equivalent_inputs_share_a_key():
+    """Integer and float spellings of the same trip normalize to one key."""
+    config = HOSConfig()
+    as_ints = TripRequest(1200, 1080, 15, 60)
+    as_floats = TripRequest(1200.0, 1080.0, 15.0, 60.0)
+
+    assert trip_cache_key(as_ints, config) == trip_cache_key(as_floats, config)
+
+def test_config_change_changes_key():
+    """A different HOSConfig never reuses another config's results."""
+    trip = TripRequest(1200, 1080, 15, 60)
+
+    assert trip_cache_key(trip, HOSConfig()) != trip_cache_key(trip, HOSConfig(REFUEL_THRESHOLD_MILES=500.0))
+
+def test_lru_evicts_by_entries_and_bytes():
+    """Least recently used entries go first once either bound is exceeded."""
+    cache = LogbookResultCache(max_entries=2, max_bytes=10)
+    cache.set("a", b"1111")
+    cache.set("b", b"2222")
+    cache.get("a")
+    cache.set("c", b"3333")    # Entry bound: evicts b
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1111"
+
+    cache.set("d", b"44444444")  # Byte bound: evicts a and c
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+    assert cache.stats()["evictions"] == 3
+
+def test_ttl_expires_entries(monkeypatch):
+    """Entries older than the TTL are treated as misses."""
+    now = [1000.0]
+    monkeypatch.setattr("logs.result_cache.time.monotonic", lambda: now[0])
+    cache = LogbookResultCache(ttl=60)
+    cache.set("a", b"1")
+
+    now[0] += 61
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+def test_shared_tier_populates_local_cache(settings):
+    """A result stored by another worker is picked up from the shared backend."""
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "shared-test"},
+    }
+    other_worker = LogbookResultCache(shared_alias="shared")
+    this_worker = LogbookResultCache(shared_alias="shared")
+    other_worker.set("k", b"payload")
+
+    assert this_worker.get("k") == b"payload"
+    assert this_worker.get("k") == b"payload"
+    assert this_worker.stats()["shared_hits"] == 1
+    assert this_worker.stats()["hits"] == 1
+
+def test_cache_can_be_disabled(settings):
+    """With the cache disabled there is nothing to look up."""
+    settings.LOGBOOK_RESULT_CACHE = {**settings.LOGBOOK_RESULT_CACHE, "ENABLED": False}
+
+    assert get_result_cache() is None
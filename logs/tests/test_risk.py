@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from logs.config import HOSConfig
+from logs.risk import RiskModel, analyze_trip_risk, parse_distribution, plan_trip_activities, simulate_runs
+from logs.services import TripInputError, TripRequest
+
+CONFIG = HOSConfig()
+DEFAULTS = {
+    "speed": {"kind": "normal", "mean": 1.0, "sd": 0.1, "min": 0.5, "max": 1.25},
+    "pickup_dwell": {"kind": "lognormal", "mean": 0.75, "sd": 0.5},
+    "refuel": {"kind": "triangular", "low": 0.25, "mode": 0.5, "high": 1.0},
+}
+AS_PLANNED = RiskModel.from_specs({
+    "speed": {"kind": "fixed", "value": 1.0},
+    "pickup_dwell": {"kind": "fixed", "value": CONFIG.PICKUP_DURATION},
+    "refuel": {"kind": "fixed", "value": CONFIG.REFUEL_DURATION},
+})
+PAYLOAD = {"total_distance_miles": 1200, "total_driving_time": 1300, "current_cycle_hour": 10, "pickup_time": 60}
+
+
+@pytest.mark.parametrize("trip", [
+    TripRequest(600, 600, 0, 0),
+    TripRequest(2500, 2700, 20, 300),
+    TripRequest(6000, 6500, 60, 45, allow_restart=True),
+])
+def test_unperturbed_replay_matches_the_plan(trip):
+    """With every draw at its planned value, runs arrive on time and break nothing."""
+    plan = plan_trip_activities(trip, CONFIG)
+    arrivals, violations = simulate_runs(plan, AS_PLANNED, 4, np.random.default_rng(0), CONFIG)
+
+    assert arrivals == pytest.approx([plan.planned_arrival_hrs] * 4)
+    assert not any(flags.any() for flags in violations.values())
+
+def test_plan_joins_midnight_splits_and_stops_at_drop_off():
+    plan = plan_trip_activities(TripRequest(2500, 2700, 0, 60), CONFIG)
+
+    assert plan.durations.sum() == pytest.approx(plan.planned_arrival_hrs)
+    assert len(plan.shift_spans) == 5
+    # A 10-hour reset is one activity even when it crosses midnight
+    assert (plan.durations == CONFIG.SLEEPER_BERTH_REQUIRED).sum() == 4
+
+def test_much_slower_driving_runs_a_full_shift_past_the_duty_window():
+    slow = RiskModel.from_specs(
+        {"speed": {"kind": "fixed", "value": 0.7}, "pickup_dwell": DEFAULTS["pickup_dwell"], "refuel": DEFAULTS["refuel"]}
+    )
+    result = analyze_trip_risk(TripRequest(660, 660, 0, 0), CONFIG, slow, runs=50)
+
+    assert result.violation_probability["duty_14h"] == 1.0
+    assert result.violation_probability["any"] == 1.0
+    assert result.arrival_percentiles_hrs["p50"] > result.planned_arrival_hrs
+
+def test_same_seed_same_answer():
+    model = RiskModel.from_specs(DEFAULTS)
+    trip = TripRequest(1200, 1300, 10, 60)
+
+    first = analyze_trip_risk(trip, CONFIG, model, runs=500, seed=3, batch_size=128).as_dict()
+    again = analyze_trip_risk(trip, CONFIG, model, runs=500, seed=3, batch_size=128).as_dict()
+    other = analyze_trip_risk(trip, CONFIG, model, runs=500, seed=4, batch_size=128).as_dict()
+
+    for result in (first, again, other):
+        result.pop("wall_time_ms")
+    assert first == again
+    assert first != other
+
+@pytest.mark.parametrize("spec, message", [
+    ({"kind": "gamma"}, "unknown kind"),
+    ({"kind": "normal", "mean": 1.0}, "needs: sd"),
+    ({"kind": "uniform", "low": 2, "high": 1}, "low <= mode <= high"),
+    ({"kind": "lognormal", "mean": 0, "sd": 1}, "must be positive"),
+    ({"kind": "fixed", "value": "fast"}, "finite number"),
+])
+def test_invalid_distributions(spec, message):
+    with pytest.raises(TripInputError, match=message):
+        parse_distribution("speed", spec)
+
+def test_draws_respect_the_variable_floor():
+    """Speed never reaches zero, whatever the distribution says."""
+    speed = parse_distribution("speed", {"kind": "normal", "mean": 0.0, "sd": 1.0})
+
+    assert speed.sample(np.random.default_rng(0), (1000,)).min() == pytest.approx(0.05)
+
+@pytest.mark.django_db
+def test_risk_analysis_endpoint(settings):
+    settings.LOGBOOK_RISK = {**settings.LOGBOOK_RISK, "DEFAULT_RUNS": 200}
+    client = APIClient()
+
+    response = client.post("/api/logs/risk_analysis/", PAYLOAD, format="json")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["runs"] == 200
+    assert set(response.data["violation_probability"]) == {"duty_14h", "cycle", "any"}
+    assert response.data["arrival_hrs"]["p5"] <= response.data["arrival_hrs"]["p95"]
+
+    override = {**PAYLOAD, "runs": 50, "distributions": {"speed": {"kind": "fixed", "value": 1.0}}}
+    assert client.post("/api/logs/risk_analysis/", override, format="json").data["runs"] == 50
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("extra, message", [
+    ({"runs": 10 ** 9}, "'runs' must be between"),
+    ({"seed": -1}, "non-negative integer"),
+    ({"distributions": {"weather": {"kind": "fixed", "value": 1}}}, "Unknown distributions"),
+    ({"current_cycle_hour": 69.5}, "Insufficient cycle hours"),
+    ({"engine": "split"}, "split engine is not supported"),
+])
+def test_risk_analysis_rejects_bad_requests(extra, message):
+    response = APIClient().post("/api/logs/risk_analysis/", {**PAYLOAD, **extra}, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert message in response.data["error"]
@@ -0,0 +1,137 @@
+import itertools
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from logs.config import HOSConfig
+from logs.logbook_generator import ENGINE_EVENT, ENGINE_STEP, LogbookGenerator
+from logs.result_cache import trip_cache_key
+from logs.route_generator import RouteLeg, RouteLogbookGenerator
+from logs.services import TripInputError, parse_trip_request
+
+CONFIG = HOSConfig()
+
+
+def _driving_hrs_before(generator, remark):
+    """Driving hours logged before the first activity with ``remark``."""
+    driven = 0.0
+    for store in generator.segments:
+        for start, end, row, action in store:
+            if action == remark:
+                return driven
+            if row == "driving":
+                driven += end - start
+    return None
+
+
+# Speeds at which 980-mile refuels fall on the 30-minute grid of the base engine
+@pytest.mark.parametrize("mph, total_hrs, pickup_hrs, cycle, restart", [
+    (49, 30, 0, 0, False),
+    (56, 13.5, 3, 20, False),
+    (40, 70, 9.5, 55, True),
+    (70, 150, 20, 69, True),
+])
+def test_single_speed_route_matches_base_generator(mph, total_hrs, pickup_hrs, cycle, restart):
+    """A pickup leg and a drop-off leg at one speed log exactly what the base generator logs."""
+    base = LogbookGenerator(
+        mph * total_hrs, total_hrs * 60, CONFIG, current_cycle_hour=cycle, engine=ENGINE_EVENT, allow_restart=restart
+    )
+    legs = [
+        RouteLeg(mph * pickup_hrs, pickup_hrs * 60, stop="pickup"),
+        RouteLeg(mph * (total_hrs - pickup_hrs), (total_hrs - pickup_hrs) * 60),
+    ]
+    route = RouteLogbookGenerator(legs, CONFIG, current_cycle_hour=cycle, allow_restart=restart)
+
+    assert route.generate() == base.generate(pickup_time_mins=pickup_hrs * 60)
+    assert route.completed_at_hrs == base.completed_at_hrs
+
+def test_refuel_follows_each_legs_own_speed():
+    """500 miles at 50 mph then 60 mph: 980 miles are reached 8 hours into the second leg."""
+    legs = [RouteLeg(500, 600, dwell_mins=0, stop="stop"), RouteLeg(960, 960, stop="delivery")]
+    route = RouteLogbookGenerator(legs, CONFIG)
+    route.generate()
+
+    assert _driving_hrs_before(route, "Refueling") == pytest.approx(18.0)
+    # One average speed over the route would have put it near 17.45 hours
+    averaged = LogbookGenerator(1460, 1560, CONFIG, engine=ENGINE_STEP)
+    averaged.generate(pickup_time_mins=0)
+    assert _driving_hrs_before(averaged, "Refueling") != pytest.approx(18.0)
+
+def test_every_stop_is_logged_with_its_dwell():
+    legs = [
+        RouteLeg(50, 60, dwell_mins=90, stop="pickup"),
+        RouteLeg(120, 150, dwell_mins=20, stop="stop"),
+        RouteLeg(200, 240, dwell_mins=45, stop="delivery"),
+    ]
+    route = RouteLogbookGenerator(legs, CONFIG)
+    route.generate()
+
+    stops = [(action, end - start) for store in route.segments for start, end, row, action in store if row == "on-duty"]
+    assert stops == [("Pre-trip/TIV", 0.5), ("Pickup", 1.5), ("Stop", pytest.approx(20 / 60)), ("Drop-off", 0.75)]
+
+def test_iterations_track_events_not_slices():
+    legs = [RouteLeg(miles, mins) for miles, mins in itertools.islice(itertools.cycle([(2450, 2700), (3000, 2800)]), 4)]
+    route = RouteLogbookGenerator(legs, CONFIG)
+    stepped = LogbookGenerator(route.total_dist, route.total_driving_required_hrs * 60, CONFIG, engine=ENGINE_STEP)
+    route.generate()
+    stepped.generate(pickup_time_mins=0)
+
+    assert route.iterations * 4 < stepped.iterations
+
+def test_legs_request_parsing():
+    trip = parse_trip_request({
+        "current_cycle_hour": 10,
+        "legs": [
+            {"distance_miles": 40, "driving_time": 50, "stop": "pickup"},
+            {"distance_miles": 600, "driving_time": 560, "dwell_time": 30},
+        ],
+    })
+
+    assert (trip.total_dist, trip.total_time_mins, trip.pickup_time, trip.engine) == (640, 610, 0.0, "route")
+    assert trip.legs[1] == RouteLeg(600, 560, dwell_mins=30, stop="stop")
+
+@pytest.mark.parametrize("legs, message", [
+    ([], "non-empty list"),
+    ([{"distance_miles": 10}], "missing 'driving_time'"),
+    ([{"distance_miles": -1, "driving_time": 10}], "non-negative"),
+    ([{"distance_miles": 10, "driving_time": 0}], "no driving time"),
+    ([{"distance_miles": 10, "driving_time": 10, "stop": "nap"}], "unknown stop"),
+])
+def test_invalid_legs_rejected(legs, message):
+    with pytest.raises(TripInputError, match=message):
+        parse_trip_request({"current_cycle_hour": 0, "legs": legs})
+
+def test_cache_key_tells_routes_apart():
+    """Routes with the same totals but different legs must not share a cached logbook."""
+    fast_first = parse_trip_request({"current_cycle_hour": 0, "legs": [
+        {"distance_miles": 600, "driving_time": 500}, {"distance_miles": 100, "driving_time": 200},
+    ]})
+    slow_first = parse_trip_request({"current_cycle_hour": 0, "legs": [
+        {"distance_miles": 100, "driving_time": 200}, {"distance_miles": 600, "driving_time": 500},
+    ]})
+
+    assert trip_cache_key(fast_first, CONFIG) != trip_cache_key(slow_first, CONFIG)
+
+@pytest.mark.django_db
+def test_generate_logbook_with_legs():
+    response = APIClient().post("/api/logs/generate_logbook/", {
+        "current_cycle_hour": 10,
+        "legs": [
+            {"distance_miles": 30, "driving_time": 40, "stop": "pickup", "dwell_time": 60},
+            {"distance_miles": 550, "driving_time": 600, "stop": "delivery"},
+            {"distance_miles": 700, "driving_time": 650},
+        ],
+    }, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    actions = [entry.get("action") for day in response.json() for entry in day["logbook"]]
+    assert actions.index("Pickup") < actions.index("Delivery") < actions.index("Drop-off")
+
+@pytest.mark.django_db
+def test_generate_logbook_legs_reject_an_engine():
+    response = APIClient().post("/api/logs/generate_logbook/", {
+        "current_cycle_hour": 0, "engine": "step", "legs": [{"distance_miles": 10, "driving_time": 10}],
+    }, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,57 @@
+import pytest
+
+from logs.config import HOSConfig
+from logs.logbook_generator import LogbookGenerator
+from logs.segments import Segment, SegmentStore
+
+@pytest.fixture
+def store() -> SegmentStore:
+    """Fixture to provide an empty SegmentStore for tests."""
+    return SegmentStore()
+
+def test_adjacent_same_status_runs_merge(store):
+    """Back-to-back driving slices collapse into one segment."""
+    for start in (6.0, 6.5, 7.0, 7.5):
+        store.record(start, start + 0.5, "driving")
+
+    assert list(store) == [Segment(6.0, 8.0, "driving", None)]
+
+def test_different_remarks_are_kept_apart(store):
+    """Two on-duty tasks in a row keep their own remarks."""
+    store.record(10.0, 10.5, "on-duty", "Refueling")
+    store.record(10.5, 11.0, "on-duty", "Pickup")
+
+    assert [segment.action for segment in store] == ["Refueling", "Pickup"]
+
+def test_zero_length_segments_are_dropped(store):
+    """A segment that starts and ends at midnight leaves no trace."""
+    store.record(24.0, 24.0, "sleeper", "10-hour Reset (Part 1)")
+
+    assert len(store) == 0
+    assert store.last_row is None
+
+def test_to_logbook_builds_api_points(store):
+    """Materialized points keep the existing hour/row/action shape."""
+    store.record(0.0, 6.5, "off-duty")
+    store.record(6.5, 7.0, "on-duty", "Pre-trip/TIV")
+    store.record(7.0, 9.0, "driving")
+
+    assert store.to_logbook() == [
+        {"hour": 0.0, "row": "off-duty"},
+        {"hour": 6.5, "row": "off-duty", "action": None},
+        {"hour": 6.5, "row": "on-duty"},
+        {"hour": 7.0, "row": "on-duty", "action": "Pre-trip/TIV"},
+        {"hour": 7.0, "row": "driving"},
+        {"hour": 9.0, "row": "driving"},
+    ]
+
+def test_generator_exposes_one_store_per_day():
+    """Each generated day is backed by its own segment store."""
+    generator = LogbookGenerator(total_dist=2000, total_time_mins=2400, config=HOSConfig())
+    logbooks = generator.generate(pickup_time_mins=60)
+
+    assert len(generator.segments) == len(logbooks)
+    for store, day in zip(generator.segments, logbooks):
+        assert store.to_logbook() == day["logbook"]
+        driving = sum(seg.end - seg.start for seg in store if seg.row == "driving")
+        assert round(driving, 2) == day["timeSpentInDriving"]
@@ -0,0 +1,102 @@
+import itertools
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from logs import split_sleeper
+from logs.config import HOSConfig
+from logs.logbook_generator import ENGINE_EVENT, LogbookGenerator
+from logs.services import TripInputError, parse_trip_request
+from logs.split_sleeper import SplitSleeperGenerator, WorkItem, plan_rests, trip_work_items
+
+CONFIG = HOSConfig()
+
+
+def _blocks(plan):
+    """Plan steps with consecutive drive slices joined, as (remark or "drive", hours)."""
+    blocks = []
+    for step in plan.steps:
+        is_drive = isinstance(step, WorkItem) and step.row == "driving"
+        if is_drive and blocks and blocks[-1][0] == "drive":
+            blocks[-1][1] += step.hours
+        else:
+            blocks.append(["drive" if is_drive else step.remark, step.hours])
+    return [tuple(block) for block in blocks]
+
+
+class _KeepEverything:
+    def admit(self, point):
+        return True
+
+
+def test_eight_two_split_beats_a_full_reset():
+    """13 hours of driving: a 2-hour rest that doubles as the break, then 8 in the sleeper."""
+    plan = plan_rests(trip_work_items(700, 780, 60, CONFIG), CONFIG)
+
+    assert _blocks(plan) == [
+        ("Pre-trip/TIV", 0.5), ("drive", 1.0), ("Pickup", 0.5), ("drive", 6.0),
+        ("Split rest (2h)", 2.0), ("drive", 4.0), ("Split sleeper berth (8h)", 8.0),
+        ("drive", 2.0), ("Drop-off", 0.5),
+    ]
+    # The standard plan rests 10 hours plus a 30-minute break
+    assert plan.elapsed_hrs == 24.5
+
+@pytest.mark.parametrize("total_dist, total_time_mins, pickup_time", [
+    (300, 300, 0), (1200, 1300, 60), (2500, 2700, 300), (4000, 4400, 0),
+])
+def test_never_slower_than_the_standard_plan(total_dist, total_time_mins, pickup_time):
+    split = SplitSleeperGenerator(total_dist, total_time_mins, CONFIG)
+    standard = LogbookGenerator(total_dist, total_time_mins, CONFIG, engine=ENGINE_EVENT)
+    days = split.generate(pickup_time)
+    standard.generate(pickup_time)
+
+    assert split.completed_at_hrs <= standard.completed_at_hrs
+    assert sum(day["timeSpentInDriving"] for day in days) == pytest.approx(total_time_mins / 60, abs=0.05)
+    for day in days:
+        total = sum(day[field] for field in (
+            "timeSpentInOffDuty", "timeSpentInOnDuty", "timeSpentInDriving", "timeSpentInSleeperBerth",
+        ))
+        assert total == pytest.approx(24.0)
+
+@pytest.mark.parametrize("total_dist, total_time_mins, pickup_time", itertools.product(
+    [500, 1100], [600, 1000, 1300], [0, 500],
+))
+def test_pruning_keeps_the_optimum(monkeypatch, total_dist, total_time_mins, pickup_time):
+    items = trip_work_items(total_dist, total_time_mins, pickup_time, CONFIG)
+    pruned = plan_rests(items, CONFIG)
+    monkeypatch.setattr(split_sleeper, "_Front", _KeepEverything)
+
+    assert pruned.elapsed_hrs == pytest.approx(plan_rests(items, CONFIG).elapsed_hrs)
+
+def test_week_long_trip_stays_small():
+    """Dominance pruning keeps a six-day haul to a few thousand states."""
+    plan = plan_rests(trip_work_items(4000, 4400, 0, CONFIG), CONFIG)
+
+    assert plan.states_expanded < 10000
+
+def test_splits_can_be_turned_off():
+    config = HOSConfig(SPLIT_SLEEPER_PAIRS=())
+    remarks = {remark for remark, _ in _blocks(plan_rests(trip_work_items(700, 780, 60, config), config))}
+
+    assert "10-hour Reset" in remarks
+    assert not any(remark.startswith("Split") for remark in remarks)
+
+def test_split_engine_rejects_restarts():
+    with pytest.raises(TripInputError, match="34-hour restarts"):
+        parse_trip_request({
+            "total_distance_miles": 700, "total_driving_time": 780, "current_cycle_hour": 0,
+            "pickup_time": 60, "engine": "split", "allow_restart": True,
+        })
+
+@pytest.mark.django_db
+def test_generate_logbook_with_split_engine():
+    response = APIClient().post("/api/logs/generate_logbook/", {
+        "total_distance_miles": 700, "total_driving_time": 780, "current_cycle_hour": 0,
+        "pickup_time": 60, "engine": "split",
+    }, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    actions = [entry.get("action") for day in response.json() for entry in day["logbook"]]
+    assert "Split sleeper berth (8h)" in actions
+    assert "10-hour Reset" not in actions
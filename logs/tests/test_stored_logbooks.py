@@ -0,0 +1,103 @@
+import json
+from unittest import mock
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from logs.config import HOSConfig
+from logs.logbook_generator import LogbookGenerator
+from logs.models import GeneratedLogbook, LogbookTrip
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def trip():
+    return LogbookTrip.objects.create(
+        total_distance_miles=1500,
+        total_driving_time_mins=1500,
+        pickup_time_mins=60,
+        current_cycle_hour=0,
+    )
+
+
+def logbook_url(trip):
+    return f"/api/logs/{trip.pk}/logbook/"
+
+
+def test_first_read_generates_and_stores_compressed_logbook(api_client, trip):
+    response = api_client.get(logbook_url(trip))
+
+    assert response.status_code == status.HTTP_200_OK
+    expected = LogbookGenerator(1500, 1500, HOSConfig()).generate(pickup_time_mins=60)
+    assert response.json() == expected
+
+    stored = GeneratedLogbook.objects.get(trip=trip)
+    assert response["ETag"] == f'"{stored.etag}"'
+    assert stored.rendered_content() == response.content
+    assert len(stored.content) < len(response.content) / 4
+
+
+def test_later_reads_are_served_from_storage(api_client, trip):
+    first = api_client.get(logbook_url(trip))
+
+    with mock.patch("logs.stored_logbooks.generate_trip_json") as generate:
+        second = api_client.get(logbook_url(trip))
+
+    generate.assert_not_called()
+    assert second.content == first.content
+    assert second["ETag"] == first["ETag"]
+
+
+def test_matching_if_none_match_returns_304(api_client, trip):
+    etag = api_client.get(logbook_url(trip))["ETag"]
+
+    response = api_client.get(logbook_url(trip), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response["ETag"] == etag
+    assert response.content == b""
+
+    response = api_client.get(logbook_url(trip), HTTP_IF_NONE_MATCH=f'"stale", W/{etag}')
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    response = api_client.get(logbook_url(trip), HTTP_IF_NONE_MATCH='"stale"')
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_etag_changes_with_inputs_and_stale_copy_is_replaced(api_client, trip):
+    old_etag = api_client.get(logbook_url(trip))["ETag"]
+
+    trip.total_distance_miles = 1200
+    trip.save()
+    response = api_client.get(logbook_url(trip), HTTP_IF_NONE_MATCH=old_etag)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] != old_etag
+    assert GeneratedLogbook.objects.count() == 1
+    assert json.loads(GeneratedLogbook.objects.get().rendered_content()) == response.json()
+
+
+def test_etag_changes_with_engine_version(api_client, trip):
+    old_etag = api_client.get(logbook_url(trip))["ETag"]
+
+    with mock.patch("logs.result_cache.ENGINE_VERSION", 999):
+        assert api_client.get(logbook_url(trip))["ETag"] != old_etag
+
+
+def test_infeasible_trip_is_rejected_and_not_stored(api_client):
+    trip = LogbookTrip.objects.create(
+        total_distance_miles=2000,
+        total_driving_time_mins=2000,
+        pickup_time_mins=60,
+        current_cycle_hour=65,
+    )
+
+    response = api_client.get(logbook_url(trip))
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not GeneratedLogbook.objects.exists()
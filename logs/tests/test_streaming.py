@@ -0,0 +1,76 @@
+import json
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from logs.config import HOSConfig
+from logs.logbook_generator import LogbookGenerator
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture
+def api_url():
+    return "/api/logs/generate_logbook/"
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def payload():
+    return {
+        "total_distance_miles": 3000,
+        "total_driving_time": 3000,
+        "current_cycle_hour": 0,
+        "pickup_time": 60,
+    }
+
+
+def test_iter_days_yields_days_as_they_are_sealed():
+    """Days come out one at a time and match the batch output."""
+    config = HOSConfig()
+    days = LogbookGenerator(4000, 4200, config).iter_days(pickup_time_mins=60)
+
+    first_day = next(days)
+    assert first_day["logbook"][0]["hour"] == 0.0
+
+    expected = LogbookGenerator(4000, 4200, config).generate(pickup_time_mins=60)
+    assert [first_day, *days] == expected
+
+def test_iter_days_keeps_no_sealed_days():
+    """While streaming only the current day's segments are held; generate() keeps them all."""
+    config = HOSConfig()
+    streamed = LogbookGenerator(4000, 4200, config)
+    day_count = sum(1 for _ in streamed.iter_days(pickup_time_mins=60))
+    assert streamed.segments == [] and not streamed.logbooks
+
+    generated = LogbookGenerator(4000, 4200, config)
+    logbooks = generated.generate(pickup_time_mins=60)
+    assert len(generated.segments) == len(logbooks) == day_count
+
+def test_streaming_ndjson_response(api_client, api_url, payload):
+    """The NDJSON mode streams one day per line, matching the JSON body."""
+    response = api_client.post(api_url, data=payload, format='json', HTTP_ACCEPT="application/x-ndjson")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    assert response["Content-Type"] == "application/x-ndjson"
+
+    lines = b"".join(response.streaming_content).decode().splitlines()
+    regular = api_client.post(api_url, data=payload, format='json')
+    assert [json.loads(line) for line in lines] == regular.data
+
+def test_streaming_via_format_override(api_client, api_url, payload):
+    """?format=ndjson selects the streaming mode as well."""
+    response = api_client.post(f"{api_url}?format=ndjson", data=payload, format='json')
+
+    assert response.streaming
+
+def test_streaming_rejects_infeasible_trip_up_front(api_client, api_url, payload):
+    """Feasibility errors are reported before any day is streamed."""
+    payload["current_cycle_hour"] = 69
+    response = api_client.post(api_url, data=payload, format='json', HTTP_ACCEPT="application/x-ndjson")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Insufficient cycle hours" in json.loads(response.content)["error"]
@@ -0,0 +1,97 @@
+import xml.etree.ElementTree as ET
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from logs.benchmarks import benchmark_trips, run_benchmarks
+from logs.config import HOSConfig
+from logs.json_encoding import LogbookDays
+from logs.logbook_generator import ENGINE_EVENT, LogbookGenerator
+from logs.renderers import SVGRenderer
+from logs.segments import SegmentStore
+from logs.svg_logbook import GRID_ID, _document_head, grid_background, iter_svg_document, render_day
+
+SVG = "{http://www.w3.org/2000/svg}"
+PAYLOAD = {"total_distance_miles": 2500, "total_driving_time": 2700, "current_cycle_hour": 10, "pickup_time": 60}
+
+
+def _days(total_dist=2500.0, total_time_mins=2700.0, pickup_time=60.0):
+    generator = LogbookGenerator(total_dist, total_time_mins, HOSConfig(), engine=ENGINE_EVENT)
+    return LogbookDays(generator.generate(pickup_time_mins=pickup_time), generator.segments)
+
+
+def test_document_draws_every_day_over_one_shared_grid():
+    days = _days()
+    root = ET.fromstring(b"".join(iter_svg_document(days, days.segments)))
+
+    assert len(root.findall(f"{SVG}defs/{SVG}g[@id='{GRID_ID}']")) == 1
+    groups = root.findall(f"{SVG}g")
+    assert len(groups) == len(days)
+    for group, store in zip(groups, days.segments):
+        assert group.find(f"{SVG}use").get("href") == f"#{GRID_ID}"
+        points = group.find(f"{SVG}polyline").get("points").split()
+        assert len(points) == 2 * len(store)
+
+def test_polyline_follows_the_segments():
+    store = SegmentStore()
+    store.record(0.0, 6.5, "off-duty")
+    store.record(6.5, 7.0, "on-duty", "Pre-trip/TIV")
+    store.record(7.0, 18.0, "driving")
+    store.record(18.0, 24.0, "sleeper", "10-hour Reset (Part 1)")
+    group = ET.fromstring(f'<svg xmlns="http://www.w3.org/2000/svg">{render_day(store, {}, 0)}</svg>')[0]
+
+    points = [tuple(map(float, point.split(","))) for point in group.find(f"{SVG}polyline").get("points").split()]
+    # Hours map to x, rows to y: off-duty, on-duty, driving then sleeper
+    assert [x for x, _ in points] == [170, 430, 430, 450, 450, 890, 890, 1130]
+    assert [y for _, y in points[::2]] == [55, 145, 115, 85]
+    # After the title and the four row totals
+    remarks = [text.text for text in group.findall(f"{SVG}text")][5:]
+    assert remarks == ["Pre-trip/TIV", "10-hour Reset (Part 1)"]
+
+def test_remarks_are_escaped():
+    store = SegmentStore()
+    store.record(0.0, 24.0, "on-duty", "Dock <7> & yard")
+    group = ET.fromstring(f'<svg xmlns="http://www.w3.org/2000/svg">{render_day(store, {}, 0)}</svg>')[0]
+
+    assert group.findall(f"{SVG}text")[-1].text == "Dock <7> & yard"
+
+def test_grid_is_built_once():
+    """Documents of different heights still share the one rendered grid."""
+    grid_background.cache_clear()
+    _document_head.cache_clear()
+    for days in (_days(), _days(600.0, 600.0, 0.0)):
+        b"".join(iter_svg_document(days, days.segments))
+
+    assert _document_head.cache_info().misses == 2
+    assert grid_background.cache_info().misses == 1
+
+@pytest.mark.django_db
+def test_generate_logbook_streams_svg():
+    response = APIClient().post("/api/logs/generate_logbook/?format=svg", PAYLOAD, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "image/svg+xml; charset=utf-8"
+    assert response.streaming
+    chunks = list(response.streaming_content)
+    root = ET.fromstring(b"".join(chunks))
+    # Head, one chunk per day, closing tag
+    assert len(chunks) == len(root.findall(f"{SVG}g")) + 2
+
+@pytest.mark.django_db
+def test_svg_errors_are_svg():
+    response = APIClient().post("/api/logs/generate_logbook/?format=svg", {"total_distance_miles": 10}, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Missing required fields" in ET.fromstring(response.content).find(f"{SVG}text").text
+
+def test_renderer_and_benchmark_throughput():
+    days = _days()
+    assert SVGRenderer().render(days) == b"".join(iter_svg_document(days, days.segments))
+
+    trips = benchmark_trips()[-1:]
+    report = run_benchmarks(targets=["render:svg"], repeat=2, trips=trips)
+    result = report["results"]["render:svg"][trips[0].name]
+    assert result["days"] > 10
+    assert result["days_per_sec"] > 0
+    assert report["summary"]["render:svg"]["days_per_sec"] > 0
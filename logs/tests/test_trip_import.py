@@ -0,0 +1,113 @@
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import connection
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from logs.models import LogbookTrip
+from logs.services import TripInputError
+from logs.trip_export import stream_trips_csv
+from logs.trip_import import import_trips
+
+pytestmark = pytest.mark.django_db
+
+CSV = b"""created_at,total_distance_miles,total_driving_time_mins,pickup_time_mins,engine,allow_restart
+2025-03-01T08:00:00Z,600,600,60,step,false
+2025-03-01T09:00:00,1200,1300,0,,TRUE
+2025-03-02T10:00:00Z,lots,600,60,step,false
+2025-03-02T11:00:00Z,600,600,,warp,maybe
+"""
+
+
+def test_csv_rows_are_validated_and_reported_by_line():
+    """Valid rows are written, invalid ones are listed with every failing column."""
+    report = import_trips(io.BytesIO(CSV), "csv", chunk_size=1)
+
+    assert (report.rows, report.imported, report.error_count) == (4, 2, 2)
+    assert report.errors[0] == {"line": 4, "errors": {"total_distance_miles": "invalid value 'lots'"}}
+    assert set(report.errors[1]["errors"]) == {"pickup_time_mins", "engine", "allow_restart"}
+
+    first, second = LogbookTrip.objects.order_by("created_at")
+    assert first.created_at == datetime(2025, 3, 1, 8, tzinfo=timezone.utc)
+    assert (second.engine, second.allow_restart, second.current_cycle_hour) == ("", True, 0.0)
+    # Naive timestamps are taken as UTC
+    assert second.created_at == datetime(2025, 3, 1, 9, tzinfo=timezone.utc)
+
+def test_ndjson_rows_and_bad_lines():
+    lines = [
+        json.dumps({"total_distance_miles": 600, "total_driving_time_mins": 600, "pickup_time_mins": 0, "days": 2}),
+        "",
+        "{not json",
+        json.dumps([1, 2]),
+        json.dumps({"total_distance_miles": 600, "total_driving_time_mins": 600, "pickup_time_mins": 0, "days": -1}),
+    ]
+    report = import_trips(io.BytesIO("\n".join(lines).encode()), "ndjson")
+
+    assert report.imported == 1
+    assert [error["line"] for error in report.errors] == [3, 4, 5]
+    assert report.errors[2]["errors"] == {"days": "must not be negative"}
+    assert LogbookTrip.objects.get().days == 2
+
+def test_error_list_is_capped_but_counted():
+    rows = b"total_distance_miles,total_driving_time_mins,pickup_time_mins\n" + b"x,1,1\n" * 5
+    report = import_trips(io.BytesIO(rows), "csv", max_errors=2)
+
+    assert report.error_count == 5
+    assert len(report.errors) == 2
+
+def test_unknown_columns_reject_the_whole_file():
+    with pytest.raises(TripInputError, match="Unknown columns: colour"):
+        import_trips(io.BytesIO(b"total_distance_miles,colour\n1,red\n"), "csv")
+    assert not LogbookTrip.objects.exists()
+
+def test_an_export_imports_back_unchanged():
+    """The export's columns are the import's, so a CSV export round-trips."""
+    import_trips(io.BytesIO(CSV), "csv")
+    exported = b"".join(stream_trips_csv(LogbookTrip.objects.all()))
+    before = list(LogbookTrip.objects.order_by("created_at", "id").values_list("created_at", "total_distance_miles", "engine", "allow_restart", "days"))
+
+    LogbookTrip.objects.all().delete()
+    report = import_trips(io.BytesIO(exported), "csv")
+
+    assert report.error_count == 0
+    assert list(LogbookTrip.objects.order_by("created_at", "id").values_list("created_at", "total_distance_miles", "engine", "allow_restart", "days")) == before
+
+def test_bulk_import_endpoint():
+    upload = SimpleUploadedFile("trips.csv", CSV, content_type="text/csv")
+    response = APIClient().post("/api/logs/bulk_import/", {"file": upload}, format="multipart")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["imported"] == 2
+    assert response.data["error_count"] == 2
+    assert response.data["method"] == ("copy" if connection.vendor == "postgresql" else "bulk_create")
+
+def test_bulk_import_endpoint_needs_a_known_format():
+    upload = SimpleUploadedFile("trips.txt", CSV)
+    response = APIClient().post("/api/logs/bulk_import/", {"file": upload}, format="multipart")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Unknown format" in response.data["error"]
+
+def test_import_trips_command(tmp_path):
+    path = tmp_path / "trips.csv"
+    path.write_bytes(CSV)
+    out, err = io.StringIO(), io.StringIO()
+
+    call_command("import_trips", str(path), stdout=out, stderr=err)
+
+    assert "Imported 2 of 4 rows" in out.getvalue()
+    assert err.getvalue().startswith("line 4: total_distance_miles invalid value")
+    with pytest.raises(CommandError, match="pass --format"):
+        call_command("import_trips", str(tmp_path / "trips.dat"))
+
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="COPY needs PostgreSQL")
+def test_postgres_imports_with_copy():
+    report = import_trips(io.BytesIO(CSV), "csv", chunk_size=1)
+
+    assert report.method == "copy"
+    assert LogbookTrip.objects.count() == 2
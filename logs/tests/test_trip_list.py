@@ -0,0 +1,102 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from logs.models import LogbookTrip
+from logs.pagination import decode_cursor, encode_cursor
+
+pytestmark = pytest.mark.django_db
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def trips():
+    # Pairs of trips share a timestamp, so paging must break ties on id
+    return LogbookTrip.objects.bulk_create([
+        LogbookTrip(
+            created_at=START + timedelta(minutes=i // 2),
+            total_distance_miles=100.0 + i,
+            total_driving_time_mins=120.0,
+            pickup_time_mins=60.0,
+        )
+        for i in range(7)
+    ])
+
+
+def test_cursor_round_trip():
+    """A cursor decodes to the key it was made from; garbage does not decode."""
+    assert decode_cursor(encode_cursor(START, 42)) == (START, 42)
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+def test_pages_cover_every_trip_once_in_keyset_order(trips):
+    """Following next links visits each trip once, even across tied timestamps."""
+    client = APIClient()
+    url, seen = "/api/logs/?page_size=3", []
+    while url:
+        response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) <= 3
+        seen.extend(row["id"] for row in response.data["results"])
+        url = response.data["next"]
+
+    assert seen == [trip.pk for trip in sorted(trips, key=lambda trip: (trip.created_at, trip.pk))]
+
+def test_invalid_cursor_is_not_found(trips):
+    response = APIClient().get("/api/logs/?cursor=bogus")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+def test_fields_projection_reaches_the_query(trips):
+    """Only the requested columns, plus the keyset, are selected and serialized."""
+    with CaptureQueriesContext(connection) as queries:
+        response = APIClient().get("/api/logs/?fields=total_distance_miles")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["results"][0] == {"total_distance_miles": 100.0}
+    sql = queries.captured_queries[-1]["sql"]
+    assert "total_distance_miles" in sql and "created_at" in sql
+    assert "pickup_time_mins" not in sql
+
+def test_unknown_fields_are_rejected(trips):
+    response = APIClient().get("/api/logs/?fields=id,password")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "password" in response.data["error"]
+
+def test_export_ndjson_streams_every_trip(trips, settings):
+    """Export ignores paging and streams in chunks of EXPORT_CHUNK_SIZE rows."""
+    settings.LOGBOOK_TRIP_LIST = {**settings.LOGBOOK_TRIP_LIST, "PAGE_SIZE": 2, "EXPORT_CHUNK_SIZE": 3}
+    response = APIClient().get("/api/logs/export/?fields=id,created_at")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/x-ndjson"
+    chunks = list(response.streaming_content)
+    rows = [json.loads(line) for line in b"".join(chunks).splitlines()]
+    assert len(chunks) == 3
+    assert [row["id"] for row in rows] == sorted(trip.pk for trip in trips)
+    assert rows[0]["created_at"] == "2026-01-01T00:00:00Z"
+
+def test_export_csv(trips):
+    response = APIClient().get("/api/logs/export/?format=csv&fields=id,total_distance_miles")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "text/csv; charset=utf-8"
+    rows = list(csv.reader(io.StringIO(b"".join(response.streaming_content).decode())))
+    assert rows[0] == ["id", "total_distance_miles"]
+    assert len(rows) == 1 + len(trips)
+    assert rows[1] == [str(trips[0].pk), "100.0"]
+
+def test_export_rejects_unknown_fields_in_the_requested_format(trips):
+    response = APIClient().get("/api/logs/export/?format=csv&fields=nope")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.content.decode().startswith("error\r\n")
@@ -147,4 +147,53 @@ def test_input_zero_values_no_crash(api_client, api_url):
     }
     response = api_client.post(api_url, data=payload, format='json')
     
-    assert response.status_code == status.HTTP_200_OK
\ No newline at end of file
+    assert response.status_code == status.HTTP_200_OK
+
+@pytest.mark.parametrize("engine", ["step", "event"])
+def test_generate_logbook_engine_selection(api_client, api_url, engine):
+    """Both simulation engines are selectable and return the same logbook."""
+    payload = {
+        "total_distance_miles": 1500,
+        "total_driving_time": 1500,
+        "current_cycle_hour": 10,
+        "pickup_time": 30,
+    }
+    baseline = api_client.post(api_url, data=payload, format='json')
+    response = api_client.post(api_url, data={**payload, "engine": engine}, format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == baseline.data
+
+def test_generate_logbook_unknown_engine(api_client, api_url):
+    """Verify 400 when an unknown engine is requested."""
+    payload = {
+        "total_distance_miles": 500,
+        "total_driving_time": 480,
+        "current_cycle_hour": 10,
+        "pickup_time": 30,
+        "engine": "warp",
+    }
+    response = api_client.post(api_url, data=payload, format='json')
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Unknown engine" in response.data["error"]
+
+
+def test_generate_logbook_allow_restart(api_client, api_url):
+    """Over-cycle trips get a plan with a 34-hour restart when the client allows it."""
+    payload = {
+        "total_distance_miles": 2000,
+        "total_driving_time": 2000,
+        "current_cycle_hour": 65,
+        "pickup_time": 60,
+        "allow_restart": True,
+    }
+    response = api_client.post(api_url, data=payload, format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+    actions = {entry.get("action") for day in response.data for entry in day["logbook"]}
+    assert "34-hour restart" in actions
+
+    payload["allow_restart"] = "yes"
+    response = api_client.post(api_url, data=payload, format='json')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,82 @@
+"""
+Field projection and streaming export of saved trips.
+
+Exports read ``values_list`` rows through ``QuerySet.iterator``, i.e. a
+server-side cursor on PostgreSQL, so memory stays flat however many rows
+there are and no model instance is ever built.
+"""
+
+import csv
+import json
+from datetime import datetime
+from typing import Iterable, Iterator
+
+from .models import LogbookTrip
+from .pagination import TRIP_ORDERING
+from .services import TripInputError
+
+TRIP_FIELDS = tuple(field.name for field in LogbookTrip._meta.concrete_fields)
+
+
+def parse_trip_fields(raw: str | None) -> list[str] | None:
+    """Field names of a ``?fields=a,b`` projection in request order, or None for all."""
+    if not raw:
+        return None
+    names = list(dict.fromkeys(name.strip() for name in raw.split(",") if name.strip()))
+    unknown = [name for name in names if name not in TRIP_FIELDS]
+    if unknown:
+        raise TripInputError(f"Unknown fields: {', '.join(unknown)}. Choose from {', '.join(TRIP_FIELDS)}.")
+    if not names:
+        raise TripInputError("'fields' must name at least one field.")
+    return names
+
+
+def format_datetime(value: datetime) -> str:
+    # Same text as the DRF DateTimeField of the list endpoint
+    text = value.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+class _Echo:
+    """File-like object whose write returns the line csv.writer formatted."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _export_rows(queryset, fields: list[str], chunk_size: int) -> Iterator[list]:
+    rows = queryset.order_by(*TRIP_ORDERING).values_list(*fields).iterator(chunk_size=chunk_size)
+    datetime_columns = [i for i, name in enumerate(fields) if name == "created_at"]
+    for row in rows:
+        row = list(row)
+        for i in datetime_columns:
+            row[i] = format_datetime(row[i])
+        yield row
+
+
+def _in_chunks(lines: Iterable[str], chunk_size: int) -> Iterator[bytes]:
+    # One write per chunk of rows rather than one per row
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= chunk_size:
+            yield "".join(buffer).encode()
+            buffer = []
+    if buffer:
+        yield "".join(buffer).encode()
+
+
+def stream_trips_csv(queryset, fields: list[str] | None = None, chunk_size: int = 2000) -> Iterator[bytes]:
+    """CSV with a header row, in ``(created_at, id)`` order."""
+    fields = fields or list(TRIP_FIELDS)
+    writer = csv.writer(_Echo())
+    yield writer.writerow(fields).encode()
+    yield from _in_chunks(map(writer.writerow, _export_rows(queryset, fields, chunk_size)), chunk_size)
+
+
+def stream_trips_ndjson(queryset, fields: list[str] | None = None, chunk_size: int = 2000) -> Iterator[bytes]:
+    """One JSON object per line, in ``(created_at, id)`` order."""
+    fields = fields or list(TRIP_FIELDS)
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    lines = (encoder.encode(dict(zip(fields, row))) + "\n" for row in _export_rows(queryset, fields, chunk_size))
+    yield from _in_chunks(lines, chunk_size)
@@ -0,0 +1,291 @@
+"""
+Bulk import of historical trips from CSV or NDJSON.
+
+The upload is parsed and validated one line at a time, and valid rows are
+written in chunks of ``chunk_size``. Each chunk gets its own
+transaction with PostgreSQL ``COPY ... FROM STDIN`` through psycopg, or
+with ``bulk_create`` on other backends. Invalid rows are skipped and
+reported by line number. The columns are the ones the export writes, so
+an export can be imported again as is.
+"""
+
+import codecs
+import csv
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone as dt_timezone
+from typing import IO, Iterable, Iterator
+
+from django.db import connections, models, router, transaction
+from django.utils import timezone
+
+from .logbook_generator import ENGINES
+from .models import LogbookTrip
+from .route_generator import ENGINE_ROUTE
+from .split_sleeper import ENGINE_SPLIT
+from .services import TripInputError
+
+FORMATS = ("csv", "ndjson")
+
+# Every column but the primary key, which the database assigns
+IMPORT_FIELDS = tuple(f for f in LogbookTrip._meta.concrete_fields if not f.primary_key)
+IMPORT_COLUMNS = tuple(f.name for f in IMPORT_FIELDS)
+
+# Default of a column that has none
+_REQUIRED = object()
+
+_TRUE = {"true", "1", "yes", "t", "y"}
+_FALSE = {"false", "0", "no", "f", "n"}
+
+
+class RowError(ValueError):
+    pass
+
+
+def _to_float(value):
+    number = float(value)
+    if not math.isfinite(number):
+        raise RowError("must be a finite number")
+    return number
+
+
+def _to_bool(value):
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise RowError("must be true or false")
+
+
+def _to_datetime(value):
+    moment = datetime.fromisoformat(value) if isinstance(value, str) else value
+    if not isinstance(moment, datetime):
+        raise RowError("must be an ISO 8601 date and time")
+    return moment.replace(tzinfo=dt_timezone.utc) if timezone.is_naive(moment) else moment
+
+
+def _to_uint(value):
+    if isinstance(value, float) and not value.is_integer():
+        raise RowError("must be a whole number")
+    number = int(value)
+    if number < 0:
+        raise RowError("must not be negative")
+    return number
+
+
+_CONVERTERS = {
+    models.FloatField: _to_float,
+    models.BooleanField: _to_bool,
+    models.DateTimeField: _to_datetime,
+    models.PositiveIntegerField: _to_uint,
+    models.CharField: str,
+}
+
+# Accepted values beyond the model's own choices
+_ALLOWED = {"engine": {"", *ENGINES, ENGINE_ROUTE, ENGINE_SPLIT}}
+
+
+class _Column:
+    """Converts and checks the raw value of one import column."""
+
+    def __init__(self, model_field, default):
+        self.name = model_field.name
+        self.convert = _CONVERTERS[type(model_field)]
+        self.null = model_field.null
+        self.default = default
+        self.max_length = model_field.max_length
+        choices = {value for value, _ in model_field.choices} if model_field.choices else None
+        self.allowed = _ALLOWED.get(self.name, choices)
+        if self.allowed is not None and model_field.blank:
+            self.allowed = {"", *self.allowed}
+
+    def clean(self, raw):
+        if raw is None or raw == "":
+            if self.null:
+                return None
+            if self.default is _REQUIRED:
+                raise RowError("is required")
+            return self.default
+        try:
+            value = self.convert(raw)
+        except RowError:
+            raise
+        except (TypeError, ValueError):
+            raise RowError(f"invalid value {str(raw)[:40]!r}")
+        if self.max_length is not None and len(value) > self.max_length:
+            raise RowError(f"must be at most {self.max_length} characters")
+        if self.allowed is not None and value not in self.allowed:
+            raise RowError(f"must be one of: {', '.join(sorted(self.allowed))}")
+        return value
+
+
+def _columns(now: datetime) -> list[_Column]:
+    columns = []
+    for model_field in IMPORT_FIELDS:
+        if not model_field.has_default():
+            default = _REQUIRED
+        elif model_field.default is timezone.now:
+            # One timestamp for the whole import, the same for every row
+            default = now
+        else:
+            default = model_field.get_default()
+        columns.append(_Column(model_field, default))
+    return columns
+
+
+@dataclass
+class ImportReport:
+    rows: int = 0
+    imported: int = 0
+    errors: list[dict] = field(default_factory=list)
+    error_count: int = 0
+    method: str = ""
+    wall_time_ms: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "imported": self.imported,
+            "error_count": self.error_count,
+            # Only the first max_errors are listed
+            "errors": self.errors,
+            "method": self.method,
+            "wall_time_ms": self.wall_time_ms,
+        }
+
+
+def read_csv(stream: IO[bytes]) -> Iterator[tuple[int, dict | None]]:
+    """(line number, row) per CSV record after the header row."""
+    reader = csv.DictReader(codecs.getreader("utf-8-sig")(stream))
+    try:
+        header = reader.fieldnames
+    except (csv.Error, UnicodeDecodeError) as e:
+        raise TripInputError(f"Unreadable CSV header: {e}")
+    if header is None:
+        return
+    # An exported id column is ignored; the database assigns new ones
+    unknown = [name for name in header if name not in IMPORT_COLUMNS and name != "id"]
+    if unknown:
+        raise TripInputError(f"Unknown columns: {', '.join(unknown)}. Expected some of: {', '.join(IMPORT_COLUMNS)}.")
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except (csv.Error, UnicodeDecodeError):
+            yield reader.line_num, None
+            continue
+        yield reader.line_num, row
+
+
+def read_ndjson(stream: IO[bytes]) -> Iterator[tuple[int, dict | None]]:
+    """(line number, object) per non-blank line; None for a line that is not a JSON object."""
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except (UnicodeDecodeError, ValueError):
+            row = None
+        yield line_number, row if isinstance(row, dict) else None
+
+
+READERS = {"csv": read_csv, "ndjson": read_ndjson}
+
+_SUFFIXES = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+
+def guess_format(name: str) -> str | None:
+    """Import format implied by a file name's extension."""
+    for suffix, input_format in _SUFFIXES.items():
+        if name.lower().endswith(suffix):
+            return input_format
+    return None
+
+
+def _copy_rows(connection, rows: list[tuple]):
+    quote = connection.ops.quote_name
+    table = quote(LogbookTrip._meta.db_table)
+    columns = ", ".join(quote(f.column) for f in IMPORT_FIELDS)
+    with connection.cursor() as cursor, cursor.copy(f"COPY {table} ({columns}) FROM STDIN") as copy:
+        for row in rows:
+            copy.write_row(row)
+
+
+def _supports_copy(connection) -> bool:
+    if connection.vendor != "postgresql":
+        return False
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+    # psycopg2 cursors have no copy()
+    return is_psycopg3
+
+
+def _bulk_create_rows(connection, rows: list[tuple]):
+    LogbookTrip.objects.using(connection.alias).bulk_create(
+        [LogbookTrip(**dict(zip(IMPORT_COLUMNS, row))) for row in rows],
+        batch_size=1000,
+    )
+
+
+def import_trips(
+    stream: IO[bytes],
+    input_format: str,
+    *,
+    chunk_size: int = 10000,
+    max_errors: int = 1000,
+    using: str | None = None,
+) -> ImportReport:
+    """
+    Validate and write every trip in ``stream``. Rows with errors are
+    skipped; chunks written before a database error stay written.
+    """
+    if input_format not in READERS:
+        raise TripInputError(f"Unknown format '{input_format}'. Expected one of: {', '.join(FORMATS)}")
+    connection = connections[using or router.db_for_write(LogbookTrip)]
+    use_copy = _supports_copy(connection)
+    write = _copy_rows if use_copy else _bulk_create_rows
+    report = ImportReport(method="copy" if use_copy else "bulk_create")
+
+    started = time.perf_counter()
+    columns = _columns(timezone.now())
+    chunk = []
+    for line_number, raw in READERS[input_format](stream):
+        report.rows += 1
+        row, errors = _clean_row(columns, raw)
+        if errors:
+            report.error_count += 1
+            if len(report.errors) < max_errors:
+                report.errors.append({"line": line_number, "errors": errors})
+            continue
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            _write_chunk(connection, write, chunk, report)
+            chunk = []
+    if chunk:
+        _write_chunk(connection, write, chunk, report)
+    report.wall_time_ms = round((time.perf_counter() - started) * 1000, 3)
+    return report
+
+
+def _clean_row(columns: Iterable[_Column], raw: dict | None) -> tuple[tuple | None, dict]:
+    if raw is None:
+        return None, {"row": "not a valid record"}
+    values, errors = [], {}
+    for column in columns:
+        try:
+            values.append(column.clean(raw.get(column.name)))
+        except RowError as e:
+            errors[column.name] = str(e)
+    return tuple(values), errors
+
+
+def _write_chunk(connection, write, rows: list[tuple], report: ImportReport):
+    with transaction.atomic(using=connection.alias):
+        write(connection, rows)
+    report.imported += len(rows)
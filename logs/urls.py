@@ -1,11 +1,15 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
-from .views import LogEntryViewSet
+from .async_views import generate_logbook_async
+from .views import DriverViewSet, LogEntryViewSet
 
 
 router = DefaultRouter()
 router.register(r'logs', LogEntryViewSet, basename='logbook-trip')
+router.register(r'drivers', DriverViewSet, basename='driver')
 urlpatterns = [
+    # Ahead of the router, whose detail route would otherwise claim this path
+    path('logs/generate_logbook_async/', generate_logbook_async, name='generate-logbook-async'),
     path('', include(router.urls))
 ]
\ No newline at end of file
@@ -1,61 +1,462 @@
+import math
+import time
+
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import viewsets, permissions, status
+from rest_framework.settings import api_settings
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
 
-from .models import LogbookTrip
-from .serializers import LogSerializers
+from .models import Driver, LogbookTrip
+from .serializers import DriverSerializer, LogSerializers
 from .config import HOSConfig
-from .logbook_generator import LogbookGenerator
-from .feasibility import validate_trip_feasibility
+from .metrics import REGISTRY, start_request_timer
+from .renderers import CSVRenderer, LogbookJSONRenderer, NDJSONRenderer, SVGRenderer, render_ndjson_line
+from .json_encoding import LogbookDays, render_json
+from .responses import PreRenderedResponse
+from .result_cache import get_result_cache, trip_cache_key
+from .services import TripInputError, build_generator, check_trip_feasibility, parse_trip_request
 
 
 class LogEntryViewSet(viewsets.ModelViewSet):
     queryset = LogbookTrip.objects.all()
     serializer_class = LogSerializers
     permission_classes = [permissions.AllowAny]
+    # ?fields= projection of the list, set by list()
+    projected_fields = None
 
-    @action(detail=False, methods=["post"])
+    @property
+    def pagination_class(self):
+        # Only the trip list pages, so compute-only processes never load it
+        from .pagination import TripKeysetPagination
+
+        return TripKeysetPagination
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.projected_fields is not None:
+            from .pagination import TRIP_ORDERING
+
+            # The paginator reads the keyset columns of the last row
+            queryset = queryset.only(*self.projected_fields, *TRIP_ORDERING)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        if self.projected_fields is not None:
+            kwargs.setdefault("fields", self.projected_fields)
+        return super().get_serializer(*args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        """Trips in (created_at, id) order, a keyset page at a time. ``?fields=`` selects columns."""
+        from .trip_export import parse_trip_fields
+
+        try:
+            self.projected_fields = parse_trip_fields(request.query_params.get("fields"))
+        except TripInputError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return super().list(request, *args, **kwargs)
+
+    @action(detail=False, methods=["get"], renderer_classes=[NDJSONRenderer, CSVRenderer])
+    def export(self, request):
+        """
+        Every trip as NDJSON or CSV (``?format=csv``), streamed in
+        (created_at, id) order in constant memory. ``?fields=`` selects columns.
+        """
+        from .trip_export import TRIP_FIELDS, parse_trip_fields, stream_trips_csv, stream_trips_ndjson
+
+        try:
+            fields = parse_trip_fields(request.query_params.get("fields")) or list(TRIP_FIELDS)
+        except TripInputError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        renderer = request.accepted_renderer
+        stream = stream_trips_csv if renderer.format == CSVRenderer.format else stream_trips_ndjson
+        chunk_size = settings.LOGBOOK_TRIP_LIST["EXPORT_CHUNK_SIZE"]
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type += f"; charset={renderer.charset}"
+        response = StreamingHttpResponse(stream(self.get_queryset(), fields, chunk_size), content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="trips.{renderer.format}"'
+        return response
+
+    @action(
+        detail=False,
+        methods=["post"],
+        renderer_classes=[LogbookJSONRenderer, *api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer, SVGRenderer],
+    )
     def generate_logbook(self, request):
-        data = request.data
-        required_fields = ["total_distance_miles", "total_driving_time", "current_cycle_hour", "pickup_time"]
-        missing = [field for field in required_fields if field not in data]
-    
-        if missing:
-            return Response(
-                {"error": f"Missing required fields: {', '.join(missing)}"}, 
-                status=status.HTTP_400_BAD_REQUEST
-        )
+        timer = start_request_timer()
+        return timer.finish(self._generate_logbook(request, timer))
+
+    def _generate_logbook(self, request, timer):
+        from .audit import record_trip
+        from .cycle_ledger import LedgerChangedError, commit_key, commit_logbook, with_driver_cycle
+
+        trip = None
         try:
             # 1. Extract and normalize inputs
-            total_dist = float(data.get("total_distance_miles"))
-            total_time_mins = float(data.get("total_driving_time"))
-            current_cycle_hour = float(data.get("current_cycle_hour"))
-            pickup_time = float(data.get("pickup_time"))
-            
+            with timer.stage("parse"):
+                data, driver, start_date = with_driver_cycle(request.data)
+                trip = parse_trip_request(data)
+                commit = data.get("commit", False)
+                if not isinstance(commit, bool):
+                    raise TripInputError("commit must be true or false.")
+                commit = commit and driver is not None
+
             config = HOSConfig()
-            # 2. FEASIBILITY CHECK
-            is_possible, error_msg = validate_trip_feasibility(
-                total_dist=total_dist,
-                total_time_mins=total_time_mins,
-                config=config,
-                current_cycle_hour=current_cycle_hour
+            if request.accepted_renderer.format == NDJSONRenderer.format:
+                if commit:
+                    raise TripInputError("Streamed logbooks cannot be committed to a driver's ledger.")
+                response = self._stream_logbook(trip, config)
+                record_trip(trip, LogbookTrip.OUTCOME_GENERATED)
+                return response
+
+            if request.accepted_renderer.format == SVGRenderer.format:
+                response = self._svg_logbook(trip, config, timer)
+            else:
+                response = self._logbook_response(trip, config, timer)
+            if commit:
+                with timer.stage("ledger"):
+                    commit_logbook(
+                        driver, response.data, start_date, commit_key(trip, start_date), trip.current_cycle_hour
+                    )
+            return response
+
+        except LedgerChangedError as e:
+            # The logbook itself was generated; only the commit is refused
+            return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
+        except TripInputError as e:
+            if trip is not None:
+                record_trip(trip, LogbookTrip.OUTCOME_REJECTED, error=str(e))
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    def _logbook_response(self, trip, config, timer):
+        from .audit import record_trip
+
+        cache = get_result_cache()
+        cache_key = trip_cache_key(trip, config) if cache else None
+        if cache:
+            with timer.stage("cache"):
+                content = cache.get(cache_key)
+            if content is not None:
+                record_trip(trip, LogbookTrip.OUTCOME_GENERATED)
+                return PreRenderedResponse(content)
+
+        # 2. FEASIBILITY CHECK
+        with timer.stage("feasibility"):
+            check_trip_feasibility(trip, config)
+
+        # 3. LOGBOOK GENERATION
+        with timer.stage("generate"):
+            generator = build_generator(trip, config)
+            logbooks = generator.generate(pickup_time_mins=trip.pickup_time)
+        timer.record_logbook(logbooks)
+
+        with timer.stage("render"):
+            renderer = self.request.accepted_renderer
+            if isinstance(renderer, LogbookJSONRenderer):
+                content = renderer.render(LogbookDays(logbooks, generator.segments))
+            else:
+                content = render_json(logbooks)
+        if cache:
+            cache.set(cache_key, content)
+        record_trip(trip, LogbookTrip.OUTCOME_GENERATED, days=len(logbooks))
+        return PreRenderedResponse(content, data=logbooks)
+
+    def _svg_logbook(self, trip, config, timer):
+        """
+        Draw the logbook as SVG grids, streamed a day at a time. The days
+        are simulated first, since the document head carries its height.
+        """
+        from .audit import record_trip
+        from .svg_logbook import iter_svg_document
+
+        with timer.stage("feasibility"):
+            check_trip_feasibility(trip, config)
+        with timer.stage("generate"):
+            generator = build_generator(trip, config)
+            logbooks = generator.generate(pickup_time_mins=trip.pickup_time)
+        timer.record_logbook(logbooks)
+        record_trip(trip, LogbookTrip.OUTCOME_GENERATED, days=len(logbooks))
+        response = StreamingHttpResponse(
+            iter_svg_document(logbooks, generator.segments),
+            content_type=f"{SVGRenderer.media_type}; charset={SVGRenderer.charset}",
+        )
+        # Read by commit_logbook, like PreRenderedResponse.data
+        response.data = logbooks
+        return response
+
+    def _stream_logbook(self, trip, config):
+        """Stream one sealed day per NDJSON line while later days are still being simulated."""
+        check_trip_feasibility(trip, config)
+        generator = build_generator(trip, config)
+        days = generator.iter_days(pickup_time_mins=trip.pickup_time)
+        return StreamingHttpResponse(
+            (render_ndjson_line(day) for day in days),
+            content_type=NDJSONRenderer.media_type
+        )
+
+    @action(detail=False, methods=["post"], parser_classes=[MultiPartParser])
+    def bulk_import(self, request):
+        """
+        Import trips from a CSV or NDJSON upload in the multipart ``file``
+        field. The format comes from the ``format`` field or the file name.
+        Rows that fail validation are skipped and reported by line.
+        """
+        from .trip_import import guess_format, import_trips
+
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response(
+                {"error": "Upload the trips as a multipart 'file' field."},
+                status=status.HTTP_400_BAD_REQUEST
             )
+        options = settings.LOGBOOK_TRIP_IMPORT
+        input_format = request.data.get("format") or guess_format(upload.name)
+        try:
+            report = import_trips(
+                upload,
+                input_format,
+                chunk_size=options["CHUNK_SIZE"],
+                max_errors=options["MAX_ERRORS"],
+            )
+        except TripInputError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report.as_dict())
+
+    @action(detail=True, methods=["get"])
+    def logbook(self, request, pk=None):
+        """
+        Logbook of a saved trip, generated on first read and stored. Clients
+        that send the ETag back in If-None-Match get a bodiless 304.
+        """
+        from .stored_logbooks import load_trip_logbook, logbook_etag
 
-            if not is_possible:
-                return Response({"error": error_msg}, status=400)
+        trip = self.get_object()
+        config = HOSConfig()
+        etag = logbook_etag(trip, config)
+        headers = {"ETag": quote_etag(etag)}
 
-            # 3. LOGBOOK GENERATION
-            generator = LogbookGenerator(
-                total_dist=total_dist,
-                total_time_mins=total_time_mins,
-                config=config
+        client_etags = parse_etags(request.headers.get("If-None-Match", ""))
+        if "*" in client_etags or any(tag.removeprefix("W/") == headers["ETag"] for tag in client_etags):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        try:
+            content = load_trip_logbook(trip, config, etag=etag)
+        except TripInputError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return PreRenderedResponse(content, headers=headers)
+
+    @action(detail=False, methods=["get"])
+    def cache_stats(self, request):
+        """Hit, miss and eviction counters of this worker's result cache."""
+        cache = get_result_cache()
+        if cache is None:
+            return Response({"enabled": False})
+        return Response({"enabled": True, **cache.stats()})
+
+    @action(detail=False, methods=["post"])
+    def generate_logbook_batch(self, request):
+        """Plan many trips in one call; each trip succeeds or fails on its own."""
+        # Imported here so processes serving only single trips never load multiprocessing
+        from .batch import run_batch
+
+        batch_settings = settings.LOGBOOK_BATCH
+        trips = request.data.get("trips") if isinstance(request.data, dict) else None
+
+        if not isinstance(trips, list) or not trips:
+            return Response(
+                {"error": "Body must contain a non-empty 'trips' list."},
+                status=status.HTTP_400_BAD_REQUEST
             )
-            logbooks = generator.generate(pickup_time_mins=pickup_time)
-            
-            return Response(logbooks)
+        if len(trips) > batch_settings["MAX_TRIPS"]:
+            return Response(
+                {"error": f"Too many trips: {len(trips)}. At most {batch_settings['MAX_TRIPS']} per batch."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        started = time.perf_counter()
+        results = run_batch(
+            trips,
+            max_workers=batch_settings["MAX_WORKERS"],
+            serial_threshold=batch_settings["SERIAL_THRESHOLD"]
+        )
+        wall_time_ms = round((time.perf_counter() - started) * 1000, 3)
+        self._audit_batch(trips, results)
+
+        return Response({
+            "results": results,
+            "trip_count": len(results),
+            "error_count": sum(1 for result in results if result["status"] == "error"),
+            "wall_time_ms": wall_time_ms,
+        })
+
+    @staticmethod
+    def _audit_batch(trips, results):
+        """Audit every batch trip that parsed; the planning itself ran in the pool."""
+        from .audit import get_audit_recorder, record_trip
 
-        except (ValueError, TypeError) as e:
+        if get_audit_recorder() is None:
+            return
+        for data, result in zip(trips, results):
+            try:
+                trip = parse_trip_request(data)
+            except TripInputError:
+                continue
+            if result["status"] == "ok":
+                record_trip(trip, LogbookTrip.OUTCOME_GENERATED, days=len(result["logbooks"]))
+            else:
+                record_trip(trip, LogbookTrip.OUTCOME_REJECTED, error=result["error"])
+
+    @action(detail=False, methods=["post"])
+    def dispatch_trips(self, request):
+        """Assign a set of loads to a set of drivers by remaining hours and availability."""
+        from .dispatch import parse_dispatch_request, plan_dispatch
+
+        limits = settings.LOGBOOK_DISPATCH
+        try:
+            drivers, loads = parse_dispatch_request(request.data)
+        except TripInputError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if len(drivers) > limits["MAX_DRIVERS"] or len(loads) > limits["MAX_TRIPS"]:
             return Response(
-                {"error": f"Invalid input format: {str(e)}. Numeric values required."}, 
-                status=400
-            )
\ No newline at end of file
+                {"error": f"At most {limits['MAX_DRIVERS']} drivers and {limits['MAX_TRIPS']} trips per request."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        started = time.perf_counter()
+        plan = plan_dispatch(drivers, loads, HOSConfig())
+        return Response({
+            **plan.as_dict(),
+            "wall_time_ms": round((time.perf_counter() - started) * 1000, 3),
+        })
+
+    @action(detail=False, methods=["post"])
+    def risk_analysis(self, request):
+        """
+        Probability that the trip's plan, followed as written, breaks an
+        HOS limit once speed, pickup dwell and refuel time vary, and
+        percentiles of its arrival. Breaks and resets stay where the plan
+        put them. Optional ``runs``, ``seed`` and ``distributions`` beside
+        the trip.
+        """
+        from .risk import RiskModel, analyze_trip_risk
+
+        options = settings.LOGBOOK_RISK
+        data = request.data if isinstance(request.data, dict) else {}
+        try:
+            trip = parse_trip_request(request.data)
+            runs = data.get("runs", options["DEFAULT_RUNS"])
+            seed = data.get("seed", options["SEED"])
+            for name, value in (("runs", runs), ("seed", seed)):
+                if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                    raise TripInputError(f"'{name}' must be a non-negative integer.")
+            if not 1 <= runs <= options["MAX_RUNS"]:
+                raise TripInputError(f"'runs' must be between 1 and {options['MAX_RUNS']}.")
+            model = RiskModel.from_specs(options["DISTRIBUTIONS"], data.get("distributions"))
+            config = HOSConfig()
+            check_trip_feasibility(trip, config)
+            result = analyze_trip_risk(trip, config, model, runs=runs, seed=seed, batch_size=options["BATCH_SIZE"])
+        except TripInputError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(result.as_dict())
+
+    @action(detail=False, methods=["post"])
+    def departure_search(self, request):
+        """
+        Best hour to go on duty for a trip, with a ranked table of the
+        other start hours. Optional ``step_minutes``, ``pickup_times``,
+        ``rank_by`` and ``alternatives`` beside the trip.
+        """
+        from .batch import get_process_pool
+        from .departure import best_departure_logbooks, parse_pickup_times, search_departures, start_hours
+
+        options = settings.LOGBOOK_DEPARTURE
+        data = request.data if isinstance(request.data, dict) else {}
+        try:
+            trip = parse_trip_request(request.data)
+            step_mins = data.get("step_minutes", options["STEP_MINUTES"])
+            alternatives = data.get("alternatives", options["ALTERNATIVES"])
+            for name, value in (("step_minutes", step_mins), ("alternatives", alternatives)):
+                if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                    raise TripInputError(f"'{name}' must be a non-negative integer.")
+            pickup_times = parse_pickup_times(trip, data.get("pickup_times"), options["MAX_PICKUP_TIMES"])
+            config = HOSConfig()
+            hours = start_hours(step_mins, config)
+            check_trip_feasibility(trip, config)
+
+            candidates = len(hours) * len(pickup_times or [trip.pickup_time])
+            pool = None
+            if trip.allow_restart and candidates >= options["PARALLEL_THRESHOLD"]:
+                pool = get_process_pool(settings.LOGBOOK_BATCH["MAX_WORKERS"])
+            search = search_departures(trip, config, hours, pickup_times, data.get("rank_by", "days"), pool=pool)
+        except TripInputError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            **search.as_dict(alternatives),
+            "logbooks": best_departure_logbooks(trip, config, search.best),
+        })
+
+    @action(detail=False, methods=["get"])
+    def max_trip(self, request):
+        """
+        Longest legal trip for ``?current_cycle_hour=`` at ``?mph=``, plus
+        the whole boundary over cycle hours as a breakpoint table.
+        """
+        from .inverse_feasibility import feasibility_breakpoints, max_trip
+
+        params = {}
+        for name in ("current_cycle_hour", "mph"):
+            value = request.query_params.get(name)
+            try:
+                params[name] = float(value)
+            except (TypeError, ValueError):
+                params[name] = math.nan
+            if not math.isfinite(params[name]):
+                return Response(
+                    {"error": f"Query parameter '{name}' must be a finite number."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        if params["mph"] < 0:
+            return Response({"error": "mph must not be negative."}, status=status.HTTP_400_BAD_REQUEST)
+
+        config = HOSConfig()
+        return Response({
+            **max_trip(params["current_cycle_hour"], params["mph"], config).as_dict(),
+            "breakpoints": feasibility_breakpoints(params["mph"], config),
+        })
+
+
+class DriverViewSet(viewsets.ModelViewSet):
+    queryset = Driver.objects.all()
+    serializer_class = DriverSerializer
+    permission_classes = [permissions.AllowAny]
+
+    @action(detail=True, methods=["get"])
+    def cycle(self, request, pk=None):
+        """Rolling 8-day on-duty total on ``?date=`` (default today) and what is left of the cycle."""
+        from .cycle_ledger import parse_ledger_date
+
+        driver = self.get_object()
+        try:
+            on_date = parse_ledger_date(request.query_params.get("date"), "date")
+        except TripInputError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        cycle_hours = driver.cycle_hours_on(on_date)
+        return Response({
+            "driver_id": driver.pk,
+            "date": on_date.isoformat(),
+            "cycle_hours": cycle_hours,
+            "remaining_hours": round(max(HOSConfig().MAX_WEEKLY_CYCLE - cycle_hours, 0.0), 2),
+        })
+
+
+def metrics(request):
+    """In-process request metrics in the Prometheus text format."""
+    return HttpResponse(REGISTRY.render(), content_type="text/plain; version=0.0.4; charset=utf-8")